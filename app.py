@@ -1,4 +1,6 @@
 import streamlit as st
+import instrument
+import startup
 
 # ── Page config ──────────────────────────────────────────────────────────────
 st.set_page_config(
@@ -8,8 +10,11 @@ st.set_page_config(
     initial_sidebar_state="expanded",
 )
 
+# Opt-in per-rerun profiling: ?profile=1 or QT_PROFILE=1
+instrument.begin()
+
 # ── Custom CSS ────────────────────────────────────────────────────────────────
-st.markdown("""
+CSS = """
 <style>
 @import url('https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700&family=JetBrains+Mono:wght@400;500&display=swap');
 
@@ -151,7 +156,9 @@ code { background: #f1f5f9; color: #1e40af; border-radius: 4px; padding: 1px 5px
         window.parent.scrollTo({top: 0, behavior: 'instant'});
     }, 100);
 </script>
-""", unsafe_allow_html=True)
+"""
+with instrument.section("CSS injection"):
+    st.markdown(CSS, unsafe_allow_html=True)
 
 # ── Topic registry ────────────────────────────────────────────────────────────
 TOPICS = [
@@ -187,6 +194,7 @@ TOPICS = [
     # ── Inference ──
     ("🎯", "Point Estimation & Confidence Intervals", "estimation_ci"),
     ("⚖️", "Hypothesis Testing",               "hypothesis_testing"),
+    ("⚡", "Power Analysis & Sample Size",     "power_analysis"),
     ("📊", "P-Values — Complete Guide",        "p_values"),
     ("📊", "Student's t-Distribution",         "t_distribution"),
     ("📋", "Z-Score & t-Score Tables",         "z_t_tables"),
@@ -206,7 +214,7 @@ if "_pending_nav" not in st.session_state:
 
 nav_index = st.session_state._pending_nav
 
-with st.sidebar:
+with instrument.section("sidebar"), st.sidebar:
     st.markdown("## 📊 Quant Techniques")
 
     # Search bar
@@ -275,7 +283,7 @@ if selected_key == "home":
     st.markdown("---")
     col1, col2, col3 = st.columns(3)
     with col1:
-        st.metric("📖 Topics Covered", "32")
+        st.metric("📖 Topics Covered", "33")
     with col2:
         st.metric("🧮 LaTeX Formulas", "200+")
     with col3:
@@ -283,9 +291,10 @@ if selected_key == "home":
 
 else:
     try:
-        import importlib
-        mod = importlib.import_module(f"topics.{selected_key}")
-        mod.render()
+        with instrument.section("import topic"):
+            mod = startup.load_topic(selected_key)
+        with instrument.section("render"):
+            mod.render()
     except ModuleNotFoundError:
         st.error(f"Topic module `topics/{selected_key}.py` not found.")
     except Exception as e:
@@ -293,3 +302,24 @@ else:
         import traceback
         st.code(traceback.format_exc())
 
+# ── Rerun profile (opt-in) ───────────────────────────────────────────────────
+# Drawn before prewarm starts so its imports do not race the prewarm thread
+profile = instrument.finish(selected_key)
+if profile is not None:
+    instrument.render_overlay(profile)
+
+# ── Startup prewarm & diagnostics ────────────────────────────────────────────
+# The page above is already on screen; load the remaining topics in the background
+startup.record_cold_start()
+startup.prewarm(key for _, _, key in TOPICS if key != "home")
+
+if "diagnostics" in st.query_params:
+    with st.sidebar.expander("⏱️ Load diagnostics", expanded=True):
+        cold = startup.cold_start_seconds()
+        st.metric(f"Cold start ({startup.START_LABEL} → first page)", f"{cold*1000:.0f} ms")
+        st.caption("Prewarm finished ✅" if startup.prewarm_done() else "Prewarm running in the background…")
+        st.dataframe(
+            [{"Module": name, "Import (ms)": round(ms, 1), "Loaded by": by}
+             for name, ms, by in startup.import_report()],
+            use_container_width=True, hide_index=True,
+        )
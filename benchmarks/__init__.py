@@ -0,0 +1 @@
+# Render-path benchmarks for the topic pages
@@ -0,0 +1,261 @@
+"""Render-path benchmarks for every topic page.
+
+Each topic's ``render()`` runs headlessly under Streamlit's ``AppTest`` for
+one or more widget scenarios.  For every scenario we record
+
+* ``cold_ms``  — first render with the in-process caches cleared,
+* ``warm_ms``  — median of the following reruns,
+* ``peak_kb``  — peak traced allocation during the cold render,
+* ``scipy_cold`` / ``scipy_warm`` — scipy.stats distribution methods and
+  test functions actually invoked.
+
+Results are compared with ``benchmarks/baseline.json``.  A scenario fails
+when its warm time exceeds both the baseline plus the tolerance and its
+budget, when it makes more warm scipy calls than the baseline, or when its
+peak memory grows past the tolerance.  Usage::
+
+    python -m benchmarks.bench_topics                 # run all, compare
+    python -m benchmarks.bench_topics clt z_t_tables  # selected topics
+    python -m benchmarks.bench_topics --update-baseline
+"""
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BASELINE = os.path.join(ROOT, "benchmarks", "baseline.json")
+
+# Warm-render budgets in milliseconds for the pages we track closely.
+BUDGETS_MS = {
+    "z_t_tables": 250,
+    "hypothesis_testing": 300,
+    "clt": 250,
+    "distribution_playground": 250,
+}
+DEFAULT_BUDGET_MS = 600
+TOLERANCE = 0.25
+# Peak-memory growth is only flagged above this floor, in KB.
+MEMORY_FLOOR_KB = 4096
+
+# topic -> {scenario name: [(widget kind, key or label, value), ...]}
+SCENARIOS = {
+    "z_t_tables": {
+        "t lookup": [("radio", "lookup_type", "t critical value given df and α"),
+                     ("number_input", "lk_df", 137)],
+        "p-value lookup": [("radio", "lookup_type", "P-value given t and df"),
+                           ("number_input", "lk_t", 1.234)],
+    },
+    "hypothesis_testing": {
+        "z-test n=400": [("number_input", "zt_n", 400), ("radio", "zt_type", "μ ≠ μ₀ (two-tailed)")],
+        "t-test n=60": [("number_input", "tt_n", 60), ("radio", "tt_type", "μ ≠ μ₀")],
+        "p-value t two-tailed": [("radio", "pv_dist", "t (Student's t)"),
+                                 ("radio", "pv_tail", "Two-tailed (≠)")],
+    },
+    "clt": {
+        "n=100": [("slider", "clt_n", 100)],
+        "exponential 100k": [("selectbox", "Population shape:", "Exponential (Skewed)"),
+                             ("select_slider", "clt_sims", 100_000)],
+    },
+    "distribution_playground": {
+        "binomial n=5000": [("selectbox", "Choose a Distribution:", "Binomial"),
+                            ("slider", "n (trials):", 5000)],
+        "poisson λ=500": [("selectbox", "Choose a Distribution:", "Poisson"),
+                          ("slider", "λ (rate / mean):", 500.0)],
+    },
+}
+
+SCIPY_FUNCTIONS = ("linregress", "f_oneway", "pearsonr", "ttest_ind", "ttest_1samp")
+
+
+def topic_keys():
+    names = sorted(f[:-3] for f in os.listdir(os.path.join(ROOT, "topics"))
+                   if f.endswith(".py") and not f.startswith("_"))
+    return names
+
+
+@contextmanager
+def count_scipy_calls():
+    """Count calls into scipy.stats while the block runs; yields a one-item list."""
+    from scipy import stats
+    from scipy.stats import rv_continuous, rv_discrete
+
+    counter = [0]
+    patched = []
+
+    def wrap(owner, name):
+        original = getattr(owner, name)
+
+        def counted(*args, **kwargs):
+            counter[0] += 1
+            return original(*args, **kwargs)
+
+        setattr(owner, name, counted)
+        patched.append((owner, name, original))
+
+    for cls in (rv_continuous, rv_discrete):
+        for name in ("pdf", "pmf", "cdf", "sf", "ppf", "isf"):
+            if name in vars(cls):
+                wrap(cls, name)
+    for name in SCIPY_FUNCTIONS:
+        wrap(stats, name)
+    try:
+        yield counter
+    finally:
+        for owner, name, original in reversed(patched):
+            setattr(owner, name, original)
+
+
+def caches():
+    """Every resettable cache in ``topics``: lru_cache'd functions and module-level ``cache_clear``.
+
+    Helper modules are scanned rather than listed, so a new cache cannot turn
+    a cold measurement warm unnoticed.
+    """
+    import importlib
+    found = {}
+    for f in sorted(os.listdir(os.path.join(ROOT, "topics"))):
+        if not (f.endswith(".py") and f.startswith("_") and f != "__init__.py"):
+            continue
+        module = importlib.import_module(f"topics.{f[:-3]}")
+        for name, obj in vars(module).items():
+            if name == "cache_clear" and callable(obj):
+                found[id(obj)] = obj
+            elif callable(getattr(obj, "cache_clear", None)) and getattr(obj, "__module__", None) == module.__name__:
+                found[id(obj)] = obj.cache_clear
+    return list(found.values())
+
+
+def clear_caches():
+    import streamlit as st
+    for clear in caches():
+        clear()
+    st.cache_data.clear()
+    st.cache_resource.clear()
+
+
+def _widget(at, kind, ident):
+    try:
+        return getattr(at, kind)(key=ident)
+    except KeyError:
+        return next(w for w in getattr(at, kind) if w.label == ident)
+
+
+def _app(topic, actions):
+    from streamlit.testing.v1 import AppTest
+    script = (f"import sys\nsys.path.insert(0, {ROOT!r})\n"
+              f"from topics import {topic}\n{topic}.render()\n")
+    at = AppTest.from_string(script, default_timeout=120)
+    at.run()
+    for kind, ident, value in actions:
+        # One rerun per action: later widgets may only exist after earlier choices
+        _widget(at, kind, ident).set_value(value)
+        at.run()
+    return at
+
+
+def measure(topic, actions, repeat):
+    """Run one scenario; returns the metrics dict (or an ``error`` entry)."""
+    at = _app(topic, actions)
+    if at.exception:
+        return {"error": str(at.exception[0].value)[:200]}
+    clear_caches()
+    tracemalloc.start()
+    with count_scipy_calls() as calls:
+        t0 = time.perf_counter()
+        at.run()
+        cold_ms = (time.perf_counter() - t0) * 1000
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    scipy_cold = calls[0]
+    if at.exception:
+        return {"error": str(at.exception[0].value)[:200]}
+
+    warm = []
+    with count_scipy_calls() as calls:
+        for _ in range(repeat):
+            t0 = time.perf_counter()
+            at.run()
+            warm.append((time.perf_counter() - t0) * 1000)
+    return {
+        "cold_ms": round(cold_ms, 1),
+        "warm_ms": round(statistics.median(warm), 1),
+        "peak_kb": round(peak / 1024),
+        "scipy_cold": scipy_cold,
+        "scipy_warm": round(calls[0] / repeat, 1),
+    }
+
+
+def run(topics, repeat):
+    results = {}
+    for topic in topics:
+        for name, actions in {"default": [], **SCENARIOS.get(topic, {})}.items():
+            results[f"{topic}::{name}"] = measure(topic, actions, repeat)
+    return results
+
+
+def compare(results, baseline):
+    """Rows of (scenario, metrics, baseline metrics, status)."""
+    rows = []
+    for scenario, cur in results.items():
+        base = baseline.get(scenario)
+        budget = BUDGETS_MS.get(scenario.split("::")[0], DEFAULT_BUDGET_MS)
+        if "error" in cur:
+            status = "ERROR"
+        elif base is None or "error" in base:
+            status = "new"
+        elif cur["warm_ms"] > base["warm_ms"] * (1 + TOLERANCE) and cur["warm_ms"] > budget:
+            status = "REGRESSED"
+        elif cur["scipy_warm"] > base["scipy_warm"]:
+            status = "MORE SCIPY"
+        elif cur["peak_kb"] > base["peak_kb"] * (1 + TOLERANCE) and cur["peak_kb"] > MEMORY_FLOOR_KB:
+            status = "MORE MEMORY"
+        else:
+            status = "ok"
+        rows.append((scenario, cur, base, status))
+    return rows
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("topics", nargs="*", help="topic modules to run (default: all)")
+    parser.add_argument("--repeat", type=int, default=5, help="warm reruns per scenario")
+    parser.add_argument("--update-baseline", action="store_true")
+    args = parser.parse_args(argv)
+
+    sys.path.insert(0, ROOT)
+    topics = args.topics or topic_keys()
+    results = run(topics, args.repeat)
+
+    baseline = {}
+    if os.path.exists(BASELINE):
+        with open(BASELINE) as fh:
+            baseline = json.load(fh)
+
+    print(f"{'scenario':52s} {'cold ms':>8s} {'warm ms':>8s} {'base':>8s} {'peak KB':>8s} {'scipy':>9s}  status")
+    failed = False
+    for scenario, cur, base, status in compare(results, baseline):
+        failed |= status in ("REGRESSED", "MORE SCIPY", "MORE MEMORY")
+        if "error" in cur:
+            print(f"{scenario:52s} {cur['error']}")
+            continue
+        base_ms = f"{base['warm_ms']:.1f}" if base and "warm_ms" in base else "—"
+        print(f"{scenario:52s} {cur['cold_ms']:8.1f} {cur['warm_ms']:8.1f} {base_ms:>8s} "
+              f"{cur['peak_kb']:8d} {cur['scipy_cold']:4d}/{cur['scipy_warm']:<4g}  {status}")
+
+    if args.update_baseline:
+        baseline.update(results)
+        with open(BASELINE, "w") as fh:
+            json.dump(baseline, fh, indent=2, sort_keys=True, ensure_ascii=False)
+            fh.write("\n")
+        print(f"Baseline written to {os.path.relpath(BASELINE, ROOT)}")
+        return 0
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
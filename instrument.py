@@ -0,0 +1,231 @@
+"""Opt-in per-rerun profiling for the page router.
+
+Enabled with ``?profile=1`` in the URL or ``QT_PROFILE=1`` in the
+environment.  While a rerun is being profiled, time is attributed to
+
+* the app-level sections wrapped in ``section()`` (CSS injection, sidebar,
+  topic import, render), and
+* inside them, to the Streamlit/scipy calls a page makes: markdown/LaTeX
+  output, widget creation, scipy computation (everything that reaches
+  ``topics._engine``, plus the scipy.stats tests and root finding that pages
+  call directly), bootstrap/permutation resampling and ``plotly_chart``
+  serialization.
+
+Time is recorded as self time, so nested categories are never counted twice.
+Each profiled rerun is appended as one JSON line to ``QT_PROFILE_LOG``.
+Streamlit runs each session's script in its own thread.  The hooks are
+installed once per process, but a call is only timed when its thread holds a
+profile that was started by the session whose script the thread is running
+(per the current ``ScriptRunContext``).  Other sessions are never timed; for
+them each hook costs one thread-local lookup.
+"""
+import functools
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+import streamlit as st
+from streamlit.delta_generator import DeltaGenerator
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+LOG_PATH = os.environ.get("QT_PROFILE_LOG", "qt_profile.jsonl")
+
+CATEGORIES = {
+    "markdown / LaTeX": ("markdown", "latex", "caption", "write", "table", "dataframe", "metric",
+                         "info", "success", "warning", "error", "divider", "code"),
+    "widgets": ("slider", "select_slider", "number_input", "text_input", "selectbox", "multiselect",
+                "radio", "checkbox", "button", "file_uploader", "download_button", "tabs",
+                "columns", "expander"),
+    "plotly_chart": ("plotly_chart",),
+}
+# scipy entry points that pages and helpers call directly, outside ``_engine``
+SCIPY_DIRECT = ("f_oneway", "linregress", "pearsonr", "ttest_ind", "ttest_1samp")
+RESAMPLING = ("bootstrap_ci", "permutation_test")
+
+_local = threading.local()
+_install_lock = threading.Lock()
+_installed = False
+
+
+class RerunProfile:
+    """Self-time accounting for one script run."""
+
+    def __init__(self, session_id=None):
+        self.session_id = session_id
+        self.page = None
+        self.start = time.perf_counter()
+        self.self_time = {}     # path tuple -> seconds
+        self.calls = {}         # path tuple -> count
+        self._stack = []        # [path, started, child seconds]
+
+    def enter(self, name):
+        parent = self._stack[-1][0] if self._stack else ()
+        self._stack.append([parent + (name,), time.perf_counter(), 0.0])
+
+    def exit(self):
+        path, started, child = self._stack.pop()
+        elapsed = time.perf_counter() - started
+        self.self_time[path] = self.self_time.get(path, 0.0) + elapsed - child
+        self.calls[path] = self.calls.get(path, 0) + 1
+        if self._stack:
+            self._stack[-1][2] += elapsed
+
+    def total(self):
+        return time.perf_counter() - self.start
+
+    def record(self):
+        return {
+            "ts": time.time(),
+            "page": self.page,
+            "total_ms": round(self.total() * 1000, 2),
+            "sections": [
+                {"path": "/".join(path), "self_ms": round(sec * 1000, 3), "calls": self.calls[path]}
+                for path, sec in sorted(self.self_time.items())
+            ],
+        }
+
+
+def _session_id():
+    ctx = get_script_run_ctx(suppress_warning=True)
+    return ctx.session_id if ctx is not None else None
+
+
+def _active():
+    """This thread's profile, if it belongs to the session whose script is running here."""
+    prof = getattr(_local, "profile", None)
+    if prof is None or prof.session_id != _session_id():
+        return None
+    return prof
+
+
+def _timed(category, fn):
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        prof = _active()
+        if prof is None:
+            return fn(*args, **kwargs)
+        prof.enter(category)
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            prof.exit()
+    wrapper._qt_timed = True
+    return wrapper
+
+
+def _install():
+    """Wrap the st.* / DeltaGenerator methods and the scipy dispatch, once per process."""
+    global _installed
+    with _install_lock:
+        if _installed:
+            return
+        for category, names in CATEGORIES.items():
+            for name in names:
+                # Module-level st.x is bound to the main container at import time,
+                # so it has to be wrapped separately from DeltaGenerator.x
+                for owner in (st, DeltaGenerator):
+                    fn = getattr(owner, name, None)
+                    if fn is not None and not getattr(fn, "_qt_timed", False):
+                        setattr(owner, name, _timed(category, fn))
+        from scipy import stats
+
+        from topics import _engine, _power, _resample
+        _engine._compute = _timed("scipy", _engine._compute)
+        for name in SCIPY_DIRECT:
+            setattr(stats, name, _timed("scipy", getattr(stats, name)))
+        _power.brentq = _timed("scipy", _power.brentq)
+        for name in RESAMPLING:
+            setattr(_resample, name, _timed("resampling", getattr(_resample, name)))
+        _installed = True
+
+
+def enabled():
+    return os.environ.get("QT_PROFILE") == "1" or st.query_params.get("profile") in ("1", "true")
+
+
+def begin():
+    """Start profiling this rerun if enabled; returns the profile or None.
+
+    Always resets the thread's state, so a run interrupted by ``st.rerun()``
+    never leaks its profile into the next one.
+    """
+    _local.profile = None
+    if enabled():
+        _install()
+        _local.profile = RerunProfile(_session_id())
+    return _local.profile
+
+
+@contextmanager
+def section(name):
+    """Time an app-level block; a no-op when this rerun is not being profiled."""
+    prof = _active()
+    if prof is None:
+        yield
+        return
+    prof.enter(name)
+    try:
+        yield
+    finally:
+        prof.exit()
+
+
+def finish(page):
+    """Stop profiling, append the JSONL record and return it (None if inactive)."""
+    prof = _active()
+    if prof is None:
+        return None
+    _local.profile = None
+    prof.page = page
+    rec = prof.record()
+    try:
+        with open(LOG_PATH, "a", encoding="utf-8") as fh:
+            fh.write(json.dumps(rec, ensure_ascii=False) + "\n")
+    except OSError:
+        pass
+    return rec
+
+
+def render_overlay(rec):
+    """Collapsible flame-style breakdown of a finished rerun."""
+    import plotly.graph_objects as go
+
+    with st.expander(f"⏱️ Rerun profile — {rec['total_ms']:.1f} ms", expanded=False):
+        sections = rec["sections"]
+        by_path = {s["path"]: s for s in sections}
+        inclusive = {p: sum(t["self_ms"] for t in sections if t["path"] == p or t["path"].startswith(p + "/"))
+                     for p in by_path}
+        children = {}
+        for p in by_path:
+            children.setdefault(p.rpartition("/")[0], []).append(p)
+        depth = max(p.count("/") for p in by_path) + 1 if by_path else 1
+        fig = go.Figure()
+
+        def place(parent, start, level):
+            # Children sit under their parent's span, laid end to end like a flame graph
+            offset = start
+            for p in children.get(parent, []):
+                s, name = by_path[p], p.rpartition("/")[2]
+                fig.add_trace(go.Bar(
+                    x=[inclusive[p]], y=[f"L{level}"], base=[offset], orientation='h',
+                    name=name, text=f"{name} {inclusive[p]:.1f} ms", textposition='inside',
+                    hovertemplate=f"{p}<br>self {s['self_ms']:.2f} ms · {s['calls']} calls<extra></extra>",
+                    showlegend=False,
+                ))
+                place(p, offset, level + 1)
+                offset += inclusive[p]
+
+        place("", 0.0, 0)
+        fig.update_layout(barmode='overlay', height=80 + 40 * depth,
+                          margin=dict(l=10, r=10, t=10, b=10),
+                          paper_bgcolor='#ffffff', plot_bgcolor='#f8fafc',
+                          yaxis=dict(autorange='reversed'), xaxis=dict(title='ms'))
+        st.plotly_chart(fig, use_container_width=True)
+        st.dataframe(
+            [{"Section": s["path"], "Self (ms)": s["self_ms"], "Calls": s["calls"]}
+             for s in sorted(sections, key=lambda s: s["self_ms"], reverse=True)],
+            use_container_width=True, hide_index=True,
+        )
+        st.caption(f"Appended to `{LOG_PATH}`")
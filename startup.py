@@ -0,0 +1,102 @@
+"""Startup prewarm for the app.
+
+Every topic module imports numpy, scipy.stats and plotly at module top, so
+the first visit to each page used to pay those imports.  ``prewarm()`` starts
+a daemon thread, once per process, that imports the heavy libraries and then
+every topic module.  All imports go through ``import_timed`` so the
+diagnostics view can show what each module cost and who paid for it.
+"""
+import importlib
+import os
+import sys
+import threading
+import time
+
+HEAVY_MODULES = ("numpy", "pandas", "scipy.stats", "plotly.graph_objects")
+
+
+def _process_age():
+    """Seconds since this process was created, from /proc; None where unavailable."""
+    try:
+        with open("/proc/self/stat") as fh:
+            # Field 22 (start time, in clock ticks after boot) follows the ")" closing the command name
+            started = int(fh.read().rsplit(")", 1)[1].split()[19])
+        with open("/proc/uptime") as fh:
+            uptime = float(fh.read().split()[0])
+        return max(0.0, uptime - started / os.sysconf("SC_CLK_TCK"))
+    except (OSError, ValueError, IndexError, AttributeError):
+        return None
+
+
+_age = _process_age()
+# Where the cold-start clock starts: process creation when /proc has it, else this import
+START_LABEL = "process" if _age is not None else "startup import"
+PROCESS_START = time.perf_counter() - (_age or 0.0)
+
+_lock = threading.Lock()
+_records = {}          # module name -> {"seconds": float, "by": "prewarm" | "on demand"}
+_cold_start = None
+_prewarm_thread = None
+
+
+def import_timed(name, by="on demand"):
+    """Import ``name`` and record how long the first import took."""
+    already = name in sys.modules
+    t0 = time.perf_counter()
+    mod = importlib.import_module(name)
+    elapsed = time.perf_counter() - t0
+    with _lock:
+        if name not in _records:
+            _records[name] = {"seconds": 0.0 if already else elapsed,
+                              "by": "already loaded" if already else by}
+    return mod
+
+
+def load_topic(key):
+    """Import ``topics.<key>``; instant once the prewarm thread has reached it."""
+    return import_timed(f"topics.{key}")
+
+
+def _prewarm(topic_keys):
+    for name in HEAVY_MODULES:
+        import_timed(name, by="prewarm")
+    for key in topic_keys:
+        try:
+            import_timed(f"topics.{key}", by="prewarm")
+        except Exception:
+            # A broken topic surfaces on its own page; prewarm keeps going.
+            pass
+
+
+def prewarm(topic_keys):
+    """Start the background prewarm thread if it is not running already."""
+    global _prewarm_thread
+    with _lock:
+        if _prewarm_thread is not None:
+            return
+        _prewarm_thread = threading.Thread(target=_prewarm, args=(list(topic_keys),),
+                                           name="qt-prewarm", daemon=True)
+    _prewarm_thread.start()
+
+
+def prewarm_done():
+    return _prewarm_thread is not None and not _prewarm_thread.is_alive()
+
+
+def record_cold_start():
+    """Note the time from ``PROCESS_START`` (see ``START_LABEL``) to the end of the first script run."""
+    global _cold_start
+    with _lock:
+        if _cold_start is None:
+            _cold_start = time.perf_counter() - PROCESS_START
+
+
+def cold_start_seconds():
+    return _cold_start
+
+
+def import_report():
+    """Rows of (module, milliseconds, loaded by), slowest first."""
+    with _lock:
+        rows = [(name, rec["seconds"] * 1000, rec["by"]) for name, rec in _records.items()]
+    return sorted(rows, key=lambda r: r[1], reverse=True)
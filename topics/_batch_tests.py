@@ -0,0 +1,124 @@
+"""Vectorized one-sample z/t tests for a whole table of test specifications.
+
+Each row describes one test: hypothesised mean ``mu0``, sample ``mean``, the
+standard deviation ``sd`` (σ for a z-test, s for a t-test) and ``n``; the
+optional ``test`` (z | t), ``tail`` (two | upper | lower) and ``name``
+columns override the defaults per row.  A z-test is a t-test with infinite
+degrees of freedom, so every row goes through one ``sf`` and one ``isf``
+call regardless of how the table mixes test types and tails.
+"""
+import io
+
+import numpy as np
+import pandas as pd
+
+from topics import _engine
+
+REQUIRED = ("mu0", "mean", "sd", "n")
+TESTS = ("z", "t")
+TAILS = ("two", "upper", "lower")
+CORRECTIONS = {
+    "none": "None",
+    "bonferroni": "Bonferroni (FWER)",
+    "holm": "Holm step-down (FWER)",
+    "bh": "Benjamini–Hochberg (FDR)",
+}
+
+EXAMPLE = """name,mu0,mean,sd,n,test,tail
+conversion_rate,0.120,0.127,0.33,4000,z,two
+avg_order_value,54.0,55.9,21.0,1800,t,upper
+session_length,310,302,140,950,t,two
+bounce_rate,0.41,0.395,0.49,5200,z,lower
+pages_per_visit,4.8,4.95,2.6,1200,t,two
+checkout_time,96,91,38,420,t,lower
+"""
+
+
+def parse_text(text):
+    """Pasted CSV text to a DataFrame."""
+    return pd.read_csv(io.StringIO(text.strip()))
+
+
+def _normalise(table, default_test, default_tail):
+    df = table.rename(columns=lambda c: str(c).strip().lower())
+    missing = [c for c in REQUIRED if c not in df.columns]
+    if missing:
+        raise ValueError(f"Missing column(s): {', '.join(missing)}. "
+                         f"Required: {', '.join(REQUIRED)}.")
+    out = pd.DataFrame({
+        "name": (df["name"].astype(str) if "name" in df.columns
+                 else pd.Series([f"test {i+1}" for i in range(len(df))], index=df.index)),
+        "test": (df["test"].astype(str).str.strip().str.lower() if "test" in df.columns
+                 else default_test),
+        "tail": (df["tail"].astype(str).str.strip().str.lower() if "tail" in df.columns
+                 else default_tail),
+    })
+    for c in REQUIRED:
+        out[c] = pd.to_numeric(df[c], errors="coerce")
+    bad = ~out["test"].isin(TESTS) | ~out["tail"].isin(TAILS)
+    if bad.any():
+        raise ValueError(f"Row {int(np.flatnonzero(bad)[0]) + 1}: test must be one of "
+                         f"{'/'.join(TESTS)} and tail one of {'/'.join(TAILS)}.")
+    return out.reset_index(drop=True)
+
+
+def adjust(p, method):
+    """Multiple-comparison adjusted p-values; NaNs are left out of the family."""
+    p = np.asarray(p, dtype=float)
+    out = np.full(p.shape, np.nan)
+    valid = np.flatnonzero(np.isfinite(p))
+    m = valid.size
+    if m == 0:
+        return out
+    if method == "none":
+        out[valid] = p[valid]
+        return out
+    if method == "bonferroni":
+        out[valid] = np.minimum(p[valid] * m, 1.0)
+        return out
+    order = valid[np.argsort(p[valid], kind="stable")]
+    ranked = p[order]
+    if method == "holm":
+        adj = np.maximum.accumulate(ranked * (m - np.arange(m)))
+    elif method == "bh":
+        adj = np.minimum.accumulate((ranked * m / np.arange(1, m + 1))[::-1])[::-1]
+    else:
+        raise ValueError(f"Unknown correction: {method!r}")
+    out[order] = np.minimum(adj, 1.0)
+    return out
+
+
+def run_tests(table, alpha=0.05, correction="none", default_test="t", default_tail="two"):
+    """Statistics, p-values, critical values and decisions for every row.
+
+    Rows with n < 2 or sd ≤ 0 get NaN results and are excluded from the
+    correction.  ``reject`` compares the adjusted p-value with α.
+    """
+    res = _normalise(table, default_test, default_tail)
+    n = res["n"].to_numpy(dtype=float)
+    sd = res["sd"].to_numpy(dtype=float)
+    ok = (n >= 2) & (sd > 0) & np.isfinite(res[list(REQUIRED)].to_numpy(dtype=float)).all(axis=1)
+    se = np.where(ok, sd / np.sqrt(np.where(ok, n, 1.0)), np.nan)
+    stat = (res["mean"].to_numpy(dtype=float) - res["mu0"].to_numpy(dtype=float)) / se
+    dof = np.where(res["test"].to_numpy() == "z", np.inf, n - 1)
+    dof = np.where(ok, dof, np.nan)
+
+    tail = res["tail"].to_numpy()
+    two = tail == "two"
+    # Orient every statistic so that "more extreme" means larger
+    oriented = np.where(two, np.abs(stat), np.where(tail == "lower", -stat, stat))
+    p = np.where(two, 2.0, 1.0) * np.atleast_1d(_engine.sf("t", oriented, dof))
+    crit = np.atleast_1d(_engine.isf("t", np.where(two, alpha / 2, alpha), dof))
+
+    res["se"] = se
+    res["statistic"] = stat
+    res["df"] = dof
+    res["p"] = np.minimum(p, 1.0)
+    res["critical"] = np.where(tail == "lower", -crit, crit)
+    res["p_adj"] = adjust(res["p"], correction)
+    res["reject"] = res["p_adj"] < alpha
+    return res
+
+
+def to_csv(results):
+    return results.to_csv(index=False).encode("utf-8")
@@ -0,0 +1,138 @@
+"""Posterior surfaces for Bayes' theorem over whole scenario grids.
+
+For a binary hypothesis A and k independent positive results B₁…B_k, the
+posterior in log-odds is
+
+    logit P(A | B₁…B_k) = logit P(A) + k · log(P(B|A) / P(B|Aᶜ)),
+
+so the posterior for every (prior, sensitivity, false-positive rate) on the
+grid is a single NumPy broadcast.  Cubes are cached per (resolution, k) as
+read-only float32 in a process-wide LRU bounded by total bytes, like
+``_engine``; moving a slider only picks the nearest slice, so sweeping base
+rates never recomputes anything.  A 201³ cube alone exceeds ``MAX_BYTES``, so
+it is kept only until another cube is needed.  ``conditional_cube`` does the same for
+P(A|B) = P(A∩B)/P(B) over (P(A), P(B), P(A∩B)), with infeasible triples masked.
+"""
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+
+import numpy as np
+from scipy.special import expit
+
+RESOLUTIONS = (51, 101, 201)
+MAX_BYTES = 16 * 1024 * 1024
+# Rates are kept this far from 0 and 1 so every log-likelihood ratio is finite
+EPS = 1e-12
+AXES = {
+    "prior": "Prior P(A)",
+    "sens": "Sensitivity P(B|A)",
+    "fpr": "False-positive rate P(B|Aᶜ)",
+}
+
+
+@lru_cache(maxsize=None)
+def axis(name, res):
+    """Read-only grid of one scenario axis (priors and FPRs log-spaced)."""
+    grid = {
+        "prior": lambda: np.geomspace(1e-4, 0.9, res),
+        "sens": lambda: np.linspace(0.5, 0.999, res),
+        "fpr": lambda: np.geomspace(1e-3, 0.5, res),
+    }[name]()
+    grid.setflags(write=False)
+    return grid
+
+
+def _logit(p):
+    p = np.asarray(p, dtype=float)
+    return np.log(p) - np.log1p(-p)
+
+
+_lock = threading.Lock()
+_cubes = OrderedDict()   # (res, k) -> read-only cube
+_bytes = 0
+
+
+def _posterior_cube(res, k):
+    prior, sens, fpr = axis("prior", res), axis("sens", res), axis("fpr", res)
+    llr = np.log(sens)[None, :, None] - np.log(fpr)[None, None, :]
+    cube = expit(_logit(prior)[:, None, None] + k * llr).astype(np.float32)
+    cube.setflags(write=False)
+    return cube
+
+
+def posterior_cube(res, k=1):
+    """P(A | k positives) on the prior × sens × fpr grid, shape (res, res, res)."""
+    global _bytes
+    key = (res, k)
+    with _lock:
+        cube = _cubes.get(key)
+        if cube is not None:
+            _cubes.move_to_end(key)
+            return cube
+    cube = _posterior_cube(res, k)
+    with _lock:
+        if key not in _cubes:
+            _cubes[key] = cube
+            _bytes += cube.nbytes
+            while _bytes > MAX_BYTES and len(_cubes) > 1:
+                _, evicted = _cubes.popitem(last=False)
+                _bytes -= evicted.nbytes
+    return _cubes.get(key, cube)
+
+
+def cache_info():
+    with _lock:
+        return {"entries": len(_cubes), "bytes": _bytes}
+
+
+def cache_clear():
+    global _bytes
+    with _lock:
+        _cubes.clear()
+        _bytes = 0
+    axis.cache_clear()
+    conditional_cube.cache_clear()
+
+
+def posterior_slice(res, k, fixed, value):
+    """2-D slice of ``posterior_cube`` with axis ``fixed`` held at the grid point nearest ``value``.
+
+    Returns ``(x_name, x, y_name, y, z, held)`` with ``z[i, j]`` at (y[i], x[j])
+    and ``held`` the grid value actually used.
+    """
+    names = list(AXES)
+    i = names.index(fixed)
+    grid = axis(fixed, res)
+    j = int(np.abs(np.log(grid) - np.log(value)).argmin())
+    z = np.take(posterior_cube(res, k), j, axis=i)
+    y_name, x_name = [n for n in names if n != fixed]
+    return x_name, axis(x_name, res), y_name, axis(y_name, res), z, float(grid[j])
+
+
+def sequential(prior, sens, fpr, k):
+    """Posterior after 0…k results, for all-positive and all-negative runs (rates clipped to [EPS, 1 − EPS])."""
+    sens, fpr = np.clip([sens, fpr], EPS, 1 - EPS)
+    j = np.arange(k + 1)
+    pos = expit(_logit(prior) + j * (np.log(sens) - np.log(fpr)))
+    neg = expit(_logit(prior) + j * (np.log1p(-sens) - np.log1p(-fpr)))
+    return j, pos, neg
+
+
+def sequential_grid(res, sens, fpr, k):
+    """P(A | j positives) over the prior axis × j = 0…k, shape (k + 1, res)."""
+    sens, fpr = np.clip([sens, fpr], EPS, 1 - EPS)
+    j = np.arange(k + 1)[:, None]
+    return expit(_logit(axis("prior", res))[None, :] + j * (np.log(sens) - np.log(fpr)))
+
+
+@lru_cache(maxsize=4)
+def conditional_cube(res):
+    """P(A|B) over P(A) × P(B) × P(A∩B) on [0, 1]³; NaN where the triple is impossible."""
+    g = np.linspace(0, 1, res)
+    pa, pb, pab = g[:, None, None], g[None, :, None], g[None, None, :]
+    feasible = (pab <= np.minimum(pa, pb)) & (pa + pb - pab <= 1) & (pb > 0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        cube = np.where(feasible, pab / pb, np.nan).astype(np.float32)
+    cube.setflags(write=False)
+    return g, cube
@@ -0,0 +1,189 @@
+"""Bayesian updating over many discrete hypotheses, in log space.
+
+Each hypothesis is one value θ of a model parameter (a coin's bias, a
+normal mean, a Poisson rate).  ``LogPosterior.update`` adds the
+log-likelihood of a batch of observations to every hypothesis at once and
+renormalizes with ``logsumexp``, so posteriors far below the smallest
+float64 stay representable.  The likelihoods here depend on the batch only
+through its sufficient statistics (count, sum, mean), so one update costs
+O(batch + k).
+
+``trajectory`` feeds a data stream through the updater and records the
+posterior at up to ``TRAJECTORY_POINTS`` log-spaced checkpoints.  These go
+into a preallocated float32 array of shape (checkpoints, k), which stays
+small enough to plot even for thousands of hypotheses and tens of
+thousands of observations.
+
+For uploaded data the hypothesis range comes from the data (``data_bounds``)
+rather than the model's default range, so the posterior cannot pile up on a
+grid edge that the data lie far beyond.  Whole runs are cached per
+(model, k, prior, data source, σ) with ``st.cache_data``.
+"""
+import time
+from collections import namedtuple
+
+import numpy as np
+import streamlit as st
+from scipy.special import logsumexp
+
+from topics import _uploads
+
+TRAJECTORY_POINTS = 300
+SEED = 11
+HEATMAP_COLUMNS = 400       # hypotheses are summed into at most this many heatmap columns
+
+Model = namedtuple("Model", ["label", "param", "lower", "upper", "default_truth", "loglik", "simulate"])
+Trajectory = namedtuple("Trajectory", ["steps", "posterior", "map", "mean", "low", "high", "grid"])
+Run = namedtuple("Run", ["trajectory", "n", "seconds"])
+
+
+def _bernoulli_loglik(x, theta, _scale):
+    s = x.sum()
+    return s * np.log(theta) + (x.size - s) * np.log1p(-theta)
+
+
+def _normal_loglik(x, mu, sigma):
+    # Σ(x − μ)² = Σ(x − x̄)² + m(x̄ − μ)²; the first term is the same for every μ
+    return -x.size * (x.mean() - mu) ** 2 / (2 * sigma**2)
+
+
+def _poisson_loglik(x, lam, _scale):
+    return x.sum() * np.log(lam) - x.size * lam
+
+
+MODELS = {
+    "bernoulli": Model("Coin bias (0/1 outcomes)", "θ = P(heads)", 0.001, 0.999, 0.62, _bernoulli_loglik,
+                       lambda rng, n, t, _s: (rng.random(n) < t).astype(float)),
+    "normal": Model("Normal mean (σ known)", "μ", -5.0, 5.0, 1.3, _normal_loglik,
+                    lambda rng, n, t, s: rng.normal(t, s, n)),
+    "poisson": Model("Poisson rate (counts)", "λ", 0.05, 20.0, 4.2, _poisson_loglik,
+                     lambda rng, n, t, _s: rng.poisson(t, n).astype(float)),
+}
+PRIORS = {
+    "uniform": "Uniform over the hypotheses",
+    "centred": "Sceptical: favours the middle of the range",
+}
+
+
+def hypotheses(model, k, lower=None, upper=None):
+    """``k`` evenly spaced parameter values (the hypotheses) for ``model``."""
+    m = MODELS[model]
+    return np.linspace(m.lower if lower is None else lower, m.upper if upper is None else upper, k)
+
+
+def data_bounds(model, data, pad=0.1):
+    """Hypothesis range spanning the observed values (padded), or None for 0/1 data.
+
+    The range always contains the sample mean, where the posterior ends up.
+    """
+    if model == "bernoulli" or not data.size:
+        return None
+    lo, hi = float(data.min()), float(data.max())
+    margin = pad * (hi - lo) or 1.0
+    if model == "poisson":
+        # λ must stay positive for log λ
+        return max(lo - margin, 1e-3 * (hi + 1)), hi + margin
+    return lo - margin, hi + margin
+
+
+def on_edge(traj):
+    """True when the final MAP is the first or last hypothesis of the grid."""
+    return traj.map[-1] in (traj.grid[0], traj.grid[-1])
+
+
+def heatmap(traj, columns=HEATMAP_COLUMNS):
+    """(x, z) for a posterior heatmap: probability mass summed into at most ``columns`` bins."""
+    starts = np.linspace(0, traj.grid.size, min(traj.grid.size, columns) + 1).astype(int)[:-1]
+    return traj.grid[starts], np.add.reduceat(traj.posterior, starts, axis=1)
+
+
+def log_prior(grid, kind="uniform"):
+    """Normalized log prior over ``grid``."""
+    if kind == "uniform":
+        lp = np.zeros(grid.size)
+    else:
+        # Gaussian bump centred on the range, sd a sixth of its width
+        mid, sd = (grid[0] + grid[-1]) / 2, (grid[-1] - grid[0]) / 6
+        lp = -0.5 * ((grid - mid) / sd) ** 2
+    return lp - logsumexp(lp)
+
+
+class LogPosterior:
+    """Running log posterior over a fixed set of hypotheses."""
+
+    def __init__(self, model, grid, log_prior, scale=1.0):
+        self.loglik = MODELS[model].loglik
+        self.grid = grid
+        self.scale = scale
+        self.log_p = np.array(log_prior, dtype=float)
+        self.n = 0
+
+    def update(self, x):
+        """Condition on a batch of observations (NaNs dropped)."""
+        x = np.asarray(x, dtype=float)
+        x = x[np.isfinite(x)]
+        if x.size:
+            self.log_p += self.loglik(x, self.grid, self.scale)
+            self.log_p -= logsumexp(self.log_p)
+            self.n += x.size
+        return self
+
+    def probabilities(self):
+        return np.exp(self.log_p)
+
+
+def _credible(p, grid, level=0.95):
+    cdf = np.cumsum(p)
+    lo = grid[min(np.searchsorted(cdf, (1 - level) / 2), grid.size - 1)]
+    hi = grid[min(np.searchsorted(cdf, 1 - (1 - level) / 2), grid.size - 1)]
+    return lo, hi
+
+
+def checkpoints(n, points=TRAJECTORY_POINTS):
+    """0 plus up to ``points`` log-spaced observation counts ending at ``n``."""
+    if n == 0:
+        return np.array([0])
+    return np.r_[0, np.unique(np.geomspace(1, n, min(points, n)).astype(int))]
+
+
+def trajectory(model, grid, log_prior, data, scale=1.0, points=TRAJECTORY_POINTS):
+    """Posterior after each checkpoint of ``data``, plus MAP, mean and 95% credible bounds."""
+    data = np.asarray(data, dtype=float)
+    data = data[np.isfinite(data)]
+    steps = checkpoints(data.size, points)
+    post = np.empty((steps.size, grid.size), dtype=np.float32)
+    summary = np.empty((4, steps.size))
+    state = LogPosterior(model, grid, log_prior, scale)
+    for i, (a, b) in enumerate(zip(np.r_[0, steps[:-1]], steps)):
+        p = state.update(data[a:b]).probabilities()
+        post[i] = p
+        summary[:, i] = (grid[p.argmax()], p @ grid, *_credible(p, grid))
+    return Trajectory(steps, post, *summary, grid)
+
+
+def _run(model, grid, prior, data, scale):
+    t0 = time.perf_counter()
+    traj = trajectory(model, grid, log_prior(grid, prior), data, scale)
+    return Run(traj, int(np.isfinite(data).sum()), time.perf_counter() - t0)
+
+
+@st.cache_data(max_entries=16, show_spinner=False)
+def simulated_run(model, k, prior, n_obs, truth, scale):
+    """``Run`` over ``n_obs`` seeded draws from ``model`` at parameter ``truth``."""
+    data = MODELS[model].simulate(np.random.default_rng(SEED), n_obs, truth, scale)
+    return _run(model, hypotheses(model, k), prior, data, scale)
+
+
+@st.cache_data(max_entries=8, show_spinner="Reading the column…")
+def upload_column(file_id, name, col, _uploaded):
+    """Finite values of one uploaded column."""
+    data = _uploads.read_table(_uploaded, columns=[col])[col].to_numpy(dtype=float, na_value=np.nan)
+    return data[np.isfinite(data)]
+
+
+@st.cache_data(max_entries=16, show_spinner=False)
+def upload_run(file_id, name, col, model, k, prior, scale, _uploaded):
+    """``Run`` over an uploaded column, on a hypothesis grid spanning its values."""
+    data = upload_column(file_id, name, col, _uploaded)
+    bounds = data_bounds(model, data) or (None, None)
+    return _run(model, hypotheses(model, k, *bounds), prior, data, scale)
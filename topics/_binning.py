@@ -0,0 +1,153 @@
+"""Histogram bin rules and frequency tables over a cached sorted array.
+
+A column is sorted once (O(n log n)) and kept read-only as ``SortedData``.
+After that, no rule needs another pass over the data:
+
+* Sturges, Scott and Freedman–Diaconis need only n, the range, s and the
+  quartiles, which are read off the sorted array in O(1).
+* Class frequencies for any set of k edges are differences of
+  ``np.searchsorted`` positions, O(k log n).
+* Bayesian blocks (Scargle et al. 2013) runs its O(M²) dynamic programme on
+  at most ``BLOCK_CELLS`` cells: the distinct values when there are few
+  enough, otherwise an equal-width fine grid whose counts also come from
+  ``searchsorted``.  The data-dependent cost stays O(n log n).
+"""
+from collections import namedtuple
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from topics import _describe, _uploads
+
+RULES = {
+    "sturges": "Sturges: k = 1 + log₂ n",
+    "scott": "Scott: h = 3.49 s n^(−1/3)",
+    "fd": "Freedman–Diaconis: h = 2 IQR n^(−1/3)",
+    "bayesian_blocks": "Bayesian blocks (variable width)",
+    "fixed": "Fixed number of classes",
+}
+MAX_BINS = 1_000
+BLOCK_CELLS = 1_000
+P0 = 0.05                   # false-alarm probability of each Bayesian-blocks change point
+
+SortedData = namedtuple("SortedData", ["values", "n", "min", "max", "sd", "q1", "q3"])
+
+
+def prepare(values):
+    """Sort the finite values once; every rule and table reads from this."""
+    x = np.sort(np.asarray(values, dtype=float).ravel())
+    x = x[:np.searchsorted(x, np.inf)]      # NaNs sort last; ±inf are dropped too
+    x = x[np.searchsorted(x, -np.inf, side="right"):]
+    x.setflags(write=False)
+    q1, q3 = np.quantile(x, [0.25, 0.75]) if x.size else (np.nan, np.nan)
+    return SortedData(values=x, n=x.size, min=x[0] if x.size else np.nan,
+                      max=x[-1] if x.size else np.nan, sd=np.sqrt(_describe.moments(x).var),
+                      q1=q1, q3=q3)
+
+
+def _equal_width(data, k):
+    k = int(np.clip(k, 1, MAX_BINS))
+    if data.max == data.min:
+        return np.array([data.min - 0.5, data.max + 0.5])
+    return np.linspace(data.min, data.max, k + 1)
+
+
+def _from_width(data, h):
+    if not np.isfinite(h) or h <= 0:
+        return _equal_width(data, 1 + np.log2(data.n))
+    return _equal_width(data, np.ceil((data.max - data.min) / h))
+
+
+def _bayesian_blocks(data, p0=P0):
+    x = data.values
+    uniq = np.unique(x) if x.size else x
+    if uniq.size <= BLOCK_CELLS:
+        # One cell per distinct value, bounded halfway to its neighbours
+        cell_edges = np.r_[uniq[0], (uniq[1:] + uniq[:-1]) / 2, uniq[-1]]
+        counts = np.diff(np.searchsorted(x, np.r_[uniq, np.inf]))
+    else:
+        cell_edges = np.linspace(data.min, data.max, BLOCK_CELLS + 1)
+        counts = _counts(x, cell_edges)
+    m = counts.size
+    if m < 2:
+        return _equal_width(data, 1)
+    ncp_prior = 4 - np.log(73.53 * p0 * data.n**-0.478)
+    cum = np.r_[0, np.cumsum(counts)].astype(float)
+    best = np.zeros(m)
+    last = np.zeros(m, dtype=np.int64)
+    for r in range(m):
+        # Fitness of a final block spanning cells i..r, for every start i
+        n_k = cum[r + 1] - cum[:r + 1]
+        width = cell_edges[r + 1] - cell_edges[:r + 1]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            fit = np.where(n_k > 0, n_k * (np.log(n_k) - np.log(width)), 0.0)
+        fit = np.where(width > 0, fit, -np.inf) - ncp_prior
+        fit[1:] += best[:r]
+        last[r] = np.argmax(fit)
+        best[r] = fit[last[r]]
+    starts, r = [], m
+    while r > 0:
+        starts.append(last[r - 1])
+        r = last[r - 1]
+    return cell_edges[np.r_[starts[::-1], m]]
+
+
+def bin_edges(data, rule, k=8):
+    """Bin edges of ``data`` (``SortedData``) under ``rule``; ``k`` is for "fixed"."""
+    if data.n == 0:
+        return np.array([0.0, 1.0])
+    if rule == "sturges":
+        return _equal_width(data, np.ceil(1 + np.log2(data.n)))
+    if rule == "scott":
+        return _from_width(data, 3.49 * data.sd * data.n ** (-1 / 3))
+    if rule == "fd":
+        return _from_width(data, 2 * (data.q3 - data.q1) * data.n ** (-1 / 3))
+    if rule == "bayesian_blocks":
+        return _bayesian_blocks(data)
+    if rule == "fixed":
+        return _equal_width(data, k)
+    raise ValueError(f"Unknown bin rule: {rule!r}")
+
+
+def _counts(x, edges):
+    """Counts in [e₀, e₁), …, [e_{k−1}, e_k] of sorted ``x``."""
+    pos = np.searchsorted(x, edges, side="left")
+    pos[-1] = np.searchsorted(x, edges[-1], side="right")
+    return np.diff(pos)
+
+
+def frequency_table(data, edges):
+    """Class limits, midpoints and absolute/relative/cumulative frequencies."""
+    edges = np.asarray(edges, dtype=float)
+    f = _counts(data.values, edges)
+    cf = np.cumsum(f)
+    n = max(data.n, 1)
+    return pd.DataFrame({
+        "Lower": edges[:-1], "Upper": edges[1:], "Midpoint": (edges[:-1] + edges[1:]) / 2,
+        "Width": np.diff(edges), "Frequency": f, "Relative": f / n,
+        "Cumulative": cf, "Cumulative relative": cf / n,
+    })
+
+
+@lru_cache(maxsize=1)
+def exam_scores():
+    """``SortedData`` of the page's 100 seeded exam scores."""
+    rs = np.random.RandomState(7)
+    data = np.concatenate([rs.normal(70, 10, 80), rs.normal(85, 5, 20)])
+    return prepare(np.clip(data, 40, 100).round(0))
+
+
+@lru_cache(maxsize=8)
+def simulated(n, seed=7):
+    """``SortedData`` of a seeded right-skewed mixture of ``n`` values."""
+    rng = np.random.default_rng(seed)
+    heavy = rng.random(n) < 0.15
+    return prepare(np.where(heavy, rng.lognormal(4.6, 0.35, n), rng.normal(70, 10, n)))
+
+
+@st.cache_resource(max_entries=8, show_spinner="Sorting the column…")
+def upload_sorted(file_id, name, col, _uploaded):
+    """``SortedData`` of one uploaded column (shared across reruns; read-only)."""
+    return prepare(_uploads.read_table(_uploaded, columns=[col])[col].to_numpy(dtype=float, na_value=np.nan))
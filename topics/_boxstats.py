@@ -0,0 +1,241 @@
+"""Server-side box-plot statistics for one or many groups.
+
+Quartiles, Tukey whiskers and outliers are computed here and handed to
+Plotly as precomputed ``q1/median/q3/lowerfence/upperfence`` arrays, so the
+browser draws every box from five numbers instead of binning the raw data.
+All groups share a single ``go.Box`` trace, and outliers go into one marker trace
+(WebGL when large) capped at ``MAX_OUTLIERS`` points per group.
+
+In memory, values are grouped with one stable argsort of the group codes,
+and each group's quartiles come from a linear-time selection
+(``np.quantile``).  Streams too large to keep take two passes.  The first
+folds each group into a mergeable ``_describe.TDigest`` to fix the quartiles
+and fences.  The second finds the whisker ends (the most extreme values
+inside the fences) and samples the outliers.
+"""
+from collections import namedtuple
+
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+import streamlit as st
+
+from topics import _describe, _render, _uploads
+
+WHISKER = 1.5
+MAX_OUTLIERS = 200          # outlier points drawn per group; the count is always exact
+EXACT_MAX = _describe.EXACT_MAX
+SEED = 0
+
+BoxStats = namedtuple("BoxStats", [
+    "name", "n", "mean", "q1", "median", "q3", "lowerfence", "upperfence",
+    "outliers", "n_outliers", "method",
+])
+
+
+def _group_slices(values, groups):
+    """(name, values) per group, in order of first appearance; NaN values dropped."""
+    values = np.asarray(values, dtype=float)
+    if groups is None:
+        values = values[np.isfinite(values)]
+        return [("All", values)] if values.size else []
+    codes, names = pd.factorize(np.asarray(groups), sort=False)
+    keep = np.isfinite(values) & (codes >= 0)
+    codes, values = codes[keep], values[keep]
+    order = np.argsort(codes, kind="stable")
+    bounds = np.searchsorted(codes[order], np.arange(len(names) + 1))
+    sorted_values = values[order]
+    return [(str(name), sorted_values[bounds[i]:bounds[i + 1]]) for i, name in enumerate(names)
+            if bounds[i + 1] > bounds[i]]
+
+
+def _group_labels(kind):
+    """Converter from one chunk's group column to string labels, chosen once from the schema ``kind``.
+
+    Per-chunk dtypes vary: an integer column with nulls arrives as float64 in
+    the chunks that contain them, which would split group "1" from "1.0".
+    """
+    if kind.startswith(("int", "uint")):
+        return lambda g: g.astype("Int64").astype("string")
+    if kind.startswith(("float", "double")):
+        return lambda g: g.astype("float64").astype("string")
+    return lambda g: g.astype("string")
+
+
+def _sample_outliers(out, rng, limit=MAX_OUTLIERS):
+    """At most ``limit`` outliers, always including the two most extreme."""
+    if out.size <= limit:
+        return out
+    ends = [out.argmin(), out.argmax()]
+    rest = np.delete(out, ends)
+    pick = rng.choice(rest.size, size=limit - 2, replace=False)
+    return np.r_[out[ends], rest[pick]]
+
+
+def _finish(name, n, mean, q1, med, q3, inside_lo, inside_hi, outliers, n_out, method):
+    return BoxStats(name=name, n=int(n), mean=float(mean), q1=float(q1), median=float(med),
+                    q3=float(q3), lowerfence=float(inside_lo), upperfence=float(inside_hi),
+                    outliers=outliers, n_outliers=int(n_out), method=method)
+
+
+def box_stats(values, groups=None, whisker=WHISKER, seed=SEED):
+    """Exact ``BoxStats`` for every group of an in-memory column.
+
+    ``lowerfence``/``upperfence`` are the whisker ends, as in Plotly: the
+    most extreme observations within ``whisker`` × IQR of the box.
+    """
+    rng = np.random.default_rng(seed)
+    stats = []
+    for name, x in _group_slices(values, groups):
+        q1, med, q3 = np.quantile(x, [0.25, 0.5, 0.75])
+        lo, hi = q1 - whisker * (q3 - q1), q3 + whisker * (q3 - q1)
+        inside = (x >= lo) & (x <= hi)
+        out = x[~inside]
+        stats.append(_finish(name, x.size, x.mean(), q1, med, q3, x[inside].min(), x[inside].max(),
+                             _sample_outliers(out, rng), out.size, "exact"))
+    return stats
+
+
+class StreamingBox:
+    """Two-pass box statistics over chunks of (values, groups).
+
+    Call ``update`` on every chunk, then ``scan`` on every chunk again, then
+    ``result``.  Instances built over disjoint parts of the data can be
+    combined with ``merge`` after either pass.
+    """
+
+    def __init__(self, whisker=WHISKER, seed=SEED):
+        self.whisker = whisker
+        self.rng = np.random.default_rng(seed)
+        self.digests, self.moments = {}, {}
+        self.fences = None
+        self.inside, self.outliers, self.n_out = {}, {}, {}
+
+    def update(self, values, groups=None):
+        """First pass: fold a chunk into each group's digest and moments."""
+        for name, x in _group_slices(values, groups):
+            self.digests.setdefault(name, _describe.TDigest()).update(x)
+            self.moments.setdefault(name, _describe.Moments()).update(x)
+        return self
+
+    def _fix_fences(self):
+        self.fences = {}
+        for name, digest in self.digests.items():
+            q1, med, q3 = digest.quantile([0.25, 0.5, 0.75])
+            iqr = q3 - q1
+            self.fences[name] = (q1, med, q3, q1 - self.whisker * iqr, q3 + self.whisker * iqr)
+
+    def scan(self, values, groups=None):
+        """Second pass: whisker ends and outliers of a chunk, against the fixed fences."""
+        if self.fences is None:
+            self._fix_fences()
+        for name, x in _group_slices(values, groups):
+            _, _, _, lo, hi = self.fences[name]
+            inside = (x >= lo) & (x <= hi)
+            if inside.any():
+                a, b = self.inside.get(name, (np.inf, -np.inf))
+                self.inside[name] = (min(a, x[inside].min()), max(b, x[inside].max()))
+            out = x[~inside]
+            self.n_out[name] = self.n_out.get(name, 0) + out.size
+            kept = np.r_[self.outliers.get(name, np.empty(0)), out]
+            self.outliers[name] = _sample_outliers(kept, self.rng)
+        return self
+
+    def merge(self, other):
+        """Combine with the state of a disjoint part of the data (in place)."""
+        for name, d in other.digests.items():
+            self.digests.setdefault(name, _describe.TDigest()).merge(d)
+            self.moments.setdefault(name, _describe.Moments()).merge(other.moments[name])
+        for name, (a, b) in other.inside.items():
+            c, d = self.inside.get(name, (np.inf, -np.inf))
+            self.inside[name] = (min(a, c), max(b, d))
+        for name, out in other.outliers.items():
+            self.n_out[name] = self.n_out.get(name, 0) + other.n_out[name]
+            self.outliers[name] = _sample_outliers(np.r_[self.outliers.get(name, np.empty(0)), out], self.rng)
+        return self
+
+    def result(self):
+        if self.fences is None:
+            self._fix_fences()
+        stats = []
+        for name, (q1, med, q3, _, _) in self.fences.items():
+            m = self.moments[name]
+            lo, hi = self.inside.get(name, (q1, q3))
+            stats.append(_finish(name, m.n, m.mean, q1, med, q3, lo, hi,
+                                 self.outliers.get(name, np.empty(0)), self.n_out.get(name, 0), "t-digest"))
+        return stats
+
+
+@st.cache_data(max_entries=8, show_spinner="Simulating groups…")
+def simulated_box_stats(k, per, seed=42):
+    """``BoxStats`` of ``k`` seeded groups of ``per`` points, named G000, G001, …
+
+    Group centres drift upward and every fifth group has heavy (t₃) tails.
+    Groups are passed as integer codes; the labels are only attached to the
+    k results.
+    """
+    rng = np.random.default_rng(seed)
+    groups = np.repeat(np.arange(k), per)
+    noise = np.where(groups % 5 == 0, rng.standard_t(3, groups.size), rng.normal(0, 1, groups.size))
+    values = 50 + 0.2 * groups + 5 * noise
+    return [s._replace(name=f"G{int(s.name):03d}") for s in box_stats(values, groups)]
+
+
+@st.cache_data(max_entries=16, show_spinner="Streaming through the file…")
+def upload_box_stats(file_id, name, value_col, group_col, _uploaded):
+    """``BoxStats`` per group of an upload, read chunk by chunk.
+
+    Values are kept for exact quartiles up to ``EXACT_MAX`` rows; past that
+    they are folded into a ``StreamingBox`` and the file is read a second
+    time against the sketch-based fences.
+    """
+    cols = [value_col] + ([group_col] if group_col else [])
+    labels = _group_labels(_uploads.column_type(_uploaded, group_col)) if group_col else None
+
+    def chunks():
+        for c in _uploads.iter_chunks(_uploaded, cols):
+            yield c[value_col].to_numpy(dtype=float, na_value=np.nan), (labels(c[group_col]) if group_col else None)
+
+    kept, size, box = [], 0, None
+    for values, groups in chunks():
+        if box is not None:
+            box.update(values, groups)
+            continue
+        kept.append((values, groups))
+        size += values.size
+        if size > EXACT_MAX:
+            box = StreamingBox()
+            for v, g in kept:
+                box.update(v, g)
+            kept = None
+    if box is None:
+        if not kept:
+            return []
+        values = np.concatenate([v for v, _ in kept])
+        groups = pd.concat([g for _, g in kept], ignore_index=True) if group_col else None
+        return box_stats(values, groups)
+    for values, groups in chunks():
+        box.scan(values, groups)
+    return box.result()
+
+
+def traces(stats, color='#667eea', colors=None):
+    """Plotly traces for precomputed ``stats``: the boxes plus one outlier trace.
+
+    With ``colors`` (one per group) each box gets its own trace; otherwise all
+    boxes share one trace, which stays light for hundreds of groups.
+    """
+    names = [s.name for s in stats]
+    fields = {f: [getattr(s, f) for s in stats] for f in ("q1", "median", "q3", "lowerfence", "upperfence", "mean")}
+    if colors is None:
+        boxes = [go.Box(x=names, **fields, marker_color=color, boxpoints=False, name="Groups", showlegend=False)]
+    else:
+        boxes = [go.Box(x=[s.name], **{f: [v[i]] for f, v in fields.items()}, marker_color=c,
+                        boxpoints=False, name=s.name)
+                 for i, (s, c) in enumerate(zip(stats, colors))]
+    out_x = np.concatenate([np.repeat(s.name, s.outliers.size) for s in stats]) if stats else []
+    out_y = np.concatenate([s.outliers for s in stats]) if stats else []
+    scatter = go.Scattergl if len(out_y) > _render.GL_MIN_POINTS else go.Scatter
+    outliers = scatter(x=out_x, y=np.asarray(out_y, dtype=np.float32), mode='markers',
+                       marker=dict(color='#dc2626', size=5, opacity=0.7), name='Outliers')
+    return boxes + [outliers]
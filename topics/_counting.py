@@ -0,0 +1,184 @@
+"""Exact and approximate counting for n up to ``N_MAX``.
+
+Every count on the page is a ratio of factorials (or a power n^r), so:
+
+* its **magnitude** comes from log-gamma in O(1), which is all a rerun
+  needs to show it in scientific form;
+* its **exact value** is assembled from prime exponents: Legendre's formula
+  gives the exponent of each prime p ≤ n in n! as Σₖ ⌊n/pᵏ⌋, vectorized over
+  a cached sieve, and quotients of factorials just subtract exponent
+  vectors.  The product of pᵉ is taken as a balanced tree in ``decimal``
+  (libmpdec multiplies large operands with a number-theoretic transform),
+  which also makes printing the digits linear instead of the quadratic
+  ``int → str`` conversion.  Exact digits are only built on request and are
+  cached per count.
+
+Rows of Pascal's triangle are streamed with the multiplicative recurrence
+C(n, k+1) = C(n, k)·(n − k)/(k + 1), and memoized up to ``ROW_MAX``.
+"""
+import decimal
+from collections import namedtuple
+from functools import lru_cache
+
+import numpy as np
+from scipy.special import gammaln
+
+N_MAX = 100_000
+ROW_MAX = 5_000                 # largest Pascal row materialized exactly
+DIGITS_INLINE = 2_000           # digits shown in full; longer values are abbreviated
+_LN10 = np.log(10)
+_CTX = decimal.Context(prec=decimal.MAX_PREC, Emax=decimal.MAX_EMAX, Emin=decimal.MIN_EMIN)
+
+Count = namedtuple("Count", ["kind", "args"])
+
+KINDS = {
+    "perm": "P(n, r) = n!/(n−r)!",
+    "power": "n^r (repetition allowed)",
+    "circular": "(n−1)! circular arrangements",
+    "multiset": "n!/(n₁!⋯nₖ!) with repeated items",
+    "comb": "C(n, r) = n!/(r!(n−r)!)",
+    "multinomial": "n!/(n₁!⋯nₖ!) partitions",
+}
+
+
+def count(kind, *args):
+    """A ``Count`` of ``kind`` (see ``KINDS``); ``args`` are ints or a tuple of parts.
+
+    Raises ``ValueError`` for arguments outside the formula's domain.
+    """
+    args = tuple(tuple(int(v) for v in a) if isinstance(a, (tuple, list)) else int(a) for a in args)
+    if kind in ("perm", "comb"):
+        n, r = args
+        if not 0 <= r <= n <= N_MAX:
+            raise ValueError(f"Need 0 ≤ r ≤ n ≤ {N_MAX:,}.")
+    elif kind == "power":
+        n, r = args
+        if not (0 <= n <= N_MAX and 0 <= r <= N_MAX):
+            raise ValueError(f"Need 0 ≤ n, r ≤ {N_MAX:,}.")
+    elif kind == "circular":
+        if not 1 <= args[0] <= N_MAX:
+            raise ValueError(f"Need 1 ≤ n ≤ {N_MAX:,}.")
+    elif kind in ("multiset", "multinomial"):
+        parts = args[0]
+        if not parts or min(parts) < 0 or sum(parts) > N_MAX:
+            raise ValueError(f"Need non-negative group sizes with a total of at most {N_MAX:,}.")
+    else:
+        raise ValueError(f"Unknown count: {kind!r}")
+    return Count(kind, args)
+
+
+def _lfact(n):
+    return gammaln(np.asarray(n, dtype=float) + 1)
+
+
+def log10(c):
+    """log₁₀ of the count, from log-gamma (O(1) per factorial)."""
+    k, a = c.kind, c.args
+    if k == "perm":
+        ln = _lfact(a[0]) - _lfact(a[0] - a[1])
+    elif k == "comb":
+        ln = _lfact(a[0]) - _lfact(a[1]) - _lfact(a[0] - a[1])
+    elif k == "power":
+        return a[1] * np.log10(a[0]) if a[0] else (0.0 if a[1] == 0 else -np.inf)
+    elif k == "circular":
+        ln = _lfact(a[0] - 1)
+    else:
+        ln = _lfact(sum(a[0])) - _lfact(np.array(a[0])).sum()
+    return float(ln / _LN10)
+
+
+def scientific(c, sig=6):
+    """The count as "m.mmmmm × 10^e" (or exactly, with separators, if small)."""
+    lg = log10(c)
+    if lg == -np.inf:
+        return "0"
+    if lg < 15:
+        return f"{int(exact(c)):,}"
+    e = int(np.floor(lg))
+    return f"{10 ** (lg - e):.{sig - 1}f} × 10^{e:,}"
+
+
+def n_digits(c):
+    lg = log10(c)
+    return 1 if lg <= 0 else int(np.floor(lg + 1e-9)) + 1
+
+
+@lru_cache(maxsize=1)
+def _primes():
+    sieve = np.ones(N_MAX + 1, dtype=bool)
+    sieve[:2] = False
+    for p in range(2, int(N_MAX**0.5) + 1):
+        if sieve[p]:
+            sieve[p * p::p] = False
+    return np.flatnonzero(sieve)
+
+
+def _fact_exponents(n):
+    """Exponent of every prime in n! (Legendre's formula), aligned with ``_primes()``."""
+    primes = _primes()
+    e = np.zeros(primes.size, dtype=np.int64)
+    pk = primes.copy()
+    live = pk <= n
+    while live.any():
+        e[live] += n // pk[live]
+        pk[live] *= primes[live]
+        live &= pk <= n
+    return e
+
+
+def _exponents(c):
+    k, a = c.kind, c.args
+    if k == "perm":
+        return _fact_exponents(a[0]) - _fact_exponents(a[0] - a[1])
+    if k == "comb":
+        return _fact_exponents(a[0]) - _fact_exponents(a[1]) - _fact_exponents(a[0] - a[1])
+    if k == "circular":
+        return _fact_exponents(a[0] - 1)
+    if k == "power":
+        primes, n, e = _primes(), a[0], np.zeros(_primes().size, dtype=np.int64)
+        for i in np.flatnonzero(n % primes[primes <= max(n, 1)] == 0):
+            while n % primes[i] == 0:
+                n //= primes[i]
+                e[i] += 1
+        return e * a[1]
+    return _fact_exponents(sum(a[0])) - sum(_fact_exponents(p) for p in a[0])
+
+
+def _product(factors):
+    while len(factors) > 1:
+        paired = [_CTX.multiply(factors[i], factors[i + 1]) for i in range(0, len(factors) - 1, 2)]
+        factors = paired + ([factors[-1]] if len(factors) % 2 else [])
+    return factors[0] if factors else decimal.Decimal(1)
+
+
+@lru_cache(maxsize=32)
+def exact(c):
+    """All decimal digits of the count, as a string."""
+    if c.kind == "power" and c.args[0] == 0:
+        return "1" if c.args[1] == 0 else "0"
+    e = _exponents(c)
+    nz = np.flatnonzero(e)
+    return str(_product([_CTX.power(decimal.Decimal(int(p)), int(k)) for p, k in zip(_primes()[nz], e[nz])]))
+
+
+def binomial_row(n):
+    """Yield C(n, 0), …, C(n, n) as exact ints, one multiplication/division each."""
+    c = 1
+    yield c
+    for k in range(n):
+        c = c * (n - k) // (k + 1)
+        yield c
+
+
+@lru_cache(maxsize=64)
+def pascal_row(n):
+    """Row n of Pascal's triangle as a tuple of ints (n ≤ ``ROW_MAX``)."""
+    if not 0 <= n <= ROW_MAX:
+        raise ValueError(f"Need 0 ≤ n ≤ {ROW_MAX:,}.")
+    return tuple(binomial_row(n))
+
+
+def log10_row(n):
+    """log₁₀ C(n, k) for k = 0…n, vectorized with log-gamma."""
+    k = np.arange(n + 1)
+    return (_lfact(n) - _lfact(k) - _lfact(n - k)) / _LN10
@@ -0,0 +1,96 @@
+"""Monte Carlo coverage of z and t confidence intervals for a mean.
+
+Each chunk draws a (reps, n) matrix from the population and reduces it to
+row means and standard deviations, so every interval in the chunk comes from
+the same two vectorized reductions.  Chunks hold at most ``CHUNK_ELEMENTS``
+draws, which bounds memory whatever the number of repetitions.  Only the
+per-repetition hit flags (one bool per interval and method) and the first
+``DANCE_SIZE`` intervals are kept.
+
+Three intervals are compared on the same samples:
+
+* ``z``    x̄ ± z* σ/√n with the true σ (exact for a normal population)
+* ``z_s``  x̄ ± z* s/√n, the large-sample shortcut that undercovers for small n
+* ``t``    x̄ ± t*₍ₙ₋₁₎ s/√n
+"""
+from collections import namedtuple
+
+import numpy as np
+
+from topics import _engine
+
+SEED = 2024
+CHUNK_ELEMENTS = 2_000_000          # draws held in memory at once
+DANCE_SIZE = 100                    # intervals kept for the "dance" chart
+CURVE_POINTS = 1_000                # running-coverage points returned per method
+
+Population = namedtuple("Population", ["label", "mean", "sd", "draw"])
+CoverageResult = namedtuple("CoverageResult", [
+    "population", "n", "level", "reps", "coverage", "curve_x", "curves",
+    "dance_means", "dance_low", "dance_high",
+])
+
+POPULATIONS = {
+    "normal": Population("Normal (μ = 50, σ = 10)", 50.0, 10.0,
+                         lambda rng, size: rng.normal(50.0, 10.0, size)),
+    "uniform": Population("Uniform (0, 100)", 50.0, 100 / np.sqrt(12),
+                          lambda rng, size: rng.uniform(0.0, 100.0, size)),
+    "exponential": Population("Exponential (mean = 10)", 10.0, 10.0,
+                              lambda rng, size: rng.exponential(10.0, size)),
+    "lognormal": Population("Log-normal (μ_log = 3, σ_log = 0.8)",
+                            float(np.exp(3 + 0.8**2 / 2)),
+                            float(np.sqrt((np.exp(0.8**2) - 1) * np.exp(2 * 3 + 0.8**2))),
+                            lambda rng, size: rng.lognormal(3.0, 0.8, size)),
+}
+METHODS = {
+    "z": "z, σ known",
+    "z_s": "z with s plugged in",
+    "t": "t with s",
+}
+
+
+def critical_values(n, level):
+    """Two-sided z* and t*₍ₙ₋₁₎ for ``level``."""
+    q = 1 - (1 - level) / 2
+    return _engine.ppf("norm", q), _engine.ppf("t", q, n - 1)
+
+
+def simulate(population, n, reps, level=0.95, seed=SEED, progress=None):
+    """Coverage of every method in ``METHODS`` over ``reps`` samples of size ``n``.
+
+    ``progress(fraction, message)`` is called after each chunk.
+    """
+    pop = POPULATIONS[population]
+    rng = np.random.default_rng(seed)
+    z_star, t_star = critical_values(n, level)
+    half_sigma = z_star * pop.sd / np.sqrt(n)
+    rows = max(1, CHUNK_ELEMENTS // n)
+    hits = {m: np.empty(reps, dtype=bool) for m in METHODS}
+    dance = []
+    for start in range(0, reps, rows):
+        size = min(rows, reps - start)
+        sample = pop.draw(rng, (size, n))
+        means = sample.mean(axis=1)
+        se = sample.std(axis=1, ddof=1) / np.sqrt(n)
+        miss = np.abs(means - pop.mean)
+        block = slice(start, start + size)
+        hits["z"][block] = miss <= half_sigma
+        hits["z_s"][block] = miss <= z_star * se
+        hits["t"][block] = miss <= t_star * se
+        if start < DANCE_SIZE:
+            keep = min(size, DANCE_SIZE - start)
+            dance.append((means[:keep], se[:keep]))
+        if progress:
+            progress((start + size) / reps, f"{start + size:,} / {reps:,} samples")
+
+    curve_x = np.unique(np.geomspace(1, reps, min(CURVE_POINTS, reps)).astype(int))
+    curves = {m: np.cumsum(h)[curve_x - 1] / curve_x for m, h in hits.items()}
+    means, se = (np.concatenate(parts) for parts in zip(*dance))
+    half = {"z": np.full_like(means, half_sigma), "z_s": z_star * se, "t": t_star * se}
+    return CoverageResult(
+        population=population, n=n, level=level, reps=reps,
+        coverage={m: float(h.mean()) for m, h in hits.items()},
+        curve_x=curve_x, curves=curves, dance_means=means,
+        dance_low={m: means - h for m, h in half.items()},
+        dance_high={m: means + h for m, h in half.items()},
+    )
@@ -0,0 +1,227 @@
+"""Descriptive statistics of one numeric column of any size.
+
+``Moments`` holds n, the mean and the centred power sums M₂, M₃, M₄ of a
+chunk and merges disjoint chunks with the pairwise update of Chan et al.
+(extended to the third and fourth moments by Pébay), so mean, variance,
+skewness and kurtosis come from one read of the data without the
+cancellation of raw power sums.  Large in-memory arrays are cut into blocks
+whose moments are computed on a thread pool (NumPy releases the GIL in the
+reductions) and then merged.
+
+Quantiles are exact (``np.quantile``, a linear-time selection) while the
+values fit under ``EXACT_MAX``; past that, a streaming upload keeps only a
+``TDigest`` sketch, which is also mergeable across chunks.
+"""
+import os
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import streamlit as st
+
+from topics import _uploads
+
+BLOCK = 1 << 20                 # values per block of the parallel moment pass
+MAX_WORKERS = min(8, os.cpu_count() or 1)
+EXACT_MAX = 5_000_000           # keep values for exact quantiles up to this many
+PERCENTILES = (1, 5, 10, 25, 50, 75, 90, 95, 99)
+
+Summary = namedtuple("Summary", [
+    "n", "mean", "var", "sd", "skew", "kurtosis", "min", "max", "percentiles", "quantile_method",
+])
+
+
+class Moments:
+    """Running (n, mean, M₂, M₃, M₄) and range of a stream of values."""
+
+    def __init__(self):
+        self.n = 0
+        self.mean = self.m2 = self.m3 = self.m4 = 0.0
+        self.min, self.max = np.inf, -np.inf
+
+    def update(self, x):
+        """Fold one chunk of values (NaNs dropped) into the running moments."""
+        x = np.asarray(x, dtype=float).ravel()
+        x = x[np.isfinite(x)]
+        if x.size == 0:
+            return self
+        chunk = Moments()
+        chunk.n = x.size
+        chunk.mean = x.mean()
+        d = x - chunk.mean
+        d2 = d * d
+        chunk.m2, chunk.m3, chunk.m4 = d2.sum(), d2 @ d, d2 @ d2
+        chunk.min, chunk.max = x.min(), x.max()
+        return self.merge(chunk)
+
+    def merge(self, other):
+        """Combine with moments of a disjoint chunk (in place)."""
+        if other.n == 0:
+            return self
+        na, nb = self.n, other.n
+        n = na + nb
+        d = other.mean - self.mean
+        dn = d / n
+        m2 = self.m2 + other.m2 + d * dn * na * nb
+        m3 = (self.m3 + other.m3 + d * dn * dn * na * nb * (na - nb)
+              + 3 * dn * (na * other.m2 - nb * self.m2))
+        m4 = (self.m4 + other.m4 + d * dn**3 * na * nb * (na * na - na * nb + nb * nb)
+              + 6 * dn * dn * (na * na * other.m2 + nb * nb * self.m2)
+              + 4 * dn * (na * other.m3 - nb * self.m3))
+        self.n, self.mean, self.m2, self.m3, self.m4 = n, self.mean + dn * nb, m2, m3, m4
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        return self
+
+    @classmethod
+    def from_chunks(cls, chunks):
+        m = cls()
+        for x in chunks:
+            m.update(x)
+        return m
+
+    @property
+    def var(self):
+        """Sample variance s² (n − 1 denominator)."""
+        return self.m2 / (self.n - 1) if self.n > 1 else np.nan
+
+    @property
+    def skew(self):
+        """Moment coefficient of skewness g₁ = m₃ / m₂^{3/2}."""
+        return np.sqrt(self.n) * self.m3 / self.m2**1.5 if self.m2 > 0 else np.nan
+
+    @property
+    def kurtosis(self):
+        """Excess kurtosis g₂ = m₄ / m₂² − 3."""
+        return self.n * self.m4 / self.m2**2 - 3 if self.m2 > 0 else np.nan
+
+
+def moments(x, workers=MAX_WORKERS):
+    """``Moments`` of an array, computed blockwise across ``workers`` threads."""
+    x = np.asarray(x, dtype=float).ravel()
+    if x.size <= 2 * BLOCK or workers <= 1:
+        return Moments().update(x)
+    blocks = [x[i:i + BLOCK] for i in range(0, x.size, BLOCK)]
+    with ThreadPoolExecutor(workers) as pool:
+        parts = list(pool.map(lambda b: Moments().update(b), blocks))
+    total = Moments()
+    for part in parts:
+        total.merge(part)
+    return total
+
+
+class TDigest:
+    """Mergeable quantile sketch (merging t-digest with the k₁ scale function).
+
+    Centroids are re-clustered in one vectorized pass: after sorting, each
+    centroid is assigned to the integer bucket of k(q) = δ/2π·asin(2q − 1)
+    at its left cumulative weight, and buckets are collapsed with
+    ``np.add.reduceat``.  Buckets are narrow in q near 0 and 1, so tail
+    quantiles stay accurate; the sketch holds about δ/2 centroids.
+    """
+
+    def __init__(self, compression=500):
+        self.compression = compression
+        self.means = np.empty(0)
+        self.weights = np.empty(0)
+        self.min, self.max = np.inf, -np.inf
+
+    @property
+    def n(self):
+        return float(self.weights.sum())
+
+    def _cluster(self, means, weights):
+        """Collapse sorted centroids into k-scale buckets."""
+        cum = np.cumsum(weights)
+        q_left = (cum - weights) / cum[-1]
+        k = self.compression / (2 * np.pi) * np.arcsin(2 * q_left - 1)
+        bucket = np.floor(k - k[0]).astype(np.int64)
+        starts = np.flatnonzero(np.r_[True, bucket[1:] != bucket[:-1]])
+        w = np.add.reduceat(weights, starts)
+        self.means = np.add.reduceat(means * weights, starts) / w
+        self.weights = w
+        return self
+
+    def _absorb(self, means, weights):
+        means = np.concatenate([self.means, means])
+        weights = np.concatenate([self.weights, weights])
+        order = np.argsort(means, kind="stable")
+        return self._cluster(means[order], weights[order])
+
+    def update(self, x):
+        """Add a chunk of raw values (NaNs dropped)."""
+        x = np.asarray(x, dtype=float).ravel()
+        x = x[np.isfinite(x)]
+        if x.size == 0:
+            return self
+        # Sorting raw values is cheaper than an argsort; the chunk is collapsed
+        # to its own digest first, so only ~δ/2 centroids meet the existing ones
+        x = np.sort(x)
+        chunk = TDigest(self.compression)._cluster(x, np.ones(x.size))
+        chunk.min, chunk.max = x[0], x[-1]
+        return self.merge(chunk)
+
+    def merge(self, other):
+        """Fold in another digest (in place)."""
+        if other.weights.size == 0:
+            return self
+        self.min, self.max = min(self.min, other.min), max(self.max, other.max)
+        return self._absorb(other.means, other.weights)
+
+    def quantile(self, q):
+        """Approximate quantile(s) at ``q`` in [0, 1], interpolating between centroids."""
+        cum = np.cumsum(self.weights)
+        centres = cum - self.weights / 2
+        ranks = np.r_[0.0, centres, cum[-1]]
+        values = np.r_[self.min, self.means, self.max]
+        return np.interp(np.asarray(q, dtype=float) * cum[-1], ranks, values)
+
+
+def _summary(m, quantiles, method):
+    return Summary(
+        n=m.n, mean=m.mean, var=m.var, sd=np.sqrt(m.var), skew=m.skew, kurtosis=m.kurtosis,
+        min=m.min, max=m.max, percentiles=dict(zip(PERCENTILES, map(float, quantiles))),
+        quantile_method=method,
+    )
+
+
+def summarize(x):
+    """``Summary`` of an in-memory array, with exact percentiles (non-finite values dropped; NaN when none are left)."""
+    x = np.asarray(x, dtype=float).ravel()
+    x = x[np.isfinite(x)]
+    q = np.array(PERCENTILES) / 100
+    if x.size == 0:
+        return _summary(moments(x), q * np.nan, "exact")
+    return _summary(moments(x), np.quantile(x, q), "exact")
+
+
+def summarize_chunks(chunks):
+    """``Summary`` of a stream of chunks in bounded memory.
+
+    Values are kept for exact percentiles until more than ``EXACT_MAX`` have
+    been seen; from then on only the t-digest is retained.
+    """
+    m, digest, kept, size = Moments(), TDigest(), [], 0
+    for chunk in chunks:
+        chunk = np.asarray(chunk, dtype=float).ravel()
+        chunk = chunk[np.isfinite(chunk)]
+        m.merge(moments(chunk))
+        digest.update(chunk)
+        size += chunk.size
+        if kept is not None:
+            kept.append(chunk)
+            if size > EXACT_MAX:
+                kept = None
+    q = np.array(PERCENTILES) / 100
+    if size == 0:
+        return _summary(m, q * np.nan, "exact")
+    if kept is not None:
+        return _summary(m, np.quantile(np.concatenate(kept), q), "exact")
+    return _summary(m, digest.quantile(q), "t-digest")
+
+
+@st.cache_data(max_entries=16, show_spinner="Streaming through the file…")
+def upload_summary(file_id, name, col, _uploaded):
+    """``Summary`` of one column of an upload, read chunk by chunk."""
+    return summarize_chunks(c[col].to_numpy(dtype=float, na_value=np.nan)
+                            for c in _uploads.iter_chunks(_uploaded, [col]))
@@ -0,0 +1,150 @@
+"""Process-wide memoized distribution functions.
+
+Topic pages call ``_engine.cdf("t", x, df)`` instead of ``stats.t.cdf(x, df)``.
+Results are cached in an LRU keyed on (family, method, x, params) and bounded
+by total bytes (keys plus results), and the cache lives at module level so
+every Streamlit session served by the process shares it. Inputs larger than
+``MAX_CACHED_ELEMENTS`` or containing NaN are evaluated directly: NaN keys do
+not compare equal, so they could only miss. Scalars come back as ``float``;
+arrays come back as read-only ``ndarray`` because the same object is handed to
+every caller.
+"""
+import threading
+from collections import OrderedDict
+
+import numpy as np
+from scipy import stats
+
+MAX_BYTES = 16 * 1024 * 1024
+# Inputs larger than this are evaluated directly so the cache stays small.
+MAX_CACHED_ELEMENTS = 10_000
+
+FAMILIES = ("norm", "t", "chi2", "f", "nct", "ncf", "poisson", "binom", "geom", "uniform", "expon")
+
+
+def _freeze(value):
+    """Turn a scalar or array-like into a hashable key."""
+    arr = np.asarray(value, dtype=float)
+    if arr.ndim == 0:
+        return float(arr)
+    return (tuple(arr.ravel().tolist()), arr.shape)
+
+
+def _thaw(key):
+    if isinstance(key, float):
+        return key
+    values, shape = key
+    return np.array(values).reshape(shape)
+
+
+def _size(key):
+    return 1 if isinstance(key, float) else len(key[0])
+
+
+def _has_nan(key):
+    if isinstance(key, float):
+        return key != key
+    return any(v != v for v in key[0])
+
+
+def _compute(family, method, x, args, kwds):
+    if family not in FAMILIES:
+        raise ValueError(f"Unknown distribution family: {family!r}")
+    out = getattr(getattr(stats, family), method)(x, *args, **kwds)
+    if np.ndim(out) == 0:
+        return float(out)
+    out = np.asarray(out)
+    out.setflags(write=False)
+    return out
+
+
+_lock = threading.Lock()
+_results = OrderedDict()   # key -> (result, bytes)
+_bytes = 0
+_hits = 0
+_misses = 0
+
+
+def _cost(keys, result):
+    """Approximate bytes held by one entry: 8 per key element plus the result."""
+    return 8 * sum(keys) + (8 if isinstance(result, float) else result.nbytes)
+
+
+def _cached(family, method, x_key, arg_keys, kwd_keys):
+    global _bytes, _hits, _misses
+    key = (family, method, x_key, arg_keys, kwd_keys)
+    with _lock:
+        entry = _results.get(key)
+        if entry is not None:
+            _results.move_to_end(key)
+            _hits += 1
+            return entry[0]
+        _misses += 1
+    result = _compute(family, method, _thaw(x_key),
+                      tuple(_thaw(a) for a in arg_keys),
+                      {k: _thaw(v) for k, v in kwd_keys})
+    size = _cost([_size(k) for k in (x_key, *arg_keys, *(v for _, v in kwd_keys))], result)
+    with _lock:
+        if key not in _results:
+            _results[key] = (result, size)
+            _bytes += size
+            while _bytes > MAX_BYTES and len(_results) > 1:
+                _, (_, evicted) = _results.popitem(last=False)
+                _bytes -= evicted
+    return result
+
+
+def _evaluate(family, method, x, args, kwds):
+    # Size check first: freezing converts every element to a Python float
+    if np.size(x) + sum(np.size(a) for a in args) + sum(np.size(v) for v in kwds.values()) > MAX_CACHED_ELEMENTS:
+        return _compute(family, method, x, args, kwds)
+    x_key = _freeze(x)
+    arg_keys = tuple(_freeze(a) for a in args)
+    kwd_keys = tuple(sorted((k, _freeze(v)) for k, v in kwds.items()))
+    keys = (x_key, *arg_keys, *(v for _, v in kwd_keys))
+    if any(_has_nan(k) for k in keys):
+        return _compute(family, method, x, args, kwds)
+    return _cached(family, method, x_key, arg_keys, kwd_keys)
+
+
+def pdf(family, x, *args, **kwds):
+    """Probability density of ``family`` at ``x`` (scipy.stats argument order)."""
+    return _evaluate(family, "pdf", x, args, kwds)
+
+
+def pmf(family, k, *args, **kwds):
+    """Probability mass of ``family`` at ``k``."""
+    return _evaluate(family, "pmf", k, args, kwds)
+
+
+def cdf(family, x, *args, **kwds):
+    """P(X ≤ x)."""
+    return _evaluate(family, "cdf", x, args, kwds)
+
+
+def sf(family, x, *args, **kwds):
+    """P(X > x), computed directly rather than as 1 − cdf."""
+    return _evaluate(family, "sf", x, args, kwds)
+
+
+def ppf(family, q, *args, **kwds):
+    """Quantile function: the x with P(X ≤ x) = q."""
+    return _evaluate(family, "ppf", q, args, kwds)
+
+
+def isf(family, q, *args, **kwds):
+    """Inverse survival function: the x with P(X > x) = q."""
+    return _evaluate(family, "isf", q, args, kwds)
+
+
+def cache_info():
+    """Size and hit/miss statistics of the shared cache."""
+    with _lock:
+        return {"entries": len(_results), "bytes": _bytes, "hits": _hits, "misses": _misses}
+
+
+def cache_clear():
+    global _bytes, _hits, _misses
+    with _lock:
+        _results.clear()
+        _bytes = _hits = _misses = 0
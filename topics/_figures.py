@@ -0,0 +1,78 @@
+"""Server-side cache for Plotly figures that depend only on a few inputs.
+
+Figures are keyed on (topic, chart id, params) and stored as serialized JSON
+in a process-wide LRU bounded by total bytes, so every session and rerun that
+asks for the same chart skips building it.  Specs are rehydrated without
+re-validation: they were produced by a validated ``go.Figure`` to begin with,
+and validation is the expensive part of constructing a figure.
+"""
+import json
+import threading
+from collections import OrderedDict
+
+import plotly.graph_objects as go
+import plotly.io as pio
+import streamlit as st
+
+MAX_BYTES = 16 * 1024 * 1024
+
+_lock = threading.Lock()
+_specs = OrderedDict()   # key -> JSON string
+_bytes = 0
+_hits = 0
+_misses = 0
+
+
+def _key(topic, chart_id, params):
+    return (topic, chart_id, json.dumps(params, sort_keys=True, default=str))
+
+
+def _store(key, spec):
+    global _bytes
+    with _lock:
+        if key in _specs:
+            return
+        _specs[key] = spec
+        _bytes += len(spec)
+        while _bytes > MAX_BYTES and len(_specs) > 1:
+            _, evicted = _specs.popitem(last=False)
+            _bytes -= len(evicted)
+
+
+def get_spec(topic, chart_id, params, build):
+    """JSON spec for the chart, calling ``build()`` -> go.Figure on a miss."""
+    global _hits, _misses
+    key = _key(topic, chart_id, params)
+    with _lock:
+        spec = _specs.get(key)
+        if spec is not None:
+            _specs.move_to_end(key)
+            _hits += 1
+            return spec
+        _misses += 1
+    spec = pio.to_json(build(), validate=False)
+    _store(key, spec)
+    return spec
+
+
+def get_figure(topic, chart_id, params, build):
+    """A fresh ``go.Figure`` for the chart; safe for the caller to modify."""
+    spec = get_spec(topic, chart_id, params, build)
+    return go.Figure(json.loads(spec), _validate=False)
+
+
+def plotly_chart(topic, chart_id, params, build, **kwargs):
+    """``st.plotly_chart`` for a cached figure; ``kwargs`` go to Streamlit."""
+    st.plotly_chart(get_figure(topic, chart_id, params, build), **kwargs)
+
+
+def cache_info():
+    with _lock:
+        return {"entries": len(_specs), "bytes": _bytes, "hits": _hits, "misses": _misses}
+
+
+def cache_clear():
+    global _bytes, _hits, _misses
+    with _lock:
+        _specs.clear()
+        _bytes = _hits = _misses = 0
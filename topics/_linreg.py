@@ -0,0 +1,253 @@
+"""Simple linear regression from streamed sufficient statistics.
+
+``Moments`` accumulates n, the means of x and y and the centred sums
+Sxx, Syy, Sxy one chunk at a time.  These carry the same information as
+(n, Σx, Σy, Σx², Σxy, Σy²) but are merged with Chan's pairwise update, which
+avoids the cancellation that raw power sums suffer on large or offset data.
+Coefficients, the regression ANOVA table and both significance tests follow
+from the moments alone, so memory is O(1) in the number of rows.
+"""
+from collections import namedtuple
+from itertools import combinations
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from topics import _engine, _uploads
+
+SimpleRegression = namedtuple("SimpleRegression", [
+    "n", "b0", "b1", "r", "r_sq",
+    "sst", "ssr", "sse", "msr", "mse", "f", "p_f",
+    "se_b1", "t_b1", "p_t", "x_min", "x_max",
+])
+
+
+class Moments:
+    """Running (n, x̄, ȳ, Sxx, Syy, Sxy) for paired data, plus the x range."""
+
+    def __init__(self):
+        self.n = 0
+        self.mean_x = self.mean_y = 0.0
+        self.sxx = self.syy = self.sxy = 0.0
+        self.x_min, self.x_max = np.inf, -np.inf
+
+    def update(self, x, y):
+        """Fold one chunk of paired observations into the running moments."""
+        x = np.asarray(x, dtype=float)
+        y = np.asarray(y, dtype=float)
+        keep = np.isfinite(x) & np.isfinite(y)
+        x, y = x[keep], y[keep]
+        if x.size == 0:
+            return self
+        chunk = Moments()
+        chunk.n = x.size
+        chunk.mean_x, chunk.mean_y = x.mean(), y.mean()
+        dx, dy = x - chunk.mean_x, y - chunk.mean_y
+        chunk.sxx, chunk.syy, chunk.sxy = dx @ dx, dy @ dy, dx @ dy
+        chunk.x_min, chunk.x_max = x.min(), x.max()
+        return self.merge(chunk)
+
+    def merge(self, other):
+        """Combine with moments of a disjoint chunk (in place)."""
+        if other.n == 0:
+            return self
+        n = self.n + other.n
+        dx = other.mean_x - self.mean_x
+        dy = other.mean_y - self.mean_y
+        w = self.n * other.n / n
+        self.sxx += other.sxx + dx * dx * w
+        self.syy += other.syy + dy * dy * w
+        self.sxy += other.sxy + dx * dy * w
+        self.mean_x += dx * other.n / n
+        self.mean_y += dy * other.n / n
+        self.n = n
+        self.x_min = min(self.x_min, other.x_min)
+        self.x_max = max(self.x_max, other.x_max)
+        return self
+
+    @classmethod
+    def from_chunks(cls, chunks):
+        """Moments of an iterable of (x, y) chunks, e.g. a generator over a file."""
+        m = cls()
+        for x, y in chunks:
+            m.update(x, y)
+        return m
+
+
+def fit(m):
+    """Least-squares line, ANOVA decomposition and tests from ``Moments``."""
+    n = m.n
+    b1 = m.sxy / m.sxx
+    b0 = m.mean_y - b1 * m.mean_x
+    sst = m.syy
+    ssr = m.sxy**2 / m.sxx
+    sse = max(sst - ssr, 0.0)
+    msr = ssr / 1
+    mse = sse / (n - 2)
+    f = msr / mse if mse > 0 else np.inf
+    se_b1 = np.sqrt(mse / m.sxx)
+    t_b1 = b1 / se_b1 if se_b1 > 0 else np.inf
+    r = m.sxy / np.sqrt(m.sxx * m.syy) if m.syy > 0 else 0.0
+    return SimpleRegression(
+        n=n, b0=b0, b1=b1, r=r, r_sq=ssr / sst if sst > 0 else 0.0,
+        sst=sst, ssr=ssr, sse=sse, msr=msr, mse=mse,
+        f=f, p_f=_engine.sf("f", f, 1, n - 2),
+        se_b1=se_b1, t_b1=t_b1, p_t=2 * _engine.sf("t", abs(t_b1), n - 2),
+        x_min=m.x_min, x_max=m.x_max,
+    )
+
+
+@st.cache_data(max_entries=16, show_spinner="Streaming through the file…")
+def upload_moments(file_id, name, x_col, y_col, _uploaded):
+    """``Moments`` of two columns of an upload, read chunk by chunk."""
+    chunks = ((c[x_col].to_numpy(), c[y_col].to_numpy())
+              for c in _uploads.iter_chunks(_uploaded, [x_col, y_col]))
+    return Moments.from_chunks(chunks)
+
+
+# ── Multiple regression ───────────────────────────────────────────────────────
+
+MultipleRegression = namedtuple("MultipleRegression", [
+    "n", "predictors", "intercept", "coef", "se_intercept", "se", "t", "p",
+    "sst", "ssr", "sse", "df_model", "df_error", "mse", "f", "p_f", "r_sq", "adj_r_sq",
+])
+
+
+class CrossProducts:
+    """Running means and centred cross-product matrix of the columns [X | y].
+
+    This is the multivariate form of ``Moments``: every least-squares model on
+    any subset of the predictors can be solved from it without touching the
+    rows again.
+    """
+
+    def __init__(self, n_cols):
+        self.n = 0
+        self.mean = np.zeros(n_cols)
+        self.cross = np.zeros((n_cols, n_cols))
+
+    def update(self, data):
+        """Fold an (rows, cols) chunk with y in the last column."""
+        data = np.asarray(data, dtype=float)
+        data = data[np.isfinite(data).all(axis=1)]
+        if len(data) == 0:
+            return self
+        chunk = CrossProducts(data.shape[1])
+        chunk.n = len(data)
+        chunk.mean = data.mean(axis=0)
+        centred = data - chunk.mean
+        chunk.cross = centred.T @ centred
+        return self.merge(chunk)
+
+    def merge(self, other):
+        if other.n == 0:
+            return self
+        n = self.n + other.n
+        delta = other.mean - self.mean
+        self.cross += other.cross + np.outer(delta, delta) * (self.n * other.n / n)
+        self.mean += delta * other.n / n
+        self.n = n
+        return self
+
+
+def _rss(cp, subsets):
+    """Residual SS of y on each predictor subset (equal-sized tuples of column indices).
+
+    Batched Cholesky of the centred normal equations: with A = LLᵀ and
+    c = Xᵀy, the explained sum of squares is cᵀA⁻¹c = ‖L⁻¹c‖².
+    """
+    idx = np.asarray(subsets)
+    yc = cp.cross.shape[0] - 1
+    A = cp.cross[idx[:, :, None], idx[:, None, :]]
+    c = cp.cross[idx, yc][..., None]
+    try:
+        z = np.linalg.solve(np.linalg.cholesky(A), c)[..., 0]
+        explained = np.einsum("ij,ij->i", z, z)
+    except np.linalg.LinAlgError:
+        # Some subset has collinear columns; the pseudo-inverse still gives its fit
+        explained = (np.swapaxes(c, 1, 2) @ np.linalg.pinv(A) @ c)[:, 0, 0]
+    return cp.cross[yc, yc] - explained
+
+
+def _model_table(cp, subsets, names):
+    rss = _rss(cp, subsets)
+    n, k = cp.n, len(subsets[0])
+    sst = cp.cross[-1, -1]
+    df_error = n - k - 1
+    r_sq = 1 - rss / sst
+    f = ((sst - rss) / k) / (rss / df_error)
+    return pd.DataFrame({
+        "predictors": [", ".join(names[i] for i in s) for s in subsets],
+        "k": k,
+        "R²": r_sq,
+        "adj. R²": 1 - (1 - r_sq) * (n - 1) / df_error,
+        "F": f,
+        "p (F)": _engine.sf("f", f, k, df_error),
+    })
+
+
+def all_subsets(cp, names):
+    """Fit every non-empty predictor subset, one batched solve per subset size."""
+    p = len(names)
+    tables = [_model_table(cp, list(combinations(range(p), k)), names) for k in range(1, p + 1)]
+    return pd.concat(tables, ignore_index=True)
+
+
+def forward_selection(cp, names):
+    """Greedy forward selection on adjusted R²; each step scores all candidates in one batch."""
+    p = len(names)
+    chosen, steps = [], []
+    best_adj = -np.inf
+    while len(chosen) < p:
+        candidates = [tuple(sorted(chosen + [j])) for j in range(p) if j not in chosen]
+        table = _model_table(cp, candidates, names)
+        i = int(table["adj. R²"].to_numpy().argmax())
+        if table["adj. R²"].iloc[i] <= best_adj:
+            break
+        best_adj = table["adj. R²"].iloc[i]
+        chosen = list(candidates[i])
+        steps.append(table.iloc[i])
+    return pd.DataFrame(steps).reset_index(drop=True)
+
+
+def fit_multiple(cp, names, subset=None):
+    """Full coefficient table and overall F-test for one predictor subset."""
+    subset = list(range(len(names))) if subset is None else list(subset)
+    n, k = cp.n, len(subset)
+    yc = cp.cross.shape[0] - 1
+    A = cp.cross[np.ix_(subset, subset)]
+    c = cp.cross[subset, yc]
+    L_inv = np.linalg.inv(np.linalg.cholesky(A))
+    A_inv = L_inv.T @ L_inv
+    coef = A_inv @ c
+    x_mean = cp.mean[subset]
+    intercept = cp.mean[yc] - coef @ x_mean
+    sst = cp.cross[yc, yc]
+    ssr = c @ coef
+    sse = max(sst - ssr, 0.0)
+    df_error = n - k - 1
+    mse = sse / df_error
+    se = np.sqrt(mse * np.diag(A_inv))
+    se_intercept = np.sqrt(mse * (1 / n + x_mean @ A_inv @ x_mean))
+    t = np.append(intercept / se_intercept, coef / se)
+    f = (ssr / k) / mse
+    r_sq = ssr / sst
+    return MultipleRegression(
+        n=n, predictors=[names[i] for i in subset], intercept=intercept, coef=coef,
+        se_intercept=se_intercept, se=se, t=t,
+        p=2 * _engine.sf("t", np.abs(t), df_error),
+        sst=sst, ssr=ssr, sse=sse, df_model=k, df_error=df_error, mse=mse,
+        f=f, p_f=_engine.sf("f", f, k, df_error),
+        r_sq=r_sq, adj_r_sq=1 - (1 - r_sq) * (n - 1) / df_error,
+    )
+
+
+@st.cache_data(max_entries=16, show_spinner="Streaming through the file…")
+def upload_cross_products(file_id, name, x_cols, y_col, _uploaded):
+    """``CrossProducts`` of the chosen predictor columns and response, read chunk by chunk."""
+    cols = list(x_cols) + [y_col]
+    cp = CrossProducts(len(cols))
+    for chunk in _uploads.iter_chunks(_uploaded, cols):
+        cp.update(chunk[cols].to_numpy(dtype=float))
+    return cp
@@ -0,0 +1,188 @@
+"""Monte Carlo estimates of event probabilities for classic chance experiments.
+
+Each experiment turns ``(rng, size, param)`` into a bool array with one entry
+per trial, drawn as a single vectorized batch: dice and urns as integer
+matrices, card hands and urn draws as hypergeometric counts, birthdays as a
+(size, people) matrix sorted along its rows.  Batches hold at most
+``CHUNK_ELEMENTS`` draws, which bounds memory whatever the number of trials.
+
+A run is split into tasks with independent child seeds of one
+``SeedSequence``, as in ``_resample``.  Large runs (≥ ``PARALLEL_MIN_TRIALS``)
+go to the shared process pool.  Each task returns its hit count and its
+running hit counts at the log-spaced checkpoints it covers.  Results are
+placed by task index, so the estimate and the running curve do not depend on
+which path ran.  ``on_update`` is called with each new contiguous prefix of the
+curve, so a chart can grow as tasks finish.
+"""
+from collections import namedtuple
+from math import comb
+from concurrent.futures import FIRST_COMPLETED, wait
+
+import numpy as np
+import streamlit as st
+
+from topics import _engine, _resample
+
+SEED = 7
+CHUNK_ELEMENTS = 4_000_000          # draws held in memory at once
+TASK_TRIALS = 5_000_000             # largest task handed to one worker
+PARALLEL_MIN_TRIALS = 20_000_000    # below this, process start-up is not worth it
+CURVE_POINTS = 1_000                # running-estimate points returned
+MAX_TRIALS = 100_000_000
+
+Experiment = namedtuple("Experiment", ["label", "event", "param", "lower", "upper", "default",
+                                       "exact", "width", "trial"])
+MonteCarloResult = namedtuple("MonteCarloResult", [
+    "experiment", "param", "trials", "hits", "estimate", "exact", "level",
+    "curve_x", "curve", "low", "high",
+])
+
+
+def _dice(rng, size, total):
+    return rng.integers(1, 7, size=(size, 2), dtype=np.int8).sum(axis=1, dtype=np.int8) == total
+
+
+def _birthday(rng, size, people):
+    days = rng.integers(0, 365, size=(size, people), dtype=np.int16)
+    days.sort(axis=1)
+    return (days[:, 1:] == days[:, :-1]).any(axis=1)
+
+
+def _birthday_exact(people):
+    return 1 - np.prod((365 - np.arange(people)) / 365)
+
+
+def _hypergeom_at_least(good, bad, drawn, k):
+    return sum(comb(good, j) * comb(bad, drawn - j) for j in range(k, min(good, drawn) + 1)) / comb(good + bad, drawn)
+
+
+EXPERIMENTS = {
+    "dice": Experiment("Two dice", "the sum equals {p}", "Target sum", 2, 12, 7,
+                       lambda p: (6 - abs(p - 7)) / 36, 2, _dice),
+    "coins": Experiment("Ten coin tosses", "at least {p} heads", "Minimum heads", 0, 10, 6,
+                        lambda p: _engine.sf("binom", p - 1, 10, 0.5), 1,
+                        lambda rng, size, p: rng.binomial(10, 0.5, size) >= p),
+    "cards": Experiment("Five-card hand", "at least {p} ace(s)", "Minimum aces", 1, 4, 1,
+                        lambda p: _hypergeom_at_least(4, 48, 5, p), 1,
+                        lambda rng, size, p: rng.hypergeometric(4, 48, 5, size) >= p),
+    "urn": Experiment("Urn: 5 red, 7 blue, draw 4", "at least {p} red", "Minimum red", 0, 4, 2,
+                      lambda p: _hypergeom_at_least(5, 7, 4, p), 1,
+                      lambda rng, size, p: rng.hypergeometric(5, 7, 4, size) >= p),
+    "birthday": Experiment("Birthday problem", "two of {p} people share a birthday", "People", 2, 100, 23,
+                           _birthday_exact, None, _birthday),
+    # The host opens every other door but one, so switching wins unless the first pick was the car
+    "monty": Experiment("Monty Hall", "switching wins with {p} doors (host opens all but one other door)",
+                        "Doors", 3, 10, 3, lambda p: (p - 1) / p, 2,
+                        lambda rng, size, p: rng.integers(0, p, size) != rng.integers(0, p, size)),
+}
+
+
+def wilson(hits, n, level=0.95):
+    """Wilson score interval for a proportion (vectorized over ``hits``/``n``)."""
+    z = _engine.ppf("norm", 1 - (1 - level) / 2)
+    n = np.asarray(n, dtype=float)
+    p = np.asarray(hits, dtype=float) / n
+    centre = (p + z**2 / (2 * n)) / (1 + z**2 / n)
+    half = z * np.sqrt(p * (1 - p) / n + z**2 / (4 * n**2)) / (1 + z**2 / n)
+    return centre - half, centre + half
+
+
+def checkpoints(trials, points=CURVE_POINTS):
+    """Up to ``points`` log-spaced trial counts ending at ``trials``."""
+    return np.unique(np.geomspace(1, trials, min(points, trials)).astype(np.int64))
+
+
+def _task(experiment, param, start, n, marks, seed):
+    """Hits in trials [start, start + n) and the running hit count at each of ``marks``."""
+    exp = EXPERIMENTS[experiment]
+    rng = np.random.default_rng(seed)
+    rows = max(1, CHUNK_ELEMENTS // (exp.width or param))
+    hits, at_marks = 0, np.empty(marks.size, dtype=np.int64)
+    for lo in range(0, n, rows):
+        b = min(rows, n - lo)
+        outcome = exp.trial(rng, b, param)
+        # marks are 1-based trial numbers
+        i, j = np.searchsorted(marks, [start + lo + 1, start + lo + b + 1])
+        if j > i:
+            at_marks[i:j] = hits + np.cumsum(outcome)[marks[i:j] - start - lo - 1]
+        hits += int(np.count_nonzero(outcome))
+    return hits, at_marks
+
+
+def simulate(experiment, param, trials, level=0.95, seed=SEED, progress=None, on_update=None):
+    """Estimate P(event) of ``experiment`` from ``trials`` simulated trials.
+
+    ``progress(fraction, message)`` is called as tasks finish, and
+    ``on_update(x, estimate, low, high)`` with each new stretch of the running
+    curve, in trial order.
+    """
+    exp = EXPERIMENTS[experiment]
+    param = int(param)
+    marks = checkpoints(trials)
+    per_task = int(np.clip(-(-trials // 20), 10_000, TASK_TRIALS))
+    starts = np.arange(0, trials, per_task)
+    sizes = np.minimum(per_task, trials - starts)
+    bounds = np.searchsorted(marks, np.r_[starts, trials] + 1)
+    seeds = np.random.SeedSequence(seed).spawn(starts.size)
+    totals = np.zeros(starts.size, dtype=np.int64)
+    curve = np.zeros(marks.size, dtype=np.int64)
+    finished = np.zeros(starts.size, dtype=bool)
+    state = {"next": 0, "trials": 0}
+
+    def on_result(i, result):
+        totals[i], curve[bounds[i]:bounds[i + 1]] = result
+        finished[i] = True
+        state["trials"] += int(sizes[i])
+        # Publish every task whose predecessors have all finished
+        while state["next"] < starts.size and finished[state["next"]]:
+            k = state["next"]
+            a, b = bounds[k], bounds[k + 1]
+            curve[a:b] += totals[:k].sum()
+            if on_update and b > a:
+                on_update(marks[a:b], curve[a:b] / marks[a:b], *wilson(curve[a:b], marks[a:b], level))
+            state["next"] += 1
+        if progress:
+            k = state["next"]
+            seen = int(starts[k - 1] + sizes[k - 1]) if k else 0
+            est = f" · P̂ ≈ {totals[:k].sum() / seen:.5f}" if seen else ""
+            progress(state["trials"] / trials, f"{state['trials']:,} / {trials:,} trials{est}")
+
+    jobs = [(experiment, param, int(a), int(n), marks[bounds[i]:bounds[i + 1]], s)
+            for i, (a, n, s) in enumerate(zip(starts, sizes, seeds))]
+    if _resample.MAX_WORKERS < 2 or trials < PARALLEL_MIN_TRIALS:
+        for i, job in enumerate(jobs):
+            on_result(i, _task(*job))
+    else:
+        pool = _resample._pool()
+        queue = iter(enumerate(jobs))
+        pending = {}
+
+        def submit():
+            nxt = next(queue, None)
+            if nxt is not None:
+                pending[pool.submit(_task, *nxt[1])] = nxt[0]
+
+        for _ in range(2 * _resample.MAX_WORKERS):
+            submit()
+        try:
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for fut in done:
+                    on_result(pending.pop(fut), fut.result())
+                    submit()
+        except Exception:
+            _resample.reset_pool()
+            raise
+
+    hits = int(totals.sum())
+    low, high = wilson(curve, marks, level)
+    return MonteCarloResult(
+        experiment=experiment, param=param, trials=trials, hits=hits, estimate=hits / trials,
+        exact=float(exp.exact(param)), level=level, curve_x=marks, curve=curve / marks, low=low, high=high,
+    )
+
+
+@st.cache_data(max_entries=32, show_spinner="Simulating…")
+def cached(experiment, param, trials):
+    """``simulate`` with the default seed and level, cached per (experiment, param, trials)."""
+    return simulate(experiment, param, trials)
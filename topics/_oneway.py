@@ -0,0 +1,61 @@
+"""One-way ANOVA from per-group summaries.
+
+Everything is derived from the (n, mean, variance) of each group, which pandas
+computes for all groups in a single group-by pass.  That makes the same code
+serve five typed-in values or millions of uploaded rows across hundreds of
+groups, and the results agree with ``scipy.stats.f_oneway``.
+"""
+from collections import namedtuple
+
+import numpy as np
+import pandas as pd
+
+from topics import _engine
+
+OneWayResult = namedtuple("OneWayResult", [
+    "k", "n_total", "grand_mean",
+    "sstr", "sse", "sst", "df_between", "df_within",
+    "mstr", "mse", "f", "p",
+])
+
+
+def summarize(values, groups):
+    """Per-group n, mean and variance (ddof=1) as a DataFrame indexed by group."""
+    out = (pd.Series(np.asarray(values, dtype=float))
+           .groupby(np.asarray(groups), sort=True)
+           .agg(["count", "mean", "var"])
+           .rename(columns={"count": "n"}))
+    out.index.name = "group"
+    return out[out["n"] > 0]
+
+
+def summarize_arrays(arrays, names=None):
+    """``summarize`` for a list of per-group arrays (typed-in data)."""
+    names = names or [f"Group {i+1}" for i in range(len(arrays))]
+    return pd.DataFrame({
+        "n": [len(a) for a in arrays],
+        "mean": [np.mean(a) for a in arrays],
+        "var": [np.var(a, ddof=1) for a in arrays],
+    }, index=pd.Index(names, name="group"))
+
+
+def oneway(summary):
+    """ANOVA table quantities from a ``summarize`` frame."""
+    n = summary["n"].to_numpy(dtype=float)
+    means = summary["mean"].to_numpy(dtype=float)
+    var = np.nan_to_num(summary["var"].to_numpy(dtype=float))  # n = 1 groups add no SSE
+    k = len(n)
+    n_total = n.sum()
+    grand_mean = (n * means).sum() / n_total
+    sstr = (n * (means - grand_mean)**2).sum()
+    sse = ((n - 1) * var).sum()
+    df_between, df_within = k - 1, n_total - k
+    mstr = sstr / df_between
+    mse = sse / df_within
+    f = mstr / mse
+    return OneWayResult(
+        k=k, n_total=int(n_total), grand_mean=grand_mean,
+        sstr=sstr, sse=sse, sst=sstr + sse,
+        df_between=int(df_between), df_within=int(df_within),
+        mstr=mstr, mse=mse, f=f, p=_engine.sf("f", f, df_between, df_within),
+    )
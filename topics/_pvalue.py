@@ -0,0 +1,124 @@
+"""Shared p-value calculator chart for the z and t distributions.
+
+The density is evaluated once per (family, df) on a fixed grid and cached;
+tail regions are boolean masks over that array, so moving the statistic or
+switching tails never re-evaluates the pdf.  The chart carries a Plotly
+slider whose steps re-shade the tail for statistics across the grid, so the
+statistic can be scrubbed in the browser without a rerun.  The p-values for
+all steps come from a single vectorized ``sf`` call.
+"""
+from functools import lru_cache
+
+import numpy as np
+import plotly.graph_objects as go
+
+from topics import _engine, _figures
+
+X_MIN, X_MAX = -4.0, 4.0
+GRID = np.linspace(X_MIN, X_MAX, 401)
+GRID.setflags(write=False)
+SCRUB_STEP = 0.1
+TAILS = ("right", "left", "two")
+
+
+@lru_cache(maxsize=64)
+def density(family, df=None):
+    """Read-only pdf of ``family`` ("norm" or "t") on ``GRID``."""
+    y = np.array(_engine.pdf(family, GRID) if df is None else _engine.pdf(family, GRID, df))
+    y.setflags(write=False)
+    return y
+
+
+def p_value(stat, tail, family, df=None):
+    """Tail probability of ``stat`` (scalar or array) for a right/left/two-tailed test."""
+    stat = np.asarray(stat, dtype=float)
+    oriented = {"right": stat, "left": -stat, "two": np.abs(stat)}[tail]
+    args = () if df is None else (df,)
+    p = _engine.sf(family, oriented, *args)
+    if tail == "two":
+        p = np.minimum(2 * np.asarray(p), 1.0)
+    return float(p) if np.ndim(p) == 0 else p
+
+
+def tail_mask(x, stat, tail):
+    """Points of ``x`` inside the rejection region of ``stat``."""
+    if tail == "right":
+        return x >= stat
+    if tail == "left":
+        return x <= stat
+    return np.abs(x) >= abs(stat)
+
+
+def _tail_xy(y_grid, x, y, stat, tail):
+    """Outline of the shaded region: the masked (x, y) closed exactly at the statistic.
+
+    Both tails of a two-tailed test share one trace, separated by a NaN gap.
+    """
+    if tail == "two":
+        parts = [(-np.inf, -abs(stat)), (abs(stat), np.inf)]
+    elif tail == "right":
+        parts = [(stat, np.inf)]
+    else:
+        parts = [(-np.inf, stat)]
+    xs, ys = [], []
+    for lo, hi in parts:
+        keep = (x >= lo) & (x <= hi)
+        px, py = x[keep], y[keep]
+        edge = lo if np.isfinite(lo) else hi
+        if X_MIN <= edge <= X_MAX and not np.isclose(x, edge).any():
+            at = np.interp(edge, GRID, y_grid)
+            px, py = (np.r_[edge, px], np.r_[at, py]) if edge == lo else (np.r_[px, edge], np.r_[py, at])
+        xs += [px, [np.nan]]
+        ys += [py, [np.nan]]
+    return np.round(np.concatenate(xs[:-1]), 3), np.round(np.concatenate(ys[:-1]), 5)
+
+
+def _build(family, df, tail, stat, line_color, title_label):
+    y = density(family, df)
+    pv = p_value(stat, tail, family, df)
+    shade_x, shade_y = _tail_xy(y, GRID, y, stat, tail)
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(x=GRID, y=y, mode='lines',
+                             line=dict(color=line_color, width=2), name='Distribution'))
+    fig.add_trace(go.Scatter(x=shade_x, y=shade_y, fill='tozeroy',
+                             fillcolor='rgba(220,38,38,0.3)', line=dict(width=0), name=f'p = {pv:.4f}'))
+    fig.add_trace(go.Scatter(x=[stat, stat], y=[0, y.max() * 1.05], mode='lines',
+                             line=dict(color='#dc2626', dash='dash'), name=f'stat = {stat:.2f}'))
+
+    # Scrub steps replace only the shaded trace and the marker line, using every
+    # SCRUB_STEP-th grid point of the same cached density; the curve is sent once
+    stride = int(round(SCRUB_STEP / (GRID[1] - GRID[0])))
+    coarse_x, coarse_y = GRID[::stride], y[::stride]
+    scrub = np.round(coarse_x, 2)
+    scrub_p = np.atleast_1d(p_value(scrub, tail, family, df))
+    steps = []
+    for s, p in zip(scrub, scrub_p):
+        fx, fy = _tail_xy(y, coarse_x, coarse_y, s, tail)
+        # Slider steps restyle traces 1-2 directly: no frames to build or rehydrate,
+        # and short rounded lists serialize smaller than base64 float64 arrays
+        steps.append(dict(
+            method='update', label=f"{s:.1f}",
+            args=[{"x": [fx.tolist(), [s, s]], "y": [fy.tolist(), [0, y.max() * 1.05]],
+                   "name": [f'p = {p:.4f}', f'stat = {s:.2f}']},
+                  {"title.text": f"Scrubbed statistic = {s:.2f}: P-value = {p:.6f}"},
+                  [1, 2]],
+        ))
+    fig.update_layout(
+        title=f"{title_label} = {stat:.2f}: P-value = {pv:.6f} (shaded area)",
+        paper_bgcolor='#ffffff', plot_bgcolor='#f8fafc', font_color='#111111', height=380,
+        xaxis=dict(gridcolor='#e2e8f0', range=[X_MIN, X_MAX]), yaxis=dict(gridcolor='#e2e8f0'),
+        sliders=[dict(active=int(np.abs(scrub - stat).argmin()), steps=steps, pad=dict(t=40),
+                      currentvalue=dict(prefix='Scrub statistic: '))],
+    )
+    return fig
+
+
+def plotly_chart(topic, family, df, tail, stat, line_color='#4f46e5', title_label="Test statistic"):
+    """Draw the shaded p-value chart; specs are cached per input combination."""
+    params = {"family": family, "df": df, "tail": tail, "stat": round(float(stat), 4),
+              "color": line_color, "label": title_label}
+    _figures.plotly_chart(
+        topic, "p_value_curve", params,
+        lambda: _build(family, df, tail, float(stat), line_color, title_label),
+        use_container_width=True,
+    )
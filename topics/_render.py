@@ -0,0 +1,69 @@
+"""Trace builders that keep chart payloads bounded for large data.
+
+Histograms are binned here with ``np.histogram`` and sent as bar heights, so
+the browser receives one number per bin instead of the raw sample.  Scatter
+clouds switch to WebGL (``go.Scattergl``) past ``GL_MIN_POINTS`` and, past
+``MAX_POINTS``, are either decimated to a seeded uniform subsample or
+replaced by a 2-D count grid drawn as a heatmap.  Coordinates are sent as
+float32, which Plotly serializes as half-size base64 typed arrays.
+"""
+import numpy as np
+import plotly.graph_objects as go
+
+GL_MIN_POINTS = 1_000        # above this, draw scatter markers with WebGL
+MAX_POINTS = 50_000          # above this, decimate or switch to a density grid
+DENSITY_BINS = 150           # cells per axis of the density grid
+SEED = 0
+
+
+def _finite(*arrays):
+    arrays = [np.asarray(a, dtype=float).ravel() for a in arrays]
+    keep = np.logical_and.reduce([np.isfinite(a) for a in arrays])
+    return [a if keep.all() else a[keep] for a in arrays]
+
+
+def bars(edges, heights, **kwargs):
+    """``go.Bar`` drawing precomputed bin ``heights`` between ``edges``."""
+    edges = np.asarray(edges, dtype=float)
+    return go.Bar(x=(edges[:-1] + edges[1:]) / 2, y=heights, width=np.diff(edges), **kwargs)
+
+
+def histogram(data, bins=40, range=None, density=False, **kwargs):
+    """Server-side binned histogram of ``data`` as a ``go.Bar`` (NaNs dropped).
+
+    ``bins`` and ``range`` are passed to ``np.histogram``; the figure should use
+    ``bargap=0`` for the bars to touch.
+    """
+    (data,) = _finite(data)
+    counts, edges = np.histogram(data, bins=bins, range=range, density=density)
+    return bars(edges, counts, **kwargs)
+
+
+def decimate(n, k=MAX_POINTS, seed=SEED):
+    """Sorted indices of a seeded uniform subsample of ``k`` out of ``n`` points."""
+    if n <= k:
+        return np.arange(n)
+    return np.sort(np.random.default_rng(seed).choice(n, size=k, replace=False))
+
+
+def scatter(x, y, density=False, colorscale="Purples", **kwargs):
+    """Marker trace for (x, y) sized for the browser, and the number of points drawn.
+
+    Up to ``GL_MIN_POINTS`` this is a plain ``go.Scatter``; beyond that a
+    ``go.Scattergl``.  Past ``MAX_POINTS`` the cloud is decimated, or, with
+    ``density=True``, binned into a ``DENSITY_BINS``² count grid drawn as a
+    ``go.Heatmap`` (empty cells transparent; ``kwargs`` other than ``name``
+    are ignored there).
+    """
+    x, y = _finite(x, y)
+    n = x.size
+    if n > MAX_POINTS and density:
+        counts, xe, ye = np.histogram2d(x, y, bins=DENSITY_BINS)
+        z = np.where(counts > 0, counts, np.nan).T.astype(np.float32)
+        return go.Heatmap(x=(xe[:-1] + xe[1:]) / 2, y=(ye[:-1] + ye[1:]) / 2, z=z,
+                          colorscale=colorscale, colorbar=dict(title="Points"),
+                          name=kwargs.get("name"), hoverongaps=False), n
+    idx = decimate(n)
+    cls = go.Scatter if n <= GL_MIN_POINTS else go.Scattergl
+    kwargs.setdefault("mode", "markers")
+    return cls(x=x[idx].astype(np.float32), y=y[idx].astype(np.float32), **kwargs), idx.size
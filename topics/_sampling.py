@@ -0,0 +1,130 @@
+"""Sampling-distribution simulator for the CLT demo.
+
+Draws are generated once per population shape with a seeded
+``np.random.Generator`` and stored as a running cumulative sum, so the mean of
+the first n draws in every simulated sample is the column ``cums[:, n-1] / n``.
+Moving the n slider only extends the matrix when n exceeds what has been drawn.
+Simulation counts too large to hold as a matrix keep only the running sum of
+each sample (one float per sample) and are extended one column at a time:
+every new column is drawn in chunks, added to the sums and binned, so each
+sample size is simulated once and revisiting it is a lookup.
+"""
+import threading
+from collections import namedtuple
+from functools import lru_cache
+
+import numpy as np
+
+SEED = 42
+# Largest sample size the demo offers; the cached matrix never grows past it.
+N_MAX = 100
+# Above this many simulated samples, stream instead of caching the matrix.
+MATRIX_MAX_SIMS = 20_000
+# Upper bound on draws held in memory by one streaming chunk.
+CHUNK_ELEMENTS = 2_000_000
+
+Population = namedtuple("Population", ["mean", "sd", "lower", "upper", "draw"])
+
+
+def _draw_uniform(rng, size):
+    return rng.uniform(0, 10, size)
+
+
+def _draw_exponential(rng, size):
+    return rng.exponential(2, size)
+
+
+def _draw_bimodal(rng, size):
+    # 50/50 mixture of N(3, 0.5²) and N(7, 0.5²): mean 5, variance 4 + 0.25
+    centres = np.where(rng.random(size) < 0.5, 3.0, 7.0)
+    return centres + rng.normal(0, 0.5, size)
+
+
+POPULATIONS = {
+    "Uniform": Population(5.0, np.sqrt(100 / 12), 0.0, 10.0, _draw_uniform),
+    "Exponential (Skewed)": Population(2.0, 2.0, 0.0, np.inf, _draw_exponential),
+    "Bimodal": Population(5.0, np.sqrt(4 + 0.25), -np.inf, np.inf, _draw_bimodal),
+}
+
+
+class _CumulativeDraws:
+    """Row-wise running sums of i.i.d. draws, grown column-wise on demand."""
+
+    def __init__(self, shape, n_sims):
+        self.pop = POPULATIONS[shape]
+        self.rng = np.random.default_rng([SEED, list(POPULATIONS).index(shape), n_sims])
+        self.cums = np.zeros((n_sims, 0))
+        self.lock = threading.Lock()
+
+    def means(self, n):
+        with self.lock:
+            have = self.cums.shape[1]
+            if n > have:
+                # Grow geometrically so dragging the slider up costs few re-allocations
+                target = max(n, min(2 * have, N_MAX))
+                new = np.cumsum(self.pop.draw(self.rng, (self.cums.shape[0], target - have)), axis=1)
+                if have:
+                    new += self.cums[:, -1:]
+                self.cums = np.hstack([self.cums, new])
+            return self.cums[:, n - 1] / n
+
+
+@lru_cache(maxsize=len(POPULATIONS) * 4)
+def _draws(shape, n_sims):
+    return _CumulativeDraws(shape, n_sims)
+
+
+def bin_edges(shape, n, bins=40):
+    """Fixed histogram edges covering the bulk of the sampling distribution of x̄."""
+    pop = POPULATIONS[shape]
+    se = pop.sd / np.sqrt(n)
+    lo = max(pop.lower, pop.mean - 5 * se)
+    hi = min(pop.upper, pop.mean + 6 * se)
+    return np.linspace(lo, hi, bins + 1)
+
+
+class _StreamedSums:
+    """Running sums of ``n_sims`` samples, plus the x̄ histogram at every size reached.
+
+    Column j is drawn from its own seeded generator, so the counts for a given
+    n do not depend on the order in which sample sizes were requested.
+    """
+
+    def __init__(self, shape, n_sims, bins):
+        self.shape, self.bins = shape, bins
+        self.pop = POPULATIONS[shape]
+        self.seed = [SEED, list(POPULATIONS).index(shape), n_sims]
+        self.sums = np.zeros(n_sims)
+        self.counts = {}
+        self.lock = threading.Lock()
+
+    def histogram(self, n):
+        with self.lock:
+            for j in range(len(self.counts), n):
+                rng = np.random.default_rng([*self.seed, j])
+                for lo in range(0, self.sums.size, CHUNK_ELEMENTS):
+                    block = self.sums[lo:lo + CHUNK_ELEMENTS]
+                    block += self.pop.draw(rng, block.size)
+                counts = np.histogram(self.sums / (j + 1), bin_edges(self.shape, j + 1, self.bins))[0]
+                counts.setflags(write=False)
+                self.counts[j + 1] = counts
+            return self.counts[n]
+
+
+@lru_cache(maxsize=len(POPULATIONS) * 2)
+def _streamed(shape, n_sims, bins):
+    return _StreamedSums(shape, n_sims, bins)
+
+
+def sample_mean_histogram(shape, n, n_sims, bins=40):
+    """Density histogram of ``n_sims`` sample means of size ``n``.
+
+    Returns ``(edges, density)``; density is normalised by ``n_sims`` so
+    means that land outside the edges still count towards the total.
+    """
+    edges = bin_edges(shape, n, bins)
+    if n_sims <= MATRIX_MAX_SIMS:
+        counts = np.histogram(_draws(shape, n_sims).means(n), edges)[0]
+    else:
+        counts = _streamed(shape, n_sims, bins).histogram(n)
+    return edges, counts / (n_sims * np.diff(edges))
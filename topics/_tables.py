@@ -0,0 +1,190 @@
+"""Precomputed Z and t lookup tables.
+
+The grids below are evaluated once per machine, saved as ``.npy`` files and
+memory-mapped on every later load, so rendering the table pages never calls
+into scipy's special functions.  Values that fall off the grid (e.g. a typed
+z of 1.965) go through the shared ``_engine`` cache.
+"""
+import os
+import tempfile
+import threading
+from collections import namedtuple
+
+import numpy as np
+from scipy import stats
+
+from topics import _engine
+
+# Bump when a grid changes so stale artifacts are rebuilt instead of misread.
+TABLE_VERSION = 1
+# Per-user by default: the artifacts are memory-mapped without re-validation, so
+# they must not live somewhere other users can write.
+CACHE_DIR = os.environ.get("QT_CACHE_DIR", os.path.join(
+    os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache"), "qt_cache"))
+
+# z from -3.99 to 3.99 in steps of 0.01 (the printed Z-table uses 0.00 … 3.49)
+Z_STEP = 0.01
+Z_GRID = np.arange(-399, 400) * Z_STEP
+
+# Cumulative probabilities 0.0001 … 0.9999 for the inverse lookup
+P_STEP = 0.0001
+P_GRID = np.arange(1, 10000) * P_STEP
+
+# Upper-tail areas 0.00025 … 0.5 — covers every α and α/2 the widgets can produce
+ALPHA_STEP = 0.00025
+ALPHA_GRID = np.arange(1, 2001) * ALPHA_STEP
+
+# Degrees of freedom; the last row of every t array is df = ∞ (standard normal)
+T_DFS = np.concatenate([np.arange(1, 201), [250, 300, 400, 500, 1000]])
+
+# t from -10 to 10 in steps of 0.01 for the p-value lookup
+T_STEP = 0.01
+T_GRID = np.arange(-1000, 1001) * T_STEP
+
+ZTTables = namedtuple("ZTTables", ["z_cdf", "z_ppf", "t_crit", "t_cdf"])
+
+_lock = threading.Lock()
+_tables = None
+
+
+def _build():
+    dfs = np.append(T_DFS, np.inf)[:, None]
+    t_crit = stats.t.isf(ALPHA_GRID[None, :], dfs)
+    t_crit[-1] = stats.norm.isf(ALPHA_GRID)
+    t_cdf = stats.t.cdf(T_GRID[None, :], dfs)
+    t_cdf[-1] = stats.norm.cdf(T_GRID)
+    return ZTTables(
+        z_cdf=stats.norm.cdf(Z_GRID),
+        z_ppf=stats.norm.ppf(P_GRID),
+        t_crit=t_crit,
+        t_cdf=t_cdf,
+    )
+
+
+def _path(name):
+    return os.path.join(CACHE_DIR, f"zt_v{TABLE_VERSION}_{name}.npy")
+
+
+def _check_owner(path):
+    """Refuse artifacts (or their directory) owned by another user or writable by others."""
+    if not hasattr(os, "getuid"):
+        return
+    info = os.stat(path)
+    if info.st_uid != os.getuid() or info.st_mode & 0o022:
+        raise ValueError(f"untrusted table artifact: {path}")
+
+
+def _save(tables):
+    os.makedirs(CACHE_DIR, mode=0o700, exist_ok=True)
+    _check_owner(CACHE_DIR)
+    for name, arr in tables._asdict().items():
+        # Write-then-rename so a concurrent reader never maps a half-written file
+        fd, tmp = tempfile.mkstemp(dir=CACHE_DIR, suffix=".npy")
+        with os.fdopen(fd, "wb") as fh:
+            np.save(fh, arr)
+        os.chmod(tmp, 0o644)
+        os.replace(tmp, _path(name))
+
+
+def _load():
+    _check_owner(CACHE_DIR)
+    for name in ZTTables._fields:
+        _check_owner(_path(name))
+    arrays = {name: np.load(_path(name), mmap_mode="r") for name in ZTTables._fields}
+    tables = ZTTables(**arrays)
+    expected = ZTTables(
+        z_cdf=Z_GRID.shape,
+        z_ppf=P_GRID.shape,
+        t_crit=(len(T_DFS) + 1, len(ALPHA_GRID)),
+        t_cdf=(len(T_DFS) + 1, len(T_GRID)),
+    )
+    if any(arr.shape != shape for arr, shape in zip(tables, expected)):
+        raise ValueError("table artifact has unexpected shape")
+    return tables
+
+
+def get_tables():
+    """Return the memory-mapped tables, building the artifact on first use."""
+    global _tables
+    if _tables is not None:
+        return _tables
+    with _lock:
+        if _tables is None:
+            try:
+                _tables = _load()
+            except (OSError, ValueError):
+                built = _build()
+                try:
+                    _save(built)
+                    _tables = _load()
+                except (OSError, ValueError):
+                    # Read-only filesystem or untrusted directory: keep the in-memory copy
+                    _tables = built
+    return _tables
+
+
+def _grid_index(value, start, step, size):
+    """Index of ``value`` on a regular grid, or None if it is off-grid."""
+    pos = (value - start) / step
+    idx = int(round(pos))
+    if 0 <= idx < size and abs(pos - idx) < 1e-6:
+        return idx
+    return None
+
+
+def _df_row(df):
+    if np.isinf(df):
+        return len(T_DFS)
+    hits = np.flatnonzero(T_DFS == df)
+    return int(hits[0]) if hits.size else None
+
+
+def z_cdf(z):
+    """Φ(z) = P(Z ≤ z)."""
+    i = _grid_index(z, Z_GRID[0], Z_STEP, Z_GRID.size)
+    if i is None:
+        return _engine.cdf("norm", z)
+    return float(get_tables().z_cdf[i])
+
+
+def z_ppf(p):
+    """z such that P(Z ≤ z) = p."""
+    i = _grid_index(p, P_GRID[0], P_STEP, P_GRID.size)
+    if i is None:
+        return _engine.ppf("norm", p)
+    return float(get_tables().z_ppf[i])
+
+
+def t_crit(alpha, df=np.inf):
+    """Upper-tail critical value t_{α, df}; df = ∞ gives z_α."""
+    row = _df_row(df)
+    col = _grid_index(alpha, ALPHA_GRID[0], ALPHA_STEP, ALPHA_GRID.size)
+    if row is None or col is None:
+        return _engine.isf("norm", alpha) if np.isinf(df) else _engine.isf("t", alpha, df)
+    return float(get_tables().t_crit[row, col])
+
+
+def t_cdf(t, df):
+    """P(T ≤ t) for Student's t with ``df`` degrees of freedom."""
+    row = _df_row(df)
+    col = _grid_index(t, T_GRID[0], T_STEP, T_GRID.size)
+    if row is None or col is None:
+        return _engine.cdf("t", t, df)
+    return float(get_tables().t_cdf[row, col])
+
+
+def z_table(max_row=3.4):
+    """Φ(z) laid out as the printed Z-table: rows 0.0 … max_row, columns .00 … .09."""
+    n_rows = int(round(max_row * 10)) + 1
+    start = _grid_index(0.0, Z_GRID[0], Z_STEP, Z_GRID.size)
+    return np.asarray(get_tables().z_cdf[start:start + n_rows * 10]).reshape(n_rows, 10)
+
+
+def t_table(dfs, alphas):
+    """Upper-tail critical values for every (df, α) pair, as a len(dfs) × len(alphas) array."""
+    tables = get_tables()
+    rows = [_df_row(d) for d in dfs]
+    cols = [_grid_index(a, ALPHA_GRID[0], ALPHA_STEP, ALPHA_GRID.size) for a in alphas]
+    if None in rows or None in cols:
+        return np.array([[t_crit(a, d) for a in alphas] for d in dfs])
+    return np.asarray(tables.t_crit[np.ix_(rows, cols)])
@@ -0,0 +1,76 @@
+"""Columnar loading of user-uploaded CSV and Parquet tables.
+
+Parsing goes through pyarrow (CSV via ``engine="pyarrow"``), and the parsed
+frame is cached per upload so reruns triggered by other widgets do not parse
+the file again.  Frames are shared between reruns: treat them as read-only.
+"""
+import io
+
+import pandas as pd
+import streamlit as st
+
+FILE_TYPES = ["csv", "parquet"]
+CHUNK_ROWS = 1_000_000
+
+
+def _is_parquet(name):
+    return name.lower().endswith((".parquet", ".pq"))
+
+
+@st.cache_resource(max_entries=8, show_spinner="Parsing uploaded file…")
+def _parse(file_id, name, columns, _data):
+    buf = io.BytesIO(_data)
+    usecols = list(columns) if columns else None
+    if _is_parquet(name):
+        return pd.read_parquet(buf, columns=usecols)
+    return pd.read_csv(buf, engine="pyarrow", usecols=usecols)
+
+
+def read_table(uploaded, columns=None):
+    """Parse an ``st.file_uploader`` result into a DataFrame.
+
+    ``columns`` limits parsing to the listed columns, which is much cheaper
+    than reading a wide file in full.
+    """
+    return _parse(uploaded.file_id, uploaded.name, tuple(columns) if columns else None,
+                  uploaded.getvalue())
+
+
+def iter_chunks(uploaded, columns, rows=CHUNK_ROWS):
+    """Yield the upload as DataFrames of at most ``rows`` rows.
+
+    Nothing is cached and only one chunk is parsed at a time, so consumers
+    that fold chunks into running statistics use O(rows) memory.
+    """
+    buf = io.BytesIO(uploaded.getvalue())
+    if _is_parquet(uploaded.name):
+        import pyarrow.parquet as pq
+        for batch in pq.ParquetFile(buf).iter_batches(batch_size=rows, columns=list(columns)):
+            yield batch.to_pandas()
+    else:
+        yield from pd.read_csv(buf, usecols=list(columns), chunksize=rows)
+
+
+@st.cache_resource(max_entries=32, show_spinner=False)
+def _schema(file_id, name, _data):
+    buf = io.BytesIO(_data)
+    if _is_parquet(name):
+        import pyarrow.parquet as pq
+        schema = pq.read_schema(buf)
+        return [(f.name, str(f.type)) for f in schema]
+    # Infer dtypes from a small prefix; the full parse happens in read_table
+    head = pd.read_csv(buf, nrows=1000)
+    return [(c, str(t)) for c, t in head.dtypes.items()]
+
+
+def column_type(uploaded, col):
+    """Schema type of one column (e.g. ``"int64"``, ``"double"``), fixed for the whole file."""
+    return dict(_schema(uploaded.file_id, uploaded.name, uploaded.getvalue()))[col]
+
+
+def column_names(uploaded, numeric=False):
+    """Column names of the upload without parsing the whole file."""
+    schema = _schema(uploaded.file_id, uploaded.name, uploaded.getvalue())
+    if numeric:
+        return [c for c, t in schema if t.startswith(("int", "uint", "float", "double"))]
+    return [c for c, _ in schema]
@@ -0,0 +1,175 @@
+"""Exact region counts and inclusion–exclusion for up to ``K_MAX`` sets.
+
+A family of k sets over a universe of n elements is stored as k packed
+bitsets (``np.packbits``), one bit per element, which is n·k/8 bytes.  To count
+the 2ᵏ Venn regions, elements are processed in blocks of ``BLOCK_ELEMENTS``.
+Each block is unpacked and every element's memberships are folded into one
+k-bit mask, which ``np.bincount`` tallies into all regions at once, so counting
+is O(n·k) with bounded memory.
+
+Intersection sizes |A_S| = |⋂_{j∈S} A_j| are the superset sums of the region
+counts.  The subset-sum ("zeta") transform computes all 2ᵏ of them in O(k·2ᵏ)
+with one vectorized pass per set.  Inclusion–exclusion is then a signed sum over
+the same array, which ``verify`` checks against the directly counted union.
+
+``simulated_summary`` and ``upload_summary`` cache the counts, the check and
+the region table per data source as read-only shared results, so reruns from
+other widgets do not count again.
+"""
+from collections import namedtuple
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from topics import _uploads
+
+K_MAX = 20
+BLOCK_ELEMENTS = 1 << 20
+UPSET_MAX = 40              # intersections drawn in the UpSet chart
+SEED = 5
+
+SetFamily = namedtuple("SetFamily", ["names", "bits", "n"])
+Regions = namedtuple("Regions", ["names", "n", "counts", "sizes", "intersections"])
+Verification = namedtuple("Verification", ["union_direct", "union_ie", "terms", "ok"])
+Summary = namedtuple("Summary", ["regions", "check", "table"])
+TABLE_ROWS = 500            # regions listed in the region table
+
+
+def from_membership(names, columns):
+    """``SetFamily`` from k equal-length boolean columns (element × set)."""
+    if not 1 <= len(columns) <= K_MAX:
+        raise ValueError(f"Need between 1 and {K_MAX} sets.")
+    bits = np.stack([np.packbits(np.asarray(c, dtype=bool)) for c in columns])
+    return SetFamily(tuple(names), bits, len(columns[0]))
+
+
+def from_ids(names, id_lists):
+    """``SetFamily`` from k collections of element IDs; the universe is their union."""
+    if not 1 <= len(id_lists) <= K_MAX:
+        raise ValueError(f"Need between 1 and {K_MAX} sets.")
+    codes, universe = pd.factorize(pd.concat([pd.Series(ids) for ids in id_lists], ignore_index=True))
+    bounds = np.cumsum([0] + [len(ids) for ids in id_lists])
+    member = np.zeros(len(universe), dtype=bool)
+    bits = []
+    for a, b in zip(bounds[:-1], bounds[1:]):
+        member[:] = False
+        idx = codes[a:b]
+        member[idx[idx >= 0]] = True
+        bits.append(np.packbits(member))
+    return SetFamily(tuple(names), np.stack(bits), len(universe))
+
+
+def region_counts(family):
+    """Number of elements in each of the 2ᵏ regions, indexed by membership mask.
+
+    Bit j of the index is set when the region lies inside set j; index 0 is
+    the elements in none of the sets.
+    """
+    k = len(family.names)
+    weights = (1 << np.arange(k, dtype=np.uint32))[:, None]
+    counts = np.zeros(1 << k, dtype=np.int64)
+    step = BLOCK_ELEMENTS // 8
+    for lo in range(0, family.bits.shape[1], step):
+        block = np.unpackbits(family.bits[:, lo:lo + step], axis=1)
+        block = block[:, :max(0, min(block.shape[1], family.n - lo * 8))]
+        masks = (block * weights).sum(axis=0, dtype=np.uint32)
+        counts += np.bincount(masks, minlength=1 << k)
+    return counts
+
+
+def popcount(k):
+    """Number of sets in each of the 2ᵏ masks."""
+    masks = np.arange(1 << k, dtype=np.uint32)
+    bits = np.zeros(1 << k, dtype=np.int8)
+    for j in range(k):
+        bits += (masks >> j) & 1
+    return bits
+
+
+def intersections(counts):
+    """|⋂_{j∈S} A_j| for every mask S (superset sums of ``counts``); S = 0 gives n."""
+    k = int(np.log2(counts.size))
+    f = counts.copy()
+    for j in range(k):
+        view = f.reshape(-1, 2, 1 << j)
+        view[:, 0, :] += view[:, 1, :]
+    return f
+
+
+def regions(family):
+    """``Regions`` of a family: region counts, set sizes and all intersection sizes."""
+    counts = region_counts(family)
+    inter = intersections(counts)
+    k = len(family.names)
+    return Regions(family.names, family.n, counts, inter[1 << np.arange(k)], inter)
+
+
+def verify(reg):
+    """|A₁ ∪ … ∪ A_k| by inclusion–exclusion against the direct count n − |none|."""
+    k = len(reg.names)
+    sign = np.where(popcount(k)[1:] % 2 == 1, 1, -1)
+    union_ie = int((sign * reg.intersections[1:]).sum())
+    union_direct = int(reg.n - reg.counts[0])
+    return Verification(union_direct, union_ie, (1 << k) - 1, union_ie == union_direct)
+
+
+def region_table(reg, limit=None):
+    """Non-empty exclusive regions as a DataFrame, largest first."""
+    k = len(reg.names)
+    masks = np.flatnonzero(reg.counts[1:]) + 1
+    masks = masks[np.argsort(-reg.counts[masks], kind="stable")][:limit]
+    pc = popcount(k)
+    return pd.DataFrame({
+        "Region": [" ∩ ".join(reg.names[j] for j in range(k) if m >> j & 1) + (" only" if pc[m] < k else "")
+                   for m in masks],
+        "Sets": pc[masks],
+        "Exclusive count": reg.counts[masks],
+        "Intersection |⋂|": reg.intersections[masks],
+        "Share of union": reg.counts[masks] / max(1, reg.n - reg.counts[0]),
+        "mask": masks,
+    })
+
+
+@lru_cache(maxsize=4)
+def simulated(n, k, seed=SEED):
+    """Seeded family of k overlapping sets over n elements.
+
+    Membership follows a latent "activity" score, so sets are positively
+    correlated and high-order intersections are not all empty.
+    """
+    rng = np.random.default_rng(seed)
+    rates = np.linspace(0.45, 0.08, k)
+    activity = rng.beta(0.6, 1.2, n)
+    cols = [rng.random(n) < np.clip(activity * 2 * r, 0, 1) for r in rates]
+    return from_membership([chr(ord("A") + j) for j in range(k)], cols)
+
+
+@st.cache_resource(max_entries=8, show_spinner="Encoding sets as bitsets…")
+def upload_family(file_id, name, cols, layout, _uploaded):
+    """``SetFamily`` of an upload: ``layout`` "membership" (one 0/1 column per set) or "ids" (one ID column per set)."""
+    frame = _uploads.read_table(_uploaded, columns=list(cols))
+    if layout == "membership":
+        return from_membership(cols, [frame[c].fillna(0).to_numpy() != 0 for c in cols])
+    return from_ids(cols, [frame[c].dropna().unique() for c in cols])
+
+
+def summary(family):
+    """``Summary`` of a family: regions, inclusion–exclusion check and the top of the region table."""
+    reg = regions(family)
+    for arr in (reg.counts, reg.intersections):
+        arr.setflags(write=False)
+    return Summary(reg, verify(reg), region_table(reg, TABLE_ROWS))
+
+
+@st.cache_resource(max_entries=8, show_spinner="Counting regions…")
+def simulated_summary(n, k):
+    """``summary`` of ``simulated(n, k)`` (shared across reruns; read-only)."""
+    return summary(simulated(n, k))
+
+
+@st.cache_resource(max_entries=8, show_spinner="Counting regions…")
+def upload_summary(file_id, name, cols, layout, _uploaded):
+    """``summary`` of ``upload_family`` (shared across reruns; read-only)."""
+    return summary(upload_family(file_id, name, cols, layout, _uploaded))
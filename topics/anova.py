@@ -3,6 +3,7 @@ import numpy as np
 import pandas as pd
 import plotly.graph_objects as go
 from scipy import stats
+from topics import _oneway, _resample, _uploads
 
 def render():
     st.markdown("""
@@ -71,47 +72,70 @@ def render():
 
     with tab2:
         st.markdown("<div class='section-card'><div class='section-label label-concept'>🧮 Interactive ANOVA Calculator</div>", unsafe_allow_html=True)
-        st.markdown("Enter data for each group (comma-separated):")
-        n_groups = st.number_input("Number of groups:", value=3, min_value=2, max_value=6)
+        input_mode = st.radio("Data source:", ["✍️ Type values", "📂 Upload CSV / Parquet"],
+                              horizontal=True, key="anova_mode")
+        colors = ['#4f46e5','#059669','#dc2626','#b45309','#7c3aed','#0284c7']
+        summary = None
         groups_data = []
-        cols = st.columns(int(n_groups))
-        for i in range(int(n_groups)):
-            with cols[i]:
-                defaults = ["82,87,79,93,88", "75,68,72,80,71", "91,95,89,97,93"]
-                default = defaults[i] if i < len(defaults) else "80,85,78,82"
-                raw = st.text_input(f"Group {i+1}:", default, key=f"anova_g{i}")
-                try:
-                    g = [float(x.strip()) for x in raw.split(',')]
-                    groups_data.append(np.array(g))
-                except:
-                    st.error("Invalid input")
-
-        if len(groups_data) >= 2 and all(len(g) >= 2 for g in groups_data):
-            f_stat, p_val = stats.f_oneway(*groups_data)
-            all_data = np.concatenate(groups_data)
-            grand_mean = all_data.mean()
-            k = len(groups_data)
-            n_T = len(all_data)
-            sstr = sum(len(g) * (g.mean() - grand_mean)**2 for g in groups_data)
-            sse = sum(np.sum((g - g.mean())**2) for g in groups_data)
-            sst = sstr + sse
-            mstr = sstr / (k - 1)
-            mse = sse / (n_T - k)
+        table = None
+        source = None   # identity of the data, so a saved permutation result is never shown for other data
+
+        if input_mode == "✍️ Type values":
+            st.markdown("Enter data for each group (comma-separated):")
+            n_groups = st.number_input("Number of groups:", value=3, min_value=2, max_value=6)
+            cols = st.columns(int(n_groups))
+            for i in range(int(n_groups)):
+                with cols[i]:
+                    defaults = ["82,87,79,93,88", "75,68,72,80,71", "91,95,89,97,93"]
+                    default = defaults[i] if i < len(defaults) else "80,85,78,82"
+                    raw = st.text_input(f"Group {i+1}:", default, key=f"anova_g{i}")
+                    try:
+                        g = [float(x.strip()) for x in raw.split(',')]
+                        groups_data.append(np.array(g))
+                    except:
+                        st.error("Invalid input")
+            if len(groups_data) >= 2 and all(len(g) >= 2 for g in groups_data):
+                summary = _oneway.summarize_arrays(groups_data)
+                source = tuple(tuple(g.tolist()) for g in groups_data)
+        else:
+            st.markdown("Upload a **long-format** table: one row per observation, with a value column and a group column.")
+            uploaded = st.file_uploader("Data file:", type=_uploads.FILE_TYPES, key="anova_file")
+            if uploaded is not None:
+                all_cols = _uploads.column_names(uploaded)
+                num_cols = _uploads.column_names(uploaded, numeric=True)
+                c1, c2 = st.columns(2)
+                value_col = c1.selectbox("Value column:", num_cols or all_cols, key="anova_value_col")
+                group_col = c2.selectbox("Group column:", [c for c in all_cols if c != value_col], key="anova_group_col")
+                if value_col and group_col:
+                    table = _uploads.read_table(uploaded, columns=[value_col, group_col])
+                    summary = _oneway.summarize(table[value_col], table[group_col])
+                    source = (uploaded.file_id, value_col, group_col)
+                    if len(summary) < 2 or (summary["n"].sum() - len(summary)) < 1:
+                        st.warning("Need at least two groups and more observations than groups.")
+                        summary = None
+
+        if summary is not None:
+            res = _oneway.oneway(summary)
+            f_stat, p_val = res.f, res.p
+            k, n_T, grand_mean = res.k, res.n_total, res.grand_mean
 
             col1, col2 = st.columns(2)
             with col1:
                 anova_df = pd.DataFrame({
                     'Source': ['Between', 'Within', 'Total'],
-                    'SS': [f"{sstr:.4f}", f"{sse:.4f}", f"{sst:.4f}"],
+                    'SS': [f"{res.sstr:.4f}", f"{res.sse:.4f}", f"{res.sst:.4f}"],
                     'df': [k-1, n_T-k, n_T-1],
-                    'MS': [f"{mstr:.4f}", f"{mse:.4f}", "—"],
+                    'MS': [f"{res.mstr:.4f}", f"{res.mse:.4f}", "—"],
                     'F': [f"{f_stat:.4f}", "—", "—"],
                     'p-value': [f"{p_val:.6f}", "—", "—"]
                 })
                 st.table(anova_df)
             with col2:
-                for i, g in enumerate(groups_data):
-                    st.metric(f"Group {i+1}: x̄", f"{g.mean():.3f} (n={len(g)}, s={g.std(ddof=1):.3f})")
+                if groups_data:
+                    for i, g in enumerate(groups_data):
+                        st.metric(f"Group {i+1}: x̄", f"{g.mean():.3f} (n={len(g)}, s={g.std(ddof=1):.3f})")
+                else:
+                    st.metric("Groups / observations", f"{k:,} / {n_T:,}")
                 st.metric("Grand Mean x̄", f"{grand_mean:.3f}")
 
             alpha_anova = st.selectbox("α:", [0.01, 0.05, 0.10], index=1, key="anova_alpha")
@@ -120,15 +144,53 @@ def render():
             else:
                 st.success(f"**Fail to reject H₀** (F={f_stat:.4f}, p={p_val:.6f} ≥ {alpha_anova}). No significant difference among group means.")
 
-            # Box plot
-            fig = go.Figure()
-            for i, g in enumerate(groups_data):
-                fig.add_trace(go.Box(y=g, name=f"Group {i+1}", marker_color=['#4f46e5','#059669','#dc2626','#b45309','#7c3aed','#0284c7'][i]))
-            fig.update_layout(title="Group Comparison Box Plot",
-                              paper_bgcolor='#ffffff', plot_bgcolor='#f8fafc',
-                              font_color='#111111', height=300,
-                              yaxis=dict(gridcolor='#e2e8f0'))
-            st.plotly_chart(fig, use_container_width=True)
+            with st.expander("🔀 Permutation F-test (no normality assumption)"):
+                st.markdown("Shuffles the group labels B times and reports how often the shuffled F is at least as large as the observed one.")
+                pc1, pc2 = st.columns(2)
+                perm_B = pc1.select_slider("Max permutations B:", [1_000, 10_000, 100_000, 1_000_000], value=10_000, key="anova_perm_B")
+                perm_tol = pc2.selectbox("Stop when MC error <", [None, 0.01, 0.005, 0.001],
+                                         format_func=lambda v: "never (run all B)" if v is None else str(v), index=2, key="anova_perm_tol")
+                perm_key = (source, perm_B, perm_tol)
+                if st.button("▶️ Run permutation test", key="anova_perm_run"):
+                    raw_groups = groups_data or [g.to_numpy(dtype=float) for _, g in
+                                                 table.dropna().groupby(group_col, sort=True)[value_col]]
+                    bar = st.progress(0.0, text="Shuffling group labels…")
+                    st.session_state.anova_perm = (perm_key, _resample.permutation_test(
+                        raw_groups, "anova", n_resamples=perm_B, tol=perm_tol,
+                        progress=lambda f, msg: bar.progress(min(f, 1.0), text=msg)))
+                    bar.empty()
+                saved = st.session_state.get("anova_perm")
+                if saved and saved[0] == perm_key:
+                    res = saved[1]
+                    m1, m2, m3 = st.columns(3)
+                    m1.metric("Permutation p-value", f"{res.p_value:.5f}", f"F-table p = {p_val:.5f}", delta_color="off")
+                    m2.metric("Monte Carlo ± SE", f"{res.mc_se:.5f}")
+                    m3.metric("Permutations used", f"{res.n_resamples:,}" + (" (stopped early)" if res.stopped_early else ""))
+
+            if groups_data:
+                # Box plot
+                fig = go.Figure()
+                for i, g in enumerate(groups_data):
+                    fig.add_trace(go.Box(y=g, name=f"Group {i+1}", marker_color=colors[i]))
+                fig.update_layout(title="Group Comparison Box Plot",
+                                  paper_bgcolor='#ffffff', plot_bgcolor='#f8fafc',
+                                  font_color='#111111', height=300,
+                                  yaxis=dict(gridcolor='#e2e8f0'))
+                st.plotly_chart(fig, use_container_width=True)
+            else:
+                group_table = summary.assign(sd=np.sqrt(summary["var"])).drop(columns="var")
+                st.dataframe(group_table, use_container_width=True, height=250)
+                fig = go.Figure(go.Scatter(
+                    x=group_table.index.astype(str), y=group_table["mean"], mode='markers',
+                    error_y=dict(type='data', array=1.96 * group_table["sd"] / np.sqrt(group_table["n"])),
+                    marker=dict(color='#4f46e5', size=7)))
+                fig.add_hline(y=grand_mean, line_dash="dot", line_color='#dc2626', annotation_text="Grand mean")
+                fig.update_layout(title="Group Means with 95% CI",
+                                  paper_bgcolor='#ffffff', plot_bgcolor='#f8fafc',
+                                  font_color='#111111', height=320,
+                                  xaxis=dict(gridcolor='#e2e8f0', title="Group"),
+                                  yaxis=dict(gridcolor='#e2e8f0', title="Mean"))
+                st.plotly_chart(fig, use_container_width=True)
         st.markdown("</div>", unsafe_allow_html=True)
 
     with tab3:
@@ -1,5 +1,7 @@
 import streamlit as st
 import numpy as np
+import plotly.graph_objects as go
+from topics import _bayes_grid, _bayes_updater, _figures, _uploads
 
 def render():
     st.markdown("""
@@ -88,6 +90,178 @@ In Bayesian inference, each new piece of evidence updates the posterior, which b
 
     st.markdown("</div>", unsafe_allow_html=True)
 
+    # ── SCENARIO EXPLORER ─────────────────────────────────────────────────────
+    st.markdown("<div class='section-card'><div class='section-label label-concept'>🗺️ Scenario Explorer</div>", unsafe_allow_html=True)
+    st.markdown("""
+The calculator above evaluates **one** scenario. Below, the posterior is evaluated for **every** combination of prior, sensitivity and false-positive rate on a grid — and for k repeated positive tests — using the odds form of Bayes' theorem:
+    """)
+    st.latex(r"\operatorname{logit} P(A \mid B_1,\ldots,B_k) = \operatorname{logit} P(A) + k \log\frac{P(B|A)}{P(B|A^c)}")
+    res = _bayes_grid.RESOLUTIONS[1]
+    if st.checkbox("Explore every scenario at once (builds the full 3-D grid)", key="bayes_explore"):
+        c1, c2, c3, c4 = st.columns(4)
+        res = c1.selectbox("Grid resolution:", _bayes_grid.RESOLUTIONS, index=1, key="bayes_res")
+        k_tests = c2.slider("Positive tests k:", 1, 5, 1, key="bayes_k")
+        fixed = c3.selectbox("Hold fixed:", list(_bayes_grid.AXES), index=2, format_func=_bayes_grid.AXES.get, key="bayes_fixed")
+        kind = c4.radio("Chart:", ["Heatmap", "Contours"], horizontal=True, key="bayes_kind")
+        scenario_value = {"prior": pA, "sens": pBgA, "fpr": pBgAc}
+        grid = _bayes_grid.axis(fixed, res)
+        held = st.select_slider(f"{_bayes_grid.AXES[fixed]}:", options=[float(v) for v in grid],
+                                value=float(grid[np.abs(np.log(grid) - np.log(scenario_value[fixed])).argmin()]),
+                                format_func=lambda v: f"{v:.4g}", key=f"bayes_held_{fixed}_{res}")
+        x_name, x, y_name, y, z, held = _bayes_grid.posterior_slice(res, k_tests, fixed, held)
+
+        def build_surface():
+            trace = go.Heatmap if kind == "Heatmap" else go.Contour
+            extra = {} if kind == "Heatmap" else dict(contours=dict(start=0.1, end=0.9, size=0.1, showlabels=True))
+            fig = go.Figure(trace(x=x, y=y, z=z, zmin=0, zmax=1, colorscale="RdBu_r",
+                                  colorbar=dict(title="P(A|B)"), **extra))
+            fig.add_trace(go.Scatter(x=[scenario_value[x_name]], y=[scenario_value[y_name]], mode='markers',
+                                     marker=dict(color='#111111', size=12, symbol='x'), name='Calculator scenario'))
+            fig.update_layout(
+                title=f"P(A | {k_tests} positive test{'s' if k_tests > 1 else ''}) with {_bayes_grid.AXES[fixed]} = {held:.4g}",
+                xaxis=dict(title=_bayes_grid.AXES[x_name], type="log" if x_name != "sens" else "linear"),
+                yaxis=dict(title=_bayes_grid.AXES[y_name], type="log" if y_name != "sens" else "linear"),
+                paper_bgcolor='#ffffff', plot_bgcolor='#f8fafc', font_color='#111111', height=440,
+                legend=dict(orientation="h", y=-0.2),
+            )
+            return fig
+
+        _figures.plotly_chart("bayes_theorem", "posterior_surface",
+                              {"res": res, "k": k_tests, "fixed": fixed, "held": held, "kind": kind,
+                               "scenario": [round(pA, 6), round(pBgA, 6), round(pBgAc, 6)]},
+                              build_surface, use_container_width=True)
+        st.caption(f"All {res**3:,} scenarios are computed in one broadcast and cached per resolution and k; "
+                   "the slider only selects a slice.")
+
+    st.markdown("#### 🔁 Sequential Updating")
+    k_max = st.slider("Number of repeated tests:", 1, 10, 5, key="bayes_seq_k")
+    j, pos, neg = _bayes_grid.sequential(pA, pBgA, pBgAc, k_max)
+    seq_params = {"k": k_max, "res": res, "scenario": [round(pA, 6), round(pBgA, 6), round(pBgAc, 6)]}
+
+    def build_sequential():
+        fig = go.Figure()
+        fig.add_trace(go.Scatter(x=j, y=pos, mode='lines+markers', line=dict(color='#dc2626', width=2), name='All positive'))
+        fig.add_trace(go.Scatter(x=j, y=neg, mode='lines+markers', line=dict(color='#059669', width=2), name='All negative'))
+        fig.update_layout(title="Posterior after each test (calculator scenario)", xaxis_title="Tests so far",
+                          yaxis=dict(title="P(A | results)", range=[0, 1]),
+                          paper_bgcolor='#ffffff', plot_bgcolor='#f8fafc', font_color='#111111', height=340)
+        return fig
+
+    def build_sequential_grid():
+        seq = _bayes_grid.sequential_grid(res, pBgA, pBgAc, k_max)
+        fig = go.Figure(go.Heatmap(x=_bayes_grid.axis("prior", res), y=np.arange(k_max + 1), z=seq.astype(np.float32),
+                                   zmin=0, zmax=1, colorscale="RdBu_r", colorbar=dict(title="P(A|B)")))
+        fig.update_layout(title="…for every prior", xaxis=dict(title="Prior P(A)", type="log"),
+                          yaxis=dict(title="Positive tests", dtick=1),
+                          paper_bgcolor='#ffffff', plot_bgcolor='#f8fafc', font_color='#111111', height=340)
+        return fig
+
+    col1, col2 = st.columns(2)
+    with col1:
+        _figures.plotly_chart("bayes_theorem", "sequential", seq_params, build_sequential, use_container_width=True)
+    with col2:
+        _figures.plotly_chart("bayes_theorem", "sequential_grid", seq_params, build_sequential_grid,
+                              use_container_width=True)
+    if pA >= 0.5:
+        st.info(f"With P(A) = {pA:.3g}, A is already at least as likely as not before any test.")
+    else:
+        st.info(f"With P(A) = {pA:.3g}, it takes {int(np.argmax(pos >= 0.5)) if (pos >= 0.5).any() else f'more than {k_max}'} "
+                "positive test(s) in a row before A becomes more likely than not.")
+    st.markdown("</div>", unsafe_allow_html=True)
+
+    # ── MANY HYPOTHESES ───────────────────────────────────────────────────────
+    st.markdown("<div class='section-card'><div class='section-label label-concept'>🧩 Many Hypotheses, Many Observations</div>", unsafe_allow_html=True)
+    st.markdown("""
+Bayes' theorem is not limited to {A, Aᶜ}. With hypotheses H₁,…,H_k the evidence term is the **total probability** over all of them, and each observation multiplies every hypothesis by its likelihood:
+    """)
+    st.latex(r"P(H_i \mid x_{1:t}) = \frac{P(H_i)\prod_{s\le t} P(x_s \mid H_i)}{\sum_{j=1}^{k} P(H_j)\prod_{s\le t} P(x_s \mid H_j)}")
+    st.markdown("""
+After a few thousand observations those products underflow to 0 in floating point, so the update is done on **log** probabilities and renormalized with the log-sum-exp trick:
+    """)
+    st.latex(r"\log P(H_i \mid x_{1:t}) = \log P(H_i \mid x_{1:t-1}) + \log P(x_t \mid H_i) - \log\sum_j e^{\,\log P(H_j \mid x_{1:t-1}) + \log P(x_t \mid H_j)}")
+    c1, c2, c3 = st.columns(3)
+    model = c1.selectbox("Model:", list(_bayes_updater.MODELS), format_func=lambda m: _bayes_updater.MODELS[m].label, key="multi_model")
+    k_hyp = c2.select_slider("Hypotheses k:", [10, 100, 1_000, 5_000], value=1_000, key="multi_k")
+    prior_kind = c3.selectbox("Prior:", list(_bayes_updater.PRIORS), format_func=_bayes_updater.PRIORS.get, key="multi_prior")
+    spec = _bayes_updater.MODELS[model]
+    source = st.radio("Observations:", ["Simulated", "Upload file (CSV / Parquet)"], horizontal=True, key="multi_source")
+    sigma, run, run_key, compute = 1.0, None, None, None
+    if source == "Simulated":
+        c1, c2, c3 = st.columns(3)
+        n_obs = c1.select_slider("Observations:", [100, 1_000, 10_000, 50_000], value=10_000, key="multi_n")
+        truth = c2.number_input(f"True {spec.param}:", value=spec.default_truth, min_value=spec.lower,
+                                max_value=spec.upper, key=f"multi_truth_{model}")
+        if model == "normal":
+            sigma = c3.number_input("σ:", value=2.0, min_value=0.01, key="multi_sigma")
+        run_key = [model, k_hyp, prior_kind, n_obs, truth, sigma]
+        compute = lambda: _bayes_updater.simulated_run(*run_key)
+    else:
+        uploaded = st.file_uploader("Data file:", type=_uploads.FILE_TYPES, key="multi_file")
+        if uploaded is not None:
+            col = st.selectbox("Column:", _uploads.column_names(uploaded, numeric=True), key="multi_col")
+            if col:
+                data = _bayes_updater.upload_column(uploaded.file_id, uploaded.name, col, uploaded)
+                if model == "normal":
+                    sigma = st.number_input("σ (known):", value=float(data.std(ddof=1)) if data.size > 1 else 1.0,
+                                            min_value=0.01, key="multi_sigma_up")
+                bad = (~np.isin(data, [0, 1])) if model == "bernoulli" else (data < 0) if model == "poisson" else None
+                if bad is not None and bad.any():
+                    st.error(f"{bad.sum():,} values are not valid for this model "
+                             f"({'0/1 outcomes' if model == 'bernoulli' else 'non-negative counts'}).")
+                elif data.size:
+                    run_key = [uploaded.file_id, col, model, k_hyp, prior_kind, sigma]
+                    compute = lambda: _bayes_updater.upload_run(uploaded.file_id, uploaded.name, col, model, k_hyp,
+                                                                prior_kind, sigma, uploaded)
+    if compute is not None and st.button("▶️ Run update", key="multi_run"):
+        with st.spinner("Updating every hypothesis…"):
+            st.session_state.multi_result = (run_key, compute())
+    saved = st.session_state.get("multi_result")
+    if saved and saved[0] == run_key:
+        run = saved[1]
+    if run is not None:
+        traj = run.trajectory
+        m1, m2, m3, m4 = st.columns(4)
+        m1.metric("MAP hypothesis", f"{traj.map[-1]:.4g}")
+        m2.metric("Posterior mean", f"{traj.mean[-1]:.4g}")
+        m3.metric("95% credible interval", f"[{traj.low[-1]:.4g}, {traj.high[-1]:.4g}]")
+        m4.metric("Update time (first run)", f"{run.seconds * 1000:.0f} ms",
+                  help="Runs are cached, so reruns with the same settings reuse this result and its timing.")
+        st.caption(f"{k_hyp:,} hypotheses on [{traj.grid[0]:.4g}, {traj.grid[-1]:.4g}] × {run.n:,} observations; "
+                   f"posterior stored at {traj.steps.size} checkpoints.")
+        if _bayes_updater.on_edge(traj):
+            st.warning(f"The MAP sits on the edge of the hypothesis grid ({traj.map[-1]:.4g}), so the true "
+                       f"{spec.param} is probably outside [{traj.grid[0]:.4g}, {traj.grid[-1]:.4g}] and the "
+                       "credible interval is cut off there.")
+
+        def build_heatmap():
+            x, z = _bayes_updater.heatmap(traj)
+            fig = go.Figure(go.Heatmap(x=x, y=np.maximum(traj.steps, 0.5), z=z,
+                                       colorscale="Viridis", colorbar=dict(title="P(H)")))
+            fig.update_layout(title="Posterior over hypotheses as data arrive",
+                              xaxis_title=spec.param, yaxis=dict(title="Observations", type="log"),
+                              paper_bgcolor='#ffffff', plot_bgcolor='#f8fafc', font_color='#111111', height=380)
+            return fig
+
+        def build_band():
+            steps = np.maximum(traj.steps, 0.5)
+            fig = go.Figure()
+            fig.add_trace(go.Scatter(x=np.r_[steps, steps[::-1]], y=np.r_[traj.high, traj.low[::-1]], fill='toself',
+                                     fillcolor='rgba(79,70,229,0.2)', line=dict(width=0), name='95% credible band'))
+            fig.add_trace(go.Scatter(x=steps, y=traj.map, mode='lines', line=dict(color='#4f46e5', width=2), name='MAP'))
+            if source == "Simulated":
+                fig.add_hline(y=truth, line_dash="dash", line_color="#dc2626", annotation_text="truth")
+            fig.update_layout(title="MAP and credible band", xaxis=dict(title="Observations", type="log"),
+                              yaxis_title=spec.param, paper_bgcolor='#ffffff', plot_bgcolor='#f8fafc',
+                              font_color='#111111', height=380)
+            return fig
+
+        col1, col2 = st.columns(2)
+        with col1:
+            _figures.plotly_chart("bayes_theorem", "multi_heatmap", run_key, build_heatmap, use_container_width=True)
+        with col2:
+            _figures.plotly_chart("bayes_theorem", "multi_band", run_key, build_band, use_container_width=True)
+    st.markdown("</div>", unsafe_allow_html=True)
+
     st.markdown("<div class='section-card'><div class='section-label label-solved'>✅ Solved Problems</div>", unsafe_allow_html=True)
 
     st.markdown("<span class='prob-badge'>Problem 1 — Basic</span>", unsafe_allow_html=True)
@@ -1,7 +1,7 @@
 import streamlit as st
 import numpy as np
 import plotly.graph_objects as go
-from scipy import stats
+from topics import _engine
 from math import comb as math_comb
 
 def render():
@@ -128,8 +128,8 @@ The **Binomial distribution** models the number of successes in **n independent
 
 **Solution:** X ~ B(20, 0.3)
         """)
-        pa = 1 - stats.binom.cdf(7, 20, 0.3)
-        pb = stats.binom.cdf(7, 20, 0.3) - stats.binom.cdf(3, 20, 0.3)
+        pa = 1 - _engine.cdf("binom", 7, 20, 0.3)
+        pb = _engine.cdf("binom", 7, 20, 0.3) - _engine.cdf("binom", 3, 20, 0.3)
         st.latex(rf"(a)\;P(X\geq8) = 1-P(X\leq7) = 1-F(7) \approx \mathbf{{{pa:.4f}}}")
         st.latex(rf"(b)\;P(4\leq X\leq7) = F(7)-F(3) \approx \mathbf{{{pb:.4f}}}")
 
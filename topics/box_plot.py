@@ -1,6 +1,8 @@
 import streamlit as st
 import numpy as np
+import pandas as pd
 import plotly.graph_objects as go
+from topics import _boxstats, _figures, _uploads
 
 def render():
     st.markdown("""
@@ -64,24 +66,55 @@ Box plots are particularly powerful for **comparing multiple groups** side-by-si
 
     # Interactive box plot
     st.markdown("#### 🎛️ Interactive Box Plot")
-    np.random.seed(42)
-    group_a = np.random.normal(70, 10, 50)
-    group_b = np.concatenate([np.random.normal(65, 8, 45), [20, 110, 115]])  # with outliers
-    group_c = np.random.normal(80, 5, 50)
-
-    fig = go.Figure()
-    for data, name, color in zip([group_a, group_b, group_c],
-                                  ['Group A (Normal)', 'Group B (Outliers)', 'Group C (Tight)'],
-                                  ['#667eea', '#fbbf24', '#34d399']):
-        fig.add_trace(go.Box(y=data, name=name, marker_color=color,
-                             boxpoints='outliers', jitter=0.3))
-    fig.update_layout(
-        title="Comparing Three Groups with Box Plots",
-        paper_bgcolor='#ffffff', plot_bgcolor='#f8fafc',
-        font_color='#111111', height=380,
-        yaxis=dict(title='Value', gridcolor='#e2e8f0'),
-    )
-    st.plotly_chart(fig, use_container_width=True)
+    source = st.radio("Data:", ["Example (3 groups)", "Simulated (many groups)", "Upload file (CSV / Parquet)"],
+                      horizontal=True, key="box_source")
+    layout = dict(paper_bgcolor='#ffffff', plot_bgcolor='#f8fafc', font_color='#111111', height=380,
+                  yaxis=dict(title='Value', gridcolor='#e2e8f0'))
+    stats = None
+    if source.startswith("Example"):
+        def build_groups():
+            np.random.seed(42)
+            group_a = np.random.normal(70, 10, 50)
+            group_b = np.concatenate([np.random.normal(65, 8, 45), [20, 110, 115]])  # with outliers
+            group_c = np.random.normal(80, 5, 50)
+            names = ['Group A (Normal)', 'Group B (Outliers)', 'Group C (Tight)']
+            values = np.concatenate([group_a, group_b, group_c])
+            groups = np.repeat(names, [group_a.size, group_b.size, group_c.size])
+            fig = go.Figure(_boxstats.traces(_boxstats.box_stats(values, groups),
+                                             colors=['#667eea', '#fbbf24', '#34d399']))
+            fig.update_layout(title="Comparing Three Groups with Box Plots", **layout)
+            return fig
+
+        _figures.plotly_chart("box_plot", "three_groups", {}, build_groups, use_container_width=True)
+    elif source.startswith("Simulated"):
+        c1, c2 = st.columns(2)
+        k = c1.select_slider("Groups:", [10, 50, 100, 300], value=100, key="box_k")
+        per = c2.select_slider("Points per group:", [1_000, 10_000, 30_000], value=10_000, key="box_per")
+        stats = _boxstats.simulated_box_stats(k, per)
+    else:
+        uploaded = st.file_uploader("Data file:", type=_uploads.FILE_TYPES, key="box_file")
+        if uploaded is not None:
+            c1, c2 = st.columns(2)
+            value_col = c1.selectbox("Value column:", _uploads.column_names(uploaded, numeric=True), key="box_value")
+            group_col = c2.selectbox("Group by:", ["(none)"] + _uploads.column_names(uploaded), key="box_group")
+            if value_col:
+                stats = _boxstats.upload_box_stats(uploaded.file_id, uploaded.name, value_col,
+                                                   None if group_col == "(none)" else group_col, uploaded)
+    if stats:
+        fig = go.Figure(_boxstats.traces(stats))
+        total = sum(s.n for s in stats)
+        fig.update_layout(title=f"{len(stats):,} groups, {total:,} points", showlegend=False, **layout)
+        st.plotly_chart(fig, use_container_width=True)
+        drawn = sum(s.outliers.size for s in stats)
+        n_out = sum(s.n_outliers for s in stats)
+        st.caption(f"Quartiles are {stats[0].method}; each box is sent as five numbers. "
+                   f"{n_out:,} Tukey outliers" + (f", {drawn:,} drawn." if drawn < n_out else "."))
+        st.dataframe(pd.DataFrame([s._asdict() for s in stats]).drop(columns=["outliers", "method"])
+                     .rename(columns={"lowerfence": "lower whisker", "upperfence": "upper whisker",
+                                      "n_outliers": "outliers"}).set_index("name"),
+                     use_container_width=True, height=min(38 + 35 * len(stats), 320))
+    elif stats is not None:
+        st.warning("No numeric values found.")
     st.markdown("</div>", unsafe_allow_html=True)
 
     # ── SOLVED PROBLEMS ───────────────────────────────────────────────────────
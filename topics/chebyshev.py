@@ -1,6 +1,7 @@
 import streamlit as st
 import numpy as np
 import plotly.graph_objects as go
+from topics import _figures
 
 def render():
     st.markdown("""
@@ -75,25 +76,28 @@ It is a *worst-case guarantee* — the actual proportion is often much higher, a
 
     # Visualization
     st.markdown("#### 📊 Chebyshev Bounds vs Normal Distribution")
-    k_vals = np.linspace(1.1, 5, 100)
-    cheb = (1 - 1/k_vals**2) * 100
-    from scipy import stats
-    normal = stats.norm.cdf(k_vals)*100 - stats.norm.cdf(-k_vals)*100
-
-    fig = go.Figure()
-    fig.add_trace(go.Scatter(x=k_vals, y=cheb, name="Chebyshev (any dist)", line=dict(color='#fbbf24', width=3)))
-    fig.add_trace(go.Scatter(x=k_vals, y=normal, name="Normal (68-95-99.7)", line=dict(color='#667eea', width=3)))
-    fig.add_hline(y=75, line_dash="dot", line_color="rgba(255,255,255,0.3)", annotation_text="75%")
-    fig.add_hline(y=95, line_dash="dot", line_color="rgba(255,255,255,0.3)", annotation_text="95%")
-    fig.update_layout(
-        title="Coverage within k Standard Deviations",
-        xaxis_title="k (number of SDs)", yaxis_title="% of data captured",
-        paper_bgcolor='#ffffff', plot_bgcolor='#f8fafc',
-        font_color='#111111', height=350, legend=dict(bgcolor='rgba(240,240,255,0.9)', font=dict(color='#111111')),
-        xaxis=dict(gridcolor='#e2e8f0'),
-        yaxis=dict(gridcolor='#e2e8f0', range=[50, 101]),
-    )
-    st.plotly_chart(fig, use_container_width=True)
+    def build_coverage():
+        k_vals = np.linspace(1.1, 5, 100)
+        cheb = (1 - 1/k_vals**2) * 100
+        from topics import _engine
+        normal = _engine.cdf("norm", k_vals)*100 - _engine.cdf("norm", -k_vals)*100
+
+        fig = go.Figure()
+        fig.add_trace(go.Scatter(x=k_vals, y=cheb, name="Chebyshev (any dist)", line=dict(color='#fbbf24', width=3)))
+        fig.add_trace(go.Scatter(x=k_vals, y=normal, name="Normal (68-95-99.7)", line=dict(color='#667eea', width=3)))
+        fig.add_hline(y=75, line_dash="dot", line_color="rgba(255,255,255,0.3)", annotation_text="75%")
+        fig.add_hline(y=95, line_dash="dot", line_color="rgba(255,255,255,0.3)", annotation_text="95%")
+        fig.update_layout(
+            title="Coverage within k Standard Deviations",
+            xaxis_title="k (number of SDs)", yaxis_title="% of data captured",
+            paper_bgcolor='#ffffff', plot_bgcolor='#f8fafc',
+            font_color='#111111', height=350, legend=dict(bgcolor='rgba(240,240,255,0.9)', font=dict(color='#111111')),
+            xaxis=dict(gridcolor='#e2e8f0'),
+            yaxis=dict(gridcolor='#e2e8f0', range=[50, 101]),
+        )
+        return fig
+
+    _figures.plotly_chart("chebyshev", "coverage_vs_normal", {}, build_coverage, use_container_width=True)
     st.markdown("</div>", unsafe_allow_html=True)
 
     # ── SOLVED PROBLEMS ───────────────────────────────────────────────────────
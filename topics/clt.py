@@ -1,7 +1,7 @@
 import streamlit as st
 import numpy as np
 import plotly.graph_objects as go
-from scipy import stats
+from topics import _engine, _render, _sampling
 
 def render():
     st.markdown("""
@@ -48,30 +48,23 @@ This is why the Normal distribution dominates statistics: hypothesis tests, conf
     col1, col2 = st.columns([1, 2])
     with col1:
         pop_shape = st.selectbox("Population shape:", ["Uniform", "Exponential (Skewed)", "Bimodal"])
-        n_samp = st.slider("Sample size (n):", 1, 100, 30, key="clt_n")
-        n_sims = 2000
+        n_samp = st.slider("Sample size (n):", 1, _sampling.N_MAX, 30, key="clt_n")
+        n_sims = st.select_slider("Number of simulated samples:",
+                                  [2_000, 10_000, 100_000, 1_000_000], value=2_000, key="clt_sims")
+        if n_sims > _sampling.MATRIX_MAX_SIMS:
+            st.caption("Large runs are streamed in chunks straight into histogram bins.")
     with col2:
-        np.random.seed(42)
-        if pop_shape == "Uniform":
-            pop = np.random.uniform(0, 10, (n_sims, n_samp))
-            mu_t, sig_t = 5, np.sqrt(100/12)
-        elif pop_shape == "Exponential (Skewed)":
-            pop = np.random.exponential(2, (n_sims, n_samp))
-            mu_t, sig_t = 2, 2
-        else:
-            pop = np.concatenate([np.random.normal(3, 0.5, (n_sims, n_samp//2)),
-                                  np.random.normal(7, 0.5, (n_sims, n_samp - n_samp//2))], axis=1)
-            mu_t, sig_t = 5, np.sqrt(4 + 0.25)
-        means = pop.mean(axis=1)
-        x_th = np.linspace(means.min(), means.max(), 200)
-        y_th = stats.norm.pdf(x_th, mu_t, sig_t / np.sqrt(n_samp))
+        pop = _sampling.POPULATIONS[pop_shape]
+        mu_t, sig_t = pop.mean, pop.sd
+        edges, density = _sampling.sample_mean_histogram(pop_shape, n_samp, n_sims)
+        x_th = np.linspace(edges[0], edges[-1], 200)
+        y_th = _engine.pdf("norm", x_th, mu_t, sig_t / np.sqrt(n_samp))
 
         fig = go.Figure()
-        fig.add_trace(go.Histogram(x=means, nbinsx=40, name="Sample means",
-                                    marker_color='#4f46e5', opacity=0.7, histnorm='probability density'))
+        fig.add_trace(_render.bars(edges, density, name="Sample means", marker_color='#4f46e5', opacity=0.7))
         fig.add_trace(go.Scatter(x=x_th, y=y_th, name="Normal approx",
                                   line=dict(color='#dc2626', width=3)))
-        fig.update_layout(title=f"CLT: {pop_shape} pop, n={n_samp}, {n_sims} samples",
+        fig.update_layout(title=f"CLT: {pop_shape} pop, n={n_samp}, {n_sims:,} samples", bargap=0,
                           paper_bgcolor='#ffffff', plot_bgcolor='#f8fafc',
                           font_color='#111111', height=320,
                           xaxis=dict(gridcolor='#e2e8f0', title="Sample mean"),
@@ -1,5 +1,7 @@
 import streamlit as st
 import numpy as np
+import plotly.graph_objects as go
+from topics import _bayes_grid, _figures
 
 def render():
     st.markdown("""
@@ -75,6 +77,29 @@ This is arguably the most practically important concept in applied probability 
         else:
             st.error("Check inputs: P(A∩B) must be ≤ min(P(A), P(B))")
 
+    st.markdown("#### 🗺️ Every P(A|B) for this P(A)")
+    res_c = st.selectbox("Grid resolution:", _bayes_grid.RESOLUTIONS[:2], index=1, key="cond_res")
+    g, cube = _bayes_grid.conditional_cube(res_c)
+    ia = int(np.abs(g - pA).argmin())
+
+    def build_region():
+        fig = go.Figure(go.Heatmap(x=g, y=g, z=cube[ia].T, zmin=0, zmax=1, colorscale="Viridis",
+                                   colorbar=dict(title="P(A|B)"), hoverongaps=False))
+        fig.add_trace(go.Scatter(x=g, y=g[ia] * g, mode='lines', line=dict(color='#ffffff', dash='dash'),
+                                 name='Independent: P(A∩B) = P(A)·P(B)'))
+        fig.add_trace(go.Scatter(x=[pB], y=[pAandB], mode='markers', marker=dict(color='#dc2626', size=12, symbol='x'),
+                                 name='Your inputs'))
+        fig.update_layout(title=f"P(A|B) over P(B) × P(A∩B) with P(A) = {g[ia]:.2f} (blank = impossible)",
+                          xaxis=dict(title="P(B)", range=[0, 1]), yaxis=dict(title="P(A ∩ B)", range=[0, 1]),
+                          paper_bgcolor='#ffffff', plot_bgcolor='#f8fafc', font_color='#111111', height=420,
+                          legend=dict(orientation="h", y=-0.2))
+        return fig
+
+    _figures.plotly_chart("conditional_probability", "feasible_region",
+                          {"res": res_c, "pA": round(float(g[ia]), 6), "pB": pB, "pAB": pAandB},
+                          build_region, use_container_width=True)
+    st.caption("Above the dashed line A and B are positively associated (P(A|B) > P(A)); below it, negatively.")
+
     st.markdown("</div>", unsafe_allow_html=True)
 
     # ── SOLVED PROBLEMS ───────────────────────────────────────────────────────
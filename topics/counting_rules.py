@@ -1,6 +1,7 @@
 import streamlit as st
 import numpy as np
-from math import factorial, comb, perm
+import plotly.graph_objects as go
+from topics import _counting
 
 def render():
     st.markdown("""
@@ -20,6 +21,18 @@ Core rules: **Multiplication Rule → Permutations → Combinations → Partitio
 
     st.markdown("<div class='section-card'><div class='section-label label-concept'>💡 Key Concepts & Formulas</div>", unsafe_allow_html=True)
 
+    def show_count(label, c, key):
+        # The magnitude is O(1); exact digits are only built when asked for
+        st.metric(label, _counting.scientific(c))
+        if _counting.log10(c) >= 15 and st.checkbox(f"Show all ≈{_counting.n_digits(c):,} digits", key=key):
+            digits = _counting.exact(c)
+            if len(digits) <= _counting.DIGITS_INLINE:
+                st.code("\n".join(digits[i:i + 100] for i in range(0, len(digits), 100)), language=None)
+            else:
+                st.code(f"{digits[:60]}…{digits[-60:]}", language=None)
+                st.download_button(f"⬇️ Download all {len(digits):,} digits", digits, file_name=f"{c.kind}.txt",
+                                   key=f"{key}_dl")
+
     tab1, tab2, tab3, tab4 = st.tabs(["✖️ Multiplication", "🔄 Permutations", "🎯 Combinations", "📦 Partition"])
 
     with tab1:
@@ -48,14 +61,28 @@ Number of 3-course meals = 3 × 5 × 4 = **60 meals**
 **Order matters examples:** Race rankings, passwords, seating arrangements, scheduling tasks.
         """)
         st.markdown("#### 🧮 Calculator")
-        col1, col2 = st.columns(2)
-        with col1:
-            n_p = st.number_input("n:", value=10, min_value=1, max_value=20, key="perm_n")
-        with col2:
-            r_p = st.number_input("r:", value=3, min_value=0, max_value=int(n_p), key="perm_r")
-        if r_p <= n_p:
-            result = perm(int(n_p), int(r_p))
-            st.metric(f"P({int(n_p)},{int(r_p)}) =", f"{result:,}")
+        kind = st.radio("Count:", ["perm", "power", "circular", "multiset"], format_func=_counting.KINDS.get,
+                        horizontal=True, key="perm_kind")
+        try:
+            if kind == "multiset":
+                raw = st.text_input("Copies of each item type (n₁, n₂, …):", "3, 3, 1, 2, 1", key="perm_parts")
+                parts = [int(v) for v in raw.split(",") if v.strip()]
+                show_count(f"{sum(parts)}!/({'·'.join(f'{v}!' for v in parts)}) =",
+                           _counting.count("multiset", parts), "perm_digits")
+            elif kind == "circular":
+                n_p = st.number_input("n:", value=10, min_value=1, max_value=_counting.N_MAX, key="perm_circ_n")
+                show_count(f"({int(n_p)}−1)! =", _counting.count("circular", n_p), "perm_digits")
+            else:
+                col1, col2 = st.columns(2)
+                with col1:
+                    n_p = st.number_input("n:", value=10, min_value=1, max_value=_counting.N_MAX, key="perm_n")
+                with col2:
+                    r_max = _counting.N_MAX if kind == "power" else int(n_p)
+                    r_p = st.number_input("r:", value=min(3, r_max), min_value=0, max_value=r_max, key=f"perm_r_{kind}")
+                label = f"P({int(n_p)},{int(r_p)}) =" if kind == "perm" else f"{int(n_p)}^{int(r_p)} ="
+                show_count(label, _counting.count(kind, n_p, r_p), "perm_digits")
+        except ValueError as e:
+            st.warning(str(e) if str(e).startswith("Need") else "Please enter comma-separated whole numbers.")
 
     with tab3:
         st.markdown("### Combinations — Order does NOT matter")
@@ -73,12 +100,36 @@ Number of 3-course meals = 3 × 5 × 4 = **60 meals**
         st.markdown("#### 🧮 Calculator")
         col1, col2 = st.columns(2)
         with col1:
-            n_c = st.number_input("n:", value=52, min_value=1, max_value=52, key="comb_n")
+            n_c = st.number_input("n:", value=52, min_value=1, max_value=_counting.N_MAX, key="comb_n")
         with col2:
             r_c = st.number_input("r:", value=5, min_value=0, max_value=int(n_c), key="comb_r")
         if r_c <= n_c:
-            result_c = comb(int(n_c), int(r_c))
-            st.metric(f"C({int(n_c)},{int(r_c)}) =", f"{result_c:,}")
+            show_count(f"C({int(n_c)},{int(r_c)}) =", _counting.count("comb", n_c, r_c), "comb_digits")
+
+        st.markdown("#### 🔺 Pascal's Triangle Rows")
+        n_row = st.number_input("Row n:", value=10, min_value=0, max_value=_counting.N_MAX, key="pascal_n")
+        n_row = int(n_row)
+        if n_row <= 12:
+            rows = [" ".join(f"{v:>4}" for v in _counting.pascal_row(i)) for i in range(n_row + 1)]
+            width = len(rows[-1])
+            st.code("\n".join(r.center(width) for r in rows), language=None)
+        lg = _counting.log10_row(n_row)
+        k = np.arange(n_row + 1)
+        # Row n as log₁₀ C(n,k): magnitudes from log-gamma, so any row is instant
+        trace = go.Scattergl if n_row > 1_000 else go.Scatter
+        fig = go.Figure(trace(x=k, y=lg, mode='lines' if n_row > 60 else 'lines+markers',
+                              line=dict(color='#4f46e5', width=2), name='log₁₀ C(n,k)'))
+        fig.update_layout(title=f"Row {n_row:,}: largest entry C({n_row:,},{n_row // 2:,}) ≈ 10^{lg.max():,.2f}",
+                          xaxis_title="k", yaxis_title="log₁₀ C(n, k)",
+                          paper_bgcolor='#ffffff', plot_bgcolor='#f8fafc', font_color='#111111', height=300)
+        st.plotly_chart(fig, use_container_width=True)
+        if n_row <= _counting.ROW_MAX:
+            if st.checkbox("Prepare the exact row for download", key="pascal_dl_ready"):
+                st.download_button(f"⬇️ Download row {n_row:,} (CSV)",
+                                   "k,C(n;k)\n" + "\n".join(f"{i},{v}" for i, v in enumerate(_counting.pascal_row(n_row))),
+                                   file_name=f"pascal_row_{n_row}.csv", key="pascal_dl")
+        else:
+            st.caption(f"Exact rows are available up to n = {_counting.ROW_MAX:,}.")
 
     with tab4:
         st.markdown("### Partition Rule (Multinomial Coefficient)")
@@ -91,6 +142,14 @@ Number of 3-course meals = 3 × 5 × 4 = **60 meals**
 **Multinomial Theorem:**
         """)
         st.latex(r"(x_1+x_2+\cdots+x_k)^n = \sum_{n_1+\cdots+n_k=n} \binom{n}{n_1,\ldots,n_k}\prod x_i^{n_i}")
+        st.markdown("#### 🧮 Calculator")
+        raw = st.text_input("Group sizes (n₁, n₂, …):", "3, 4, 3", key="multi_parts")
+        try:
+            parts = [int(v) for v in raw.split(",") if v.strip()]
+            show_count(f"{sum(parts)}!/({'·'.join(f'{v}!' for v in parts)}) =",
+                       _counting.count("multinomial", parts), "multi_digits")
+        except ValueError as e:
+            st.warning(str(e) if str(e).startswith("Need") else "Please enter comma-separated whole numbers.")
 
     st.markdown("</div>", unsafe_allow_html=True)
 
@@ -1,7 +1,7 @@
 import streamlit as st
 import numpy as np
 import plotly.graph_objects as go
-from scipy import stats
+from topics import _coverage, _engine, _render, _resample, _uploads
 
 def render():
     st.markdown("""
@@ -11,7 +11,8 @@ def render():
     </div>
     """, unsafe_allow_html=True)
 
-    tab1, tab2 = st.tabs(["🎯 Point Estimation", "📐 Confidence Intervals"])
+    tab1, tab2, tab3, tab4 = st.tabs(["🎯 Point Estimation", "📐 Confidence Intervals", "🔁 Bootstrap CIs",
+                                      "🎲 Coverage Simulator"])
 
     with tab1:
         st.markdown("<div class='section-card'><div class='section-label label-concept'>💡 Point Estimation</div>", unsafe_allow_html=True)
@@ -81,12 +82,12 @@ This does NOT mean there is a 95% probability the parameter is in this specific
             conf = st.selectbox("Confidence level:", [0.90, 0.95, 0.99], index=1)
             alpha = 1 - conf
             if sigma_known:
-                z_star = stats.norm.ppf(1 - alpha/2)
+                z_star = _engine.ppf("norm", 1 - alpha/2)
                 se = sig / np.sqrt(n_ci)
                 moe = z_star * se
                 method = f"Z = {z_star:.3f}"
             else:
-                t_star = stats.t.ppf(1 - alpha/2, n_ci - 1)
+                t_star = _engine.ppf("t", 1 - alpha/2, n_ci - 1)
                 se = sig / np.sqrt(n_ci)
                 moe = t_star * se
                 method = f"t({n_ci-1}) = {t_star:.3f}"
@@ -96,6 +97,144 @@ This does NOT mean there is a 95% probability the parameter is in this specific
         st.success(f"**{conf:.0%} CI:** ({lo:.4f}, {hi:.4f})  |  Method: {method}")
         st.markdown("</div>", unsafe_allow_html=True)
 
+    with tab3:
+        st.markdown("<div class='section-card'><div class='section-label label-concept'>💡 The Bootstrap</div>", unsafe_allow_html=True)
+        st.markdown("""
+When the sampling distribution of a statistic has no convenient formula (a median, a skewed population, a small n), **resample the sample**: draw n values *with replacement*, recompute the statistic, and repeat B times. The spread of those B replicates estimates the statistic's sampling variability.
+
+- **Percentile interval** — the α/2 and 1 − α/2 quantiles of the replicates
+- **BCa interval** — shifts those quantiles to correct for **bias** (z₀) and for a standard error that changes with the parameter (**acceleration** a, from the jackknife)
+        """)
+        st.latex(r"\alpha_1 = \Phi\!\left(z_0 + \frac{z_0 + z_{\alpha/2}}{1 - a(z_0 + z_{\alpha/2})}\right),\qquad z_0 = \Phi^{-1}\!\left(\frac{\#\{\hat\theta^* < \hat\theta\}}{B}\right)")
+        st.markdown("</div>", unsafe_allow_html=True)
+
+        st.markdown("<div class='section-card'><div class='section-label label-solved'>🧮 Bootstrap CI Calculator</div>", unsafe_allow_html=True)
+        source = st.radio("Data:", ["Example (skewed, n = 80)", "Type values", "Upload file (CSV / Parquet)"],
+                          horizontal=True, key="boot_source")
+        data = None
+        if source.startswith("Example"):
+            data = np.random.default_rng(7).lognormal(3.0, 0.6, 80).round(2)
+        elif source == "Type values":
+            raw = st.text_input("Comma-separated values:", "12, 15, 9, 22, 31, 14, 18, 11, 45, 16, 13, 20", key="boot_raw")
+            try:
+                data = np.array([float(v) for v in raw.split(",") if v.strip()])
+            except ValueError:
+                st.error("Could not parse the values.")
+        else:
+            uploaded = st.file_uploader("Data file:", type=_uploads.FILE_TYPES, key="boot_file")
+            if uploaded is not None:
+                num_cols = _uploads.column_names(uploaded, numeric=True)
+                col = st.selectbox("Column:", num_cols, key="boot_col")
+                if col:
+                    data = _uploads.read_table(uploaded, columns=[col])[col].dropna().to_numpy(dtype=float)
+
+        c1, c2, c3, c4 = st.columns(4)
+        b_stat = c1.selectbox("Statistic:", list(_resample.STATISTICS), format_func=_resample.STATISTICS.get, key="boot_stat")
+        b_method = c2.selectbox("Interval:", list(_resample.CI_METHODS), format_func=_resample.CI_METHODS.get, index=1, key="boot_method")
+        b_level = c3.selectbox("Confidence level:", [0.90, 0.95, 0.99], index=1, key="boot_level")
+        b_n = c4.select_slider("Resamples B:", [1_000, 10_000, 100_000, 1_000_000], value=10_000, key="boot_B")
+
+        if data is not None and data.size >= 3:
+            st.caption(f"n = {data.size:,} observations")
+            if st.button("▶️ Run bootstrap", key="boot_run"):
+                bar = st.progress(0.0, text="Resampling…")
+                st.session_state.boot_result = (
+                    (b_stat, b_method, b_level, b_n, data.size, float(data.sum())),
+                    _resample.bootstrap_ci([data], b_stat, b_n, b_level, b_method,
+                                           progress=lambda f, msg: bar.progress(min(f, 1.0), text=msg)),
+                )
+                bar.empty()
+            saved = st.session_state.get("boot_result")
+            if saved and saved[0] == (b_stat, b_method, b_level, b_n, data.size, float(data.sum())):
+                res = saved[1]
+                m1, m2, m3, m4 = st.columns(4)
+                m1.metric(f"Sample {b_stat}", f"{res.estimate:.4f}")
+                m2.metric(f"{b_level:.0%} CI", f"({res.low:.3f}, {res.high:.3f})")
+                m3.metric("Bootstrap SE", f"{res.se:.4f}")
+                m4.metric("Bootstrap bias", f"{res.bias:+.4f}")
+                if b_stat == "mean":
+                    t_star = _engine.ppf("t", 1 - (1 - b_level) / 2, data.size - 1)
+                    moe = t_star * data.std(ddof=1) / np.sqrt(data.size)
+                    st.info(f"t-interval for comparison: ({data.mean() - moe:.3f}, {data.mean() + moe:.3f})")
+                fig = go.Figure(_render.histogram(res.replicates, bins=60, marker_color='#818cf8', name='Replicates'))
+                for v, name in [(res.low, "lower"), (res.high, "upper")]:
+                    fig.add_vline(x=v, line_dash="dash", line_color="#dc2626", annotation_text=f"{name} {v:.3f}")
+                fig.add_vline(x=res.estimate, line_color="#111111", annotation_text="estimate")
+                fig.update_layout(title=f"Bootstrap distribution of the {b_stat} (B = {b_n:,})",
+                                  xaxis_title=b_stat.capitalize(), yaxis_title="Count", bargap=0,
+                                  paper_bgcolor='#ffffff', plot_bgcolor='#f8fafc', font_color='#111111', height=340)
+                st.plotly_chart(fig, use_container_width=True)
+        elif data is not None:
+            st.warning("Need at least 3 observations.")
+        st.markdown("</div>", unsafe_allow_html=True)
+
+    with tab4:
+        st.markdown("<div class='section-card'><div class='section-label label-concept'>💡 What \"95% confident\" means</div>", unsafe_allow_html=True)
+        st.markdown("""
+Draw many samples from a population with a **known** mean, build an interval from each, and count how often the intervals capture μ. That fraction is the interval's **coverage**; a 95% method should capture μ about 95% of the time.
+
+- **z, σ known** — exact for a normal population, whatever n
+- **z with s plugged in** — ignores the extra uncertainty in s and **undercovers** when n is small
+- **t with s** — widens the interval through t*₍ₙ₋₁₎ to pay for estimating σ
+        """)
+        st.markdown("</div>", unsafe_allow_html=True)
+
+        st.markdown("<div class='section-card'><div class='section-label label-solved'>🧮 Coverage Simulator</div>", unsafe_allow_html=True)
+        c1, c2, c3, c4 = st.columns(4)
+        c_pop = c1.selectbox("Population:", list(_coverage.POPULATIONS),
+                             format_func=lambda k: _coverage.POPULATIONS[k].label, key="cov_pop")
+        c_n = c2.select_slider("Sample size n:", [2, 3, 5, 8, 10, 15, 20, 30, 50, 100, 200], value=5, key="cov_n")
+        c_level = c3.selectbox("Confidence level:", [0.90, 0.95, 0.99], index=1, key="cov_level")
+        c_reps = c4.select_slider("Samples:", [1_000, 10_000, 50_000, 100_000, 500_000], value=50_000, key="cov_reps")
+
+        if st.button("▶️ Run simulation", key="cov_run"):
+            bar = st.progress(0.0, text="Sampling…")
+            st.session_state.cov_result = _coverage.simulate(
+                c_pop, c_n, c_reps, c_level, progress=lambda f, msg: bar.progress(min(f, 1.0), text=msg))
+            bar.empty()
+        res = st.session_state.get("cov_result")
+        if res and (res.population, res.n, res.level, res.reps) == (c_pop, c_n, c_level, c_reps):
+            cols = st.columns(len(_coverage.METHODS))
+            for col, (m, label) in zip(cols, _coverage.METHODS.items()):
+                col.metric(label, f"{res.coverage[m]:.2%}", f"{res.coverage[m] - c_level:+.2%} vs nominal",
+                           delta_color="off" if abs(res.coverage[m] - c_level) < 0.005 else "normal")
+            z_star, t_star = _coverage.critical_values(c_n, c_level)
+            st.caption(f"z* = {z_star:.3f}, t*({c_n - 1}) = {t_star:.3f}; "
+                       f"Monte Carlo SE of each rate ≈ {np.sqrt(c_level * (1 - c_level) / c_reps):.2%}")
+
+            colors = {"z": "#4f46e5", "z_s": "#f59e0b", "t": "#059669"}
+            fig = go.Figure()
+            for m, label in _coverage.METHODS.items():
+                fig.add_trace(go.Scattergl(x=res.curve_x, y=res.curves[m], mode='lines',
+                                           line=dict(color=colors[m], width=2), name=label))
+            fig.add_hline(y=c_level, line_dash="dash", line_color="#dc2626", annotation_text=f"nominal {c_level:.0%}")
+            fig.update_layout(title="Running coverage rate", xaxis_title="Number of samples", yaxis_title="Coverage",
+                              xaxis_type="log", yaxis_tickformat=".0%",
+                              paper_bgcolor='#ffffff', plot_bgcolor='#f8fafc', font_color='#111111', height=340)
+            st.plotly_chart(fig, use_container_width=True)
+
+            dance_m = st.radio("Dance of intervals for:", list(_coverage.METHODS), format_func=_coverage.METHODS.get,
+                               horizontal=True, key="cov_dance")
+            low, high = res.dance_low[dance_m], res.dance_high[dance_m]
+            mu = _coverage.POPULATIONS[c_pop].mean
+            hit = (low <= mu) & (mu <= high)
+            fig = go.Figure()
+            for mask, color, name in [(hit, '#059669', 'Captures μ'), (~hit, '#dc2626', 'Misses μ')]:
+                # One WebGL trace per colour: segments separated by NaN gaps
+                idx = np.flatnonzero(mask) + 1
+                xs = np.column_stack([low[mask], high[mask], np.full(mask.sum(), np.nan)]).ravel()
+                ys = np.repeat(idx, 3).astype(float)
+                fig.add_trace(go.Scattergl(x=xs, y=ys, mode='lines', line=dict(color=color, width=2),
+                                           name=f"{name} ({mask.sum()})"))
+                fig.add_trace(go.Scattergl(x=res.dance_means[mask], y=idx, mode='markers',
+                                           marker=dict(color=color, size=4), showlegend=False))
+            fig.add_vline(x=mu, line_color="#111111", annotation_text=f"μ = {mu:.2f}")
+            fig.update_layout(title=f"First {len(low)} of {res.reps:,} intervals — {_coverage.METHODS[dance_m]}",
+                              xaxis_title="Interval", yaxis_title="Sample #", yaxis_autorange="reversed",
+                              paper_bgcolor='#ffffff', plot_bgcolor='#f8fafc', font_color='#111111', height=520)
+            st.plotly_chart(fig, use_container_width=True)
+        st.markdown("</div>", unsafe_allow_html=True)
+
     st.markdown("<div class='section-card'><div class='section-label label-solved'>✅ Solved Problems</div>", unsafe_allow_html=True)
     st.markdown("<span class='prob-badge'>Problem 1 — Z-Interval</span>", unsafe_allow_html=True)
     st.markdown("""
@@ -109,7 +248,7 @@ This does NOT mean there is a 95% probability the parameter is in this specific
     st.markdown("""
 **Q:** 12 observations: x̄ = 24.5, s = 3.2. Construct a 99% CI (σ unknown).
     """)
-    t_val = stats.t.ppf(0.995, 11)
+    t_val = _engine.ppf("t", 0.995, 11)
     se_v = 3.2 / np.sqrt(12)
     moe_v = t_val * se_v
     st.latex(rf"t_{{0.005,11}} = {t_val:.3f},\quad SE = \frac{{3.2}}{{\sqrt{{12}}}} = {se_v:.4f}")
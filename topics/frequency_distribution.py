@@ -1,7 +1,7 @@
 import streamlit as st
-import numpy as np
 import pandas as pd
 import plotly.graph_objects as go
+from topics import _binning, _figures, _render, _uploads
 
 def render():
     st.markdown("""
@@ -54,26 +54,61 @@ A **frequency distribution** is a tabular or graphical summary showing how often
 
     # Interactive histogram
     st.markdown("#### 🎛️ Interactive Frequency Histogram")
-    np.random.seed(7)
-    data = np.concatenate([np.random.normal(70, 10, 80), np.random.normal(85, 5, 20)])
-    data = np.clip(data, 40, 100).round(0)
-
-    n_bins = st.slider("Number of classes (bins):", 4, 15, 8)
-    fig = go.Figure(go.Histogram(
-        x=data, nbinsx=n_bins,
-        marker_color='#667eea',
-        marker_line_color='#a78bfa',
-        marker_line_width=1.5,
-    ))
-    fig.update_layout(
-        title=f"Exam Score Distribution ({len(data)} students)",
-        xaxis_title="Score", yaxis_title="Frequency",
-        paper_bgcolor='#ffffff', plot_bgcolor='#f8fafc',
-        font_color='#111111', height=320,
-        xaxis=dict(gridcolor='#e2e8f0'),
-        yaxis=dict(gridcolor='#e2e8f0'),
-    )
-    st.plotly_chart(fig, use_container_width=True)
+    source = st.radio("Data:", ["Exam scores (100 students)", "Simulated (10⁶ values, skewed)", "Upload file (CSV / Parquet)"],
+                      horizontal=True, key="freq_source")
+    data, data_key, x_title = None, None, "Score"
+    if source.startswith("Exam"):
+        data, data_key = _binning.exam_scores(), "exam"
+    elif source.startswith("Simulated"):
+        data, data_key, x_title = _binning.simulated(1_000_000), "simulated", "Value"
+    else:
+        uploaded = st.file_uploader("Data file:", type=_uploads.FILE_TYPES, key="freq_file")
+        if uploaded is not None:
+            x_title = st.selectbox("Column:", _uploads.column_names(uploaded, numeric=True), key="freq_col")
+            if x_title:
+                data = _binning.upload_sorted(uploaded.file_id, uploaded.name, x_title, uploaded)
+                data_key = f"{uploaded.file_id}:{x_title}"
+
+    if data is not None and data.n > 0:
+        c1, c2 = st.columns([2, 1])
+        rule = c1.selectbox("Binning rule:", list(_binning.RULES), format_func=_binning.RULES.get,
+                            index=list(_binning.RULES).index("fixed"), key="freq_rule")
+        n_bins = c2.slider("Number of classes (bins):", 4, 15, 8, disabled=rule != "fixed")
+        edges = _binning.bin_edges(data, rule, n_bins)
+        table = _binning.frequency_table(data, edges)
+        variable = rule == "bayesian_blocks"
+
+        def build_histogram():
+            # Binned here: the browser receives one bar per class, not the raw values.
+            # Variable-width blocks are drawn as densities so bar areas stay honest
+            heights = table["Frequency"] / table["Width"] if variable else table["Frequency"]
+            fig = go.Figure(_render.bars(
+                edges, heights,
+                marker_color='#667eea',
+                marker_line_color='#a78bfa',
+                marker_line_width=1.5 if len(table) <= 100 else 0,
+            ))
+            fig.update_layout(
+                title=f"{x_title} distribution ({data.n:,} values, {len(table):,} classes)",
+                xaxis_title=x_title, yaxis_title="Frequency per unit width" if variable else "Frequency",
+                paper_bgcolor='#ffffff', plot_bgcolor='#f8fafc',
+                font_color='#111111', height=320, bargap=0,
+                xaxis=dict(gridcolor='#e2e8f0'),
+                yaxis=dict(gridcolor='#e2e8f0'),
+            )
+            return fig
+
+        _figures.plotly_chart("frequency_distribution", "histogram",
+                              {"data": data_key, "rule": rule, "n_bins": n_bins if rule == "fixed" else None},
+                              build_histogram, use_container_width=True)
+        if len(table) == _binning.MAX_BINS:
+            st.caption(f"The rule asked for more classes than the display limit; capped at {_binning.MAX_BINS:,}.")
+        st.dataframe(table.style.format({"Lower": "{:.3f}", "Upper": "{:.3f}", "Midpoint": "{:.3f}", "Width": "{:.3f}",
+                                         "Frequency": "{:,}", "Relative": "{:.4f}", "Cumulative": "{:,}",
+                                         "Cumulative relative": "{:.4f}"}),
+                     use_container_width=True, hide_index=True, height=min(38 + 35 * len(table), 360))
+    elif data is not None:
+        st.warning("The column has no numeric values.")
 
     st.markdown("</div>", unsafe_allow_html=True)
 
@@ -1,7 +1,7 @@
 import streamlit as st
 import numpy as np
 import plotly.graph_objects as go
-from scipy import stats
+from topics import _batch_tests, _engine, _pvalue, _resample, _uploads
 
 def render():
     st.markdown("""
@@ -25,12 +25,14 @@ def render():
     """)
     st.markdown("</div>", unsafe_allow_html=True)
 
-    tab1, tab2, tab3, tab4, tab5 = st.tabs([
+    tab1, tab2, tab3, tab4, tab5, tab6, tab7 = st.tabs([
         "📋 Framework & Steps",
         "⚠️ Type I & II Errors",
         "📊 P-Values (Detailed)",
         "🔔 Z-Tests (σ Known)",
-        "📈 t-Tests (σ Unknown)"
+        "📈 t-Tests (σ Unknown)",
+        "🧾 Batch Tests",
+        "🔀 Permutation Tests"
     ])
 
     # ═══════════════════════════════════════════════════════════════════════════
@@ -278,22 +280,11 @@ A tiny p-value means the evidence against H₀ is strong, but the effect could b
             if "t" in dist_type:
                 df_pv = st.number_input("Degrees of freedom:", value=20, min_value=1, key="pv_df")
 
+        family = "norm" if "Z" in dist_type else "t"
+        dof = None if "Z" in dist_type else df_pv
+        tail_key = "right" if "Right" in test_dir else "left" if "Left" in test_dir else "two"
         with col2:
-            if "Z" in dist_type:
-                if "Right" in test_dir:
-                    pv = 1 - stats.norm.cdf(stat_val)
-                elif "Left" in test_dir:
-                    pv = stats.norm.cdf(stat_val)
-                else:
-                    pv = 2 * (1 - stats.norm.cdf(abs(stat_val)))
-            else:
-                if "Right" in test_dir:
-                    pv = 1 - stats.t.cdf(stat_val, df_pv)
-                elif "Left" in test_dir:
-                    pv = stats.t.cdf(stat_val, df_pv)
-                else:
-                    pv = 2 * (1 - stats.t.cdf(abs(stat_val), df_pv))
-
+            pv = _pvalue.p_value(stat_val, tail_key, family, dof)
             st.metric("P-value", f"{pv:.6f}")
             if pv <= 0.001:
                 stars = "*** (Very highly significant)"
@@ -314,41 +305,7 @@ A tiny p-value means the evidence against H₀ is strong, but the effect could b
                     st.warning(f"Fail to reject at α = {a_check}")
 
         # P-value visual
-        x_range = np.linspace(-4, 4, 300)
-        if "Z" in dist_type:
-            y_curve = stats.norm.pdf(x_range)
-        else:
-            y_curve = stats.t.pdf(x_range, df_pv)
-
-        fig = go.Figure()
-        fig.add_trace(go.Scatter(x=x_range, y=y_curve, mode='lines',
-                                  line=dict(color='#4f46e5', width=2), name='Distribution'))
-        # Shade p-value region
-        if "Right" in test_dir:
-            x_shade = x_range[x_range >= stat_val]
-            y_shade = stats.norm.pdf(x_shade) if "Z" in dist_type else stats.t.pdf(x_shade, df_pv)
-            fig.add_trace(go.Scatter(x=x_shade, y=y_shade, fill='tozeroy',
-                                      fillcolor='rgba(220,38,38,0.3)', line=dict(width=0), name=f'p = {pv:.4f}'))
-        elif "Left" in test_dir:
-            x_shade = x_range[x_range <= stat_val]
-            y_shade = stats.norm.pdf(x_shade) if "Z" in dist_type else stats.t.pdf(x_shade, df_pv)
-            fig.add_trace(go.Scatter(x=x_shade, y=y_shade, fill='tozeroy',
-                                      fillcolor='rgba(220,38,38,0.3)', line=dict(width=0), name=f'p = {pv:.4f}'))
-        else:
-            for sv in [abs(stat_val), -abs(stat_val)]:
-                if sv > 0:
-                    xs = x_range[x_range >= sv]
-                else:
-                    xs = x_range[x_range <= sv]
-                ys = stats.norm.pdf(xs) if "Z" in dist_type else stats.t.pdf(xs, df_pv)
-                fig.add_trace(go.Scatter(x=xs, y=ys, fill='tozeroy',
-                                          fillcolor='rgba(220,38,38,0.3)', line=dict(width=0), showlegend=False))
-        fig.add_vline(x=stat_val, line_dash="dash", line_color="#dc2626",
-                      annotation_text=f"stat={stat_val:.2f}")
-        fig.update_layout(title=f"P-value = {pv:.6f} (shaded area)", paper_bgcolor='#ffffff',
-                          plot_bgcolor='#f8fafc', font_color='#111111', height=300,
-                          xaxis=dict(gridcolor='#e2e8f0'), yaxis=dict(gridcolor='#e2e8f0'))
-        st.plotly_chart(fig, use_container_width=True)
+        _pvalue.plotly_chart("hypothesis_testing", family, dof, tail_key, stat_val, title_label="stat")
         st.markdown("</div>", unsafe_allow_html=True)
 
     # ═══════════════════════════════════════════════════════════════════════════
@@ -387,16 +344,16 @@ A tiny p-value means the evidence against H₀ is strong, but the effect could b
             se = sigma / np.sqrt(n_test)
             z_stat = (xbar - mu_0) / se
             if "upper" in test_type:
-                p_val = 1 - stats.norm.cdf(z_stat)
-                z_crit = stats.norm.ppf(1 - alpha)
+                p_val = 1 - _engine.cdf("norm", z_stat)
+                z_crit = _engine.ppf("norm", 1 - alpha)
                 rej = z_stat > z_crit
             elif "lower" in test_type:
-                p_val = stats.norm.cdf(z_stat)
-                z_crit = stats.norm.ppf(alpha)
+                p_val = _engine.cdf("norm", z_stat)
+                z_crit = _engine.ppf("norm", alpha)
                 rej = z_stat < z_crit
             else:
-                p_val = 2 * (1 - stats.norm.cdf(abs(z_stat)))
-                z_crit = stats.norm.ppf(1 - alpha/2)
+                p_val = 2 * (1 - _engine.cdf("norm", abs(z_stat)))
+                z_crit = _engine.ppf("norm", 1 - alpha/2)
                 rej = abs(z_stat) > z_crit
             st.metric("SE = σ/√n", f"{se:.4f}")
             st.metric("z-statistic", f"{z_stat:.4f}")
@@ -482,16 +439,16 @@ A tiny p-value means the evidence against H₀ is strong, but the effect could b
             se_t = s_t / np.sqrt(n_t)
             t_stat = (xbar_t - mu_0t) / se_t
             if ">" in test_t:
-                pv_t = 1 - stats.t.cdf(t_stat, df_t)
-                tc = stats.t.ppf(1 - alpha_t, df_t)
+                pv_t = 1 - _engine.cdf("t", t_stat, df_t)
+                tc = _engine.ppf("t", 1 - alpha_t, df_t)
                 rej_t = t_stat > tc
             elif "<" in test_t:
-                pv_t = stats.t.cdf(t_stat, df_t)
-                tc = stats.t.ppf(alpha_t, df_t)
+                pv_t = _engine.cdf("t", t_stat, df_t)
+                tc = _engine.ppf("t", alpha_t, df_t)
                 rej_t = t_stat < tc
             else:
-                pv_t = 2 * (1 - stats.t.cdf(abs(t_stat), df_t))
-                tc = stats.t.ppf(1 - alpha_t/2, df_t)
+                pv_t = 2 * (1 - _engine.cdf("t", abs(t_stat), df_t))
+                tc = _engine.ppf("t", 1 - alpha_t/2, df_t)
                 rej_t = abs(t_stat) > tc
             st.metric("df", f"{df_t}")
             st.metric("SE = s/√n", f"{se_t:.4f}")
@@ -512,8 +469,8 @@ A tiny p-value means the evidence against H₀ is strong, but the effect could b
 **Solution:** H₀: μ ≥ 75, Hₐ: μ < 75 (left-tailed), df = 15
         """)
         t_ex1 = (72-75)/(8/np.sqrt(16))
-        pv_ex1 = stats.t.cdf(t_ex1, 15)
-        tc_ex1 = stats.t.ppf(0.05, 15)
+        pv_ex1 = _engine.cdf("t", t_ex1, 15)
+        tc_ex1 = _engine.ppf("t", 0.05, 15)
         st.latex(rf"t = \frac{{72-75}}{{8/\sqrt{{16}}}} = \frac{{-3}}{{2}} = {t_ex1:.3f}")
         st.latex(rf"t_{{0.05,15}} = {tc_ex1:.3f},\quad p = {pv_ex1:.4f}")
         st.markdown(f"Since |t| = 1.5 < |{tc_ex1:.3f}| and p = {pv_ex1:.4f} > 0.05: **Fail to reject H₀.** Insufficient evidence that the class is scoring below 75.")
@@ -526,13 +483,173 @@ A tiny p-value means the evidence against H₀ is strong, but the effect could b
 **Solution:** H₀: μ ≥ 480, Hₐ: μ < 480 (left-tailed), df = 9
         """)
         t_ex2 = (471.2-480)/(11.5/np.sqrt(10))
-        pv_ex2 = stats.t.cdf(t_ex2, 9)
-        tc_ex2 = stats.t.ppf(0.05, 9)
+        pv_ex2 = _engine.cdf("t", t_ex2, 9)
+        tc_ex2 = _engine.ppf("t", 0.05, 9)
         st.latex(rf"t = \frac{{471.2-480}}{{11.5/\sqrt{{10}}}} = \frac{{-8.8}}{{3.637}} = {t_ex2:.3f}")
         st.latex(rf"t_{{0.05,9}} = {tc_ex2:.3f},\quad p = {pv_ex2:.6f}")
         st.markdown(f"Since t = {t_ex2:.3f} < {tc_ex2:.3f} and p = {pv_ex2:.6f} < 0.05: **Reject H₀.** The shop is significantly under-filling its large cups.")
         st.markdown("</div>", unsafe_allow_html=True)
 
+    # ═══════════════════════════════════════════════════════════════════════════
+    # TAB 6: Batch Tests
+    # ═══════════════════════════════════════════════════════════════════════════
+    with tab6:
+        st.markdown("<div class='section-card'><div class='section-label label-concept'>💡 Many Tests at Once</div>", unsafe_allow_html=True)
+        st.markdown("""
+Run hundreds or thousands of one-sample z/t tests in one pass — e.g. every metric of an A/B readout.
+Each row needs **mu0, mean, sd, n**; optional columns **test** (`z`/`t`), **tail** (`two`/`upper`/`lower`) and **name** override the defaults below.
+
+Testing many hypotheses at α inflates false positives, so p-values can be adjusted:
+- **Bonferroni** — p × m; controls the family-wise error rate (FWER), conservative
+- **Holm** — step-down Bonferroni; same FWER guarantee, uniformly more powerful
+- **Benjamini–Hochberg** — controls the false discovery rate (FDR), the expected share of false positives among rejections
+        """)
+        st.markdown("</div>", unsafe_allow_html=True)
+
+        st.markdown("<div class='section-card'><div class='section-label label-solved'>🧮 Batch Calculator</div>", unsafe_allow_html=True)
+        source = st.radio("Test table:", ["Paste CSV", "Upload file (CSV / Parquet)"], horizontal=True, key="bt_source")
+        table = None
+        try:
+            if source == "Paste CSV":
+                text = st.text_area("One test per row:", _batch_tests.EXAMPLE, height=180, key="bt_text")
+                if text.strip():
+                    table = _batch_tests.parse_text(text)
+            else:
+                uploaded = st.file_uploader("Test table:", type=_uploads.FILE_TYPES, key="bt_file")
+                if uploaded is not None:
+                    table = _uploads.read_table(uploaded)
+        except Exception as e:
+            st.error(f"Could not read the table: {e}")
+
+        c1, c2, c3, c4 = st.columns(4)
+        bt_alpha = c1.selectbox("α:", [0.01, 0.05, 0.10], index=1, key="bt_alpha")
+        bt_corr = c2.selectbox("Correction:", list(_batch_tests.CORRECTIONS),
+                               format_func=_batch_tests.CORRECTIONS.get, index=2, key="bt_corr")
+        bt_test = c3.selectbox("Default test:", list(_batch_tests.TESTS), index=1, key="bt_test")
+        bt_tail = c4.selectbox("Default tail:", list(_batch_tests.TAILS), key="bt_tail")
+
+        if table is not None:
+            try:
+                results = _batch_tests.run_tests(table, bt_alpha, bt_corr, bt_test, bt_tail)
+            except ValueError as e:
+                st.error(str(e))
+                results = None
+            if results is not None:
+                valid = results["p"].notna()
+                m1, m2, m3, m4 = st.columns(4)
+                m1.metric("Tests", f"{int(valid.sum()):,}")
+                m2.metric("Invalid rows", f"{int((~valid).sum()):,}")
+                m3.metric(f"p < {bt_alpha} (unadjusted)", f"{int((results['p'] < bt_alpha).sum()):,}")
+                m4.metric("Rejected after correction", f"{int(results['reject'].sum()):,}")
+                st.dataframe(
+                    results.style.format({"se": "{:.4g}", "statistic": "{:.4f}", "df": "{:.0f}",
+                                          "p": "{:.3g}", "critical": "{:.4f}", "p_adj": "{:.3g}"}),
+                    use_container_width=True, hide_index=True, height=320,
+                )
+                st.download_button("⬇️ Download results (CSV)", _batch_tests.to_csv(results),
+                                   file_name="batch_tests.csv", mime="text/csv", key="bt_download")
+
+                order = np.sort(results.loc[valid, "p"].to_numpy())
+                if order.size:
+                    rank = np.arange(1, order.size + 1)
+                    fig = go.Figure()
+                    fig.add_trace(go.Scatter(x=rank, y=order, mode='markers', name='sorted p-values',
+                                             marker=dict(color='#4f46e5', size=5)))
+                    fig.add_trace(go.Scatter(x=rank, y=np.full(order.size, bt_alpha / order.size),
+                                             mode='lines', name='Bonferroni α/m', line=dict(color='#dc2626', dash='dot')))
+                    fig.add_trace(go.Scatter(x=rank, y=rank * bt_alpha / order.size,
+                                             mode='lines', name='BH line kα/m', line=dict(color='#16a34a', dash='dash')))
+                    fig.update_layout(
+                        title="Sorted p-values vs correction thresholds",
+                        xaxis_title="Rank k", yaxis_title="p-value", yaxis_type="log",
+                        paper_bgcolor='#ffffff', plot_bgcolor='#f8fafc', font_color='#111111', height=380,
+                    )
+                    st.plotly_chart(fig, use_container_width=True)
+        st.markdown("</div>", unsafe_allow_html=True)
+
+    # ═══════════════════════════════════════════════════════════════════════════
+    # TAB 7: Permutation Tests
+    # ═══════════════════════════════════════════════════════════════════════════
+    with tab7:
+        st.markdown("<div class='section-card'><div class='section-label label-concept'>💡 Permutation Tests</div>", unsafe_allow_html=True)
+        st.markdown("""
+A permutation test builds the null distribution **from the data itself** instead of assuming a z or t shape:
+
+- **Two samples:** if H₀ (no difference) is true, the group labels are arbitrary. Shuffle them, recompute the difference, repeat. The p-value is the share of shuffles at least as extreme as the observed difference.
+- **One sample:** if the values are symmetric about μ₀ under H₀, flipping the sign of each (xᵢ − μ₀) is equally likely — a **sign-flip** test.
+
+With B random shuffles the p-value is estimated as (hits + 1)/(B + 1), with Monte Carlo error √(p(1−p)/B). Sampling can **stop early** once that error is below a tolerance.
+        """)
+        st.markdown("</div>", unsafe_allow_html=True)
+
+        st.markdown("<div class='section-card'><div class='section-label label-solved'>🧮 Permutation Test Calculator</div>", unsafe_allow_html=True)
+        perm_design = st.radio("Design:", ["Two samples (difference)", "One sample vs μ₀ (sign-flip)"], horizontal=True, key="perm_design")
+        perm_source = st.radio("Data:", ["Type values", "Upload file (CSV / Parquet)"], horizontal=True, key="perm_source")
+        perm_samples = None
+        two = perm_design.startswith("Two")
+        try:
+            if perm_source == "Type values":
+                raw1 = st.text_input("Sample 1:", "23, 28, 31, 19, 26, 35, 30, 27, 24, 33", key="perm_raw1")
+                samples = [np.array([float(v) for v in raw1.split(",") if v.strip()])]
+                if two:
+                    raw2 = st.text_input("Sample 2:", "20, 22, 25, 18, 21, 27, 24, 19, 23, 26", key="perm_raw2")
+                    samples.append(np.array([float(v) for v in raw2.split(",") if v.strip()]))
+                perm_samples = samples
+            else:
+                uploaded = st.file_uploader("Data file:", type=_uploads.FILE_TYPES, key="perm_file")
+                if uploaded is not None:
+                    all_cols = _uploads.column_names(uploaded)
+                    value_col = st.selectbox("Value column:", _uploads.column_names(uploaded, numeric=True), key="perm_value_col")
+                    if two:
+                        group_col = st.selectbox("Group column (first two groups are compared):",
+                                                 [c for c in all_cols if c != value_col], key="perm_group_col")
+                        table = _uploads.read_table(uploaded, columns=[value_col, group_col]).dropna()
+                        groups = sorted(table[group_col].unique())[:2]
+                        if len(groups) == 2:
+                            st.caption(f"Sample 1 = {groups[0]}, sample 2 = {groups[1]}")
+                            perm_samples = [table.loc[table[group_col] == g, value_col].to_numpy(dtype=float) for g in groups]
+                        else:
+                            st.warning("The group column needs at least two distinct values.")
+                    elif value_col:
+                        perm_samples = [_uploads.read_table(uploaded, columns=[value_col])[value_col].dropna().to_numpy(dtype=float)]
+        except ValueError:
+            st.error("Could not parse the values.")
+
+        c1, c2, c3, c4 = st.columns(4)
+        perm_stat = c1.selectbox("Statistic:", list(_resample.STATISTICS), format_func=_resample.STATISTICS.get, key="perm_stat")
+        perm_mu0 = 0.0 if two else c2.number_input("μ₀:", value=22.0, step=1.0, key="perm_mu0")
+        perm_B = c3.select_slider("Max permutations B:", [1_000, 10_000, 100_000, 1_000_000], value=10_000, key="perm_B")
+        perm_tol = c4.selectbox("Stop when MC error <", [None, 0.01, 0.005, 0.001],
+                                format_func=lambda v: "never (run all B)" if v is None else str(v), index=2, key="perm_tol")
+
+        if perm_samples is not None and all(s.size >= 2 for s in perm_samples):
+            st.caption(" · ".join(f"n{i+1} = {s.size:,}" for i, s in enumerate(perm_samples)))
+            perm_key = (perm_design, perm_stat, perm_mu0, perm_B, perm_tol,
+                        tuple((s.size, float(s.sum())) for s in perm_samples))
+            if st.button("▶️ Run permutation test", key="perm_run"):
+                bar = st.progress(0.0, text="Shuffling…")
+                st.session_state.perm_result = (perm_key, _resample.permutation_test(
+                    perm_samples, "two" if two else "one", perm_stat, perm_mu0, perm_B, perm_tol,
+                    progress=lambda f, msg: bar.progress(min(f, 1.0), text=msg)))
+                bar.empty()
+            saved = st.session_state.get("perm_result")
+            if saved and saved[0] == perm_key:
+                res = saved[1]
+                label = "difference" if two else f"{perm_stat} − μ₀"
+                m1, m2, m3, m4 = st.columns(4)
+                m1.metric(f"Observed {label}", f"{res.observed:.4f}")
+                m2.metric("Permutation p-value", f"{res.p_value:.5f}")
+                m3.metric("Monte Carlo ± SE", f"{res.mc_se:.5f}")
+                m4.metric("Permutations used", f"{res.n_resamples:,}" + (" (stopped early)" if res.stopped_early else ""))
+                if two and perm_stat == "mean":
+                    v1, v2 = (s.var(ddof=1) / s.size for s in perm_samples)
+                    t_w = res.observed / np.sqrt(v1 + v2)
+                    df_w = (v1 + v2)**2 / (v1**2 / (perm_samples[0].size - 1) + v2**2 / (perm_samples[1].size - 1))
+                    st.info(f"Welch t-test for comparison: t = {t_w:.3f}, df = {df_w:.1f}, p = {2 * _engine.sf('t', abs(t_w), df_w):.5f}")
+        elif perm_samples is not None:
+            st.warning("Each sample needs at least 2 observations.")
+        st.markdown("</div>", unsafe_allow_html=True)
+
     # ═══════════════════════════════════════════════════════════════════════════
     # TRICKY QUESTIONS (outside tabs)
     # ═══════════════════════════════════════════════════════════════════════════
@@ -1,5 +1,7 @@
 import streamlit as st
 import numpy as np
+import pandas as pd
+from topics import _describe, _uploads
 
 def render():
     st.markdown("""
@@ -105,6 +107,46 @@ Together, these give a compact, powerful description of any distribution. Unders
 
     st.markdown("</div>", unsafe_allow_html=True)
 
+    # ── YOUR DATA ────────────────────────────────────────────────────────────
+    st.markdown("<div class='section-card'><div class='section-label label-solved'>🧮 Describe Your Data</div>", unsafe_allow_html=True)
+    source = st.radio("Data:", ["Type values", "Upload file (CSV / Parquet)"], horizontal=True, key="mv_source")
+    summary = None
+    if source == "Type values":
+        raw = st.text_input("Comma-separated values:", "8, 3, 5, 7, 2, 9, 4, 6, 1, 5", key="mv_raw")
+        try:
+            summary = _describe.summarize([float(v) for v in raw.split(",") if v.strip()])
+        except ValueError:
+            st.warning("Please enter valid comma-separated numbers.")
+    else:
+        uploaded = st.file_uploader("Data file:", type=_uploads.FILE_TYPES, key="mv_file")
+        if uploaded is not None:
+            col = st.selectbox("Column:", _uploads.column_names(uploaded, numeric=True), key="mv_col")
+            if col:
+                summary = _describe.upload_summary(uploaded.file_id, uploaded.name, col, uploaded)
+    if summary is not None and summary.n >= 2:
+        pct = summary.percentiles
+        c1, c2, c3, c4 = st.columns(4)
+        c1.metric("n", f"{summary.n:,}")
+        c2.metric("Mean (x̄)", f"{summary.mean:.4f}")
+        c3.metric("Median", f"{pct[50]:.4f}")
+        c4.metric("Mid-range", f"{(summary.min + summary.max) / 2:.4f}")
+        c1, c2, c3, c4 = st.columns(4)
+        c1.metric("Sample variance (s²)", f"{summary.var:.4f}")
+        c2.metric("Sample SD (s)", f"{summary.sd:.4f}")
+        c3.metric("Skewness (g₁)", f"{summary.skew:.3f}")
+        c4.metric("Excess kurtosis (g₂)", f"{summary.kurtosis:.3f}")
+        shape = ("right-skewed: mean > median" if summary.skew > 0.5 else
+                 "left-skewed: mean < median" if summary.skew < -0.5 else "roughly symmetric: mean ≈ median")
+        st.info(f"g₁ = {summary.skew:.2f} → {shape}.")
+        st.dataframe(pd.DataFrame({"Percentile": [f"P{p}" for p in pct], "Value": list(pct.values())}).set_index("Percentile").T,
+                     use_container_width=True)
+        if summary.quantile_method != "exact":
+            st.caption(f"Mean, variance, skewness and kurtosis are exact; percentiles are "
+                       f"{summary.quantile_method} estimates (more than {_describe.EXACT_MAX:,} values).")
+    elif summary is not None:
+        st.warning("Need at least 2 numeric values.")
+    st.markdown("</div>", unsafe_allow_html=True)
+
     # ── SOLVED PROBLEMS ───────────────────────────────────────────────────────
     st.markdown("<div class='section-card'><div class='section-label label-solved'>✅ Solved Problems</div>", unsafe_allow_html=True)
 
@@ -1,5 +1,5 @@
 import streamlit as st
-import numpy as np
+from topics import _describe, _uploads
 
 def render():
     st.markdown("""
@@ -69,26 +69,45 @@ Key measures: **Range, Variance, Standard Deviation, IQR, Coefficient of Variati
 
     # Interactive calculator
     st.markdown("#### 🧮 Live Spread Calculator")
-    st.markdown("Enter comma-separated numbers:")
-    user_input = st.text_input("Dataset:", "12, 15, 11, 18, 14, 13, 20, 10, 16, 14")
-    try:
-        arr = np.array([float(x.strip()) for x in user_input.split(',')])
+    source = st.radio("Data:", ["Type values", "Upload file (CSV / Parquet)"], horizontal=True, key="spread_source")
+    summary = None
+    if source == "Type values":
+        user_input = st.text_input("Dataset (comma-separated numbers):", "12, 15, 11, 18, 14, 13, 20, 10, 16, 14")
+        try:
+            summary = _describe.summarize([float(x.strip()) for x in user_input.split(',')])
+        except ValueError:
+            st.warning("Please enter valid comma-separated numbers.")
+    else:
+        uploaded = st.file_uploader("Data file:", type=_uploads.FILE_TYPES, key="spread_file")
+        if uploaded is not None:
+            col = st.selectbox("Column:", _uploads.column_names(uploaded, numeric=True), key="spread_col")
+            if col:
+                summary = _describe.upload_summary(uploaded.file_id, uploaded.name, col, uploaded)
+    if summary is not None and summary.n >= 2:
+        q1, q3 = summary.percentiles[25], summary.percentiles[75]
         col1, col2, col3, col4 = st.columns(4)
         with col1:
-            st.metric("Range", f"{arr.max()-arr.min():.3f}")
-            st.metric("Min", f"{arr.min():.3f}")
+            st.metric("Range", f"{summary.max - summary.min:.3f}")
+            st.metric("Min", f"{summary.min:.3f}")
         with col2:
-            st.metric("Variance (s²)", f"{np.var(arr, ddof=1):.3f}")
-            st.metric("Max", f"{arr.max():.3f}")
+            st.metric("Variance (s²)", f"{summary.var:.3f}")
+            st.metric("Max", f"{summary.max:.3f}")
         with col3:
-            st.metric("Std Dev (s)", f"{np.std(arr, ddof=1):.3f}")
-            st.metric("Mean", f"{np.mean(arr):.3f}")
+            st.metric("Std Dev (s)", f"{summary.sd:.3f}")
+            st.metric("Mean", f"{summary.mean:.3f}")
         with col4:
-            q1, q3 = np.percentile(arr, [25, 75])
-            st.metric("IQR", f"{q3-q1:.3f}")
-            st.metric("CV%", f"{np.std(arr,ddof=1)/np.mean(arr)*100:.2f}%")
-    except:
-        st.warning("Please enter valid comma-separated numbers.")
+            st.metric("IQR", f"{q3 - q1:.3f}")
+            st.metric("CV%", f"{summary.sd / summary.mean * 100:.2f}%" if summary.mean else "—")
+        col1, col2, col3, col4 = st.columns(4)
+        col1.metric("n", f"{summary.n:,}")
+        col2.metric("Skewness (g₁)", f"{summary.skew:.3f}")
+        col3.metric("Excess kurtosis (g₂)", f"{summary.kurtosis:.3f}")
+        col4.metric("Median", f"{summary.percentiles[50]:.3f}")
+        if summary.quantile_method != "exact":
+            st.caption(f"Moments are exact; quartiles are {summary.quantile_method} estimates "
+                       f"(more than {_describe.EXACT_MAX:,} values).")
+    elif summary is not None:
+        st.warning("Need at least 2 numeric values.")
 
     st.markdown("</div>", unsafe_allow_html=True)
 
@@ -1,7 +1,7 @@
 import streamlit as st
 import numpy as np
 import plotly.graph_objects as go
-from scipy import stats
+from topics import _engine
 
 def render():
     st.markdown("""
@@ -117,9 +117,9 @@ The Normal's exact values are much higher because it has "thin tails" — probab
         k = st.slider("Highlight within k σ:", 0.5, 4.0, 2.0, 0.1)
 
     x = np.linspace(mu - 4.5*sigma, mu + 4.5*sigma, 500)
-    y = stats.norm.pdf(x, mu, sigma)
+    y = _engine.pdf("norm", x, mu, sigma)
     mask = (x >= mu - k*sigma) & (x <= mu + k*sigma)
-    coverage = stats.norm.cdf(mu + k*sigma, mu, sigma) - stats.norm.cdf(mu - k*sigma, mu, sigma)
+    coverage = _engine.cdf("norm", mu + k*sigma, mu, sigma) - _engine.cdf("norm", mu - k*sigma, mu, sigma)
     cheb_bound = max(0, 1 - 1/k**2) if k > 1 else 0.0
 
     fig = go.Figure()
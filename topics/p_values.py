@@ -1,8 +1,6 @@
 import streamlit as st
-import numpy as np
 import pandas as pd
-import plotly.graph_objects as go
-from scipy import stats
+from topics import _engine, _pvalue
 
 def render():
     st.markdown("""
@@ -103,22 +101,11 @@ The **p-value** is one of the most used — and most misunderstood — concepts
         tail = st.radio("Tail:", ["Right (>)", "Left (<)", "Two-tailed (≠)"], key="pv_t")
         if "t" in dist:
             df = st.number_input("df:", value=20, min_value=1, key="pv_df")
+    family = "norm" if "Z" in dist else "t"
+    dof = None if "Z" in dist else df
+    tail_key = "right" if "Right" in tail else "left" if "Left" in tail else "two"
     with col3:
-        if "Z" in dist:
-            if "Right" in tail:
-                pv = 1 - stats.norm.cdf(stat)
-            elif "Left" in tail:
-                pv = stats.norm.cdf(stat)
-            else:
-                pv = 2 * (1 - stats.norm.cdf(abs(stat)))
-        else:
-            if "Right" in tail:
-                pv = 1 - stats.t.cdf(stat, df)
-            elif "Left" in tail:
-                pv = stats.t.cdf(stat, df)
-            else:
-                pv = 2 * (1 - stats.t.cdf(abs(stat), df))
-
+        pv = _pvalue.p_value(stat, tail_key, family, dof)
         st.metric("P-value", f"{pv:.6f}")
         if pv <= 0.001: lvl = "*** Very strong evidence"
         elif pv <= 0.01: lvl = "** Strong evidence"
@@ -133,37 +120,7 @@ The **p-value** is one of the most used — and most misunderstood — concepts
                 st.warning(f"Fail to reject at α={a}")
 
     # Visual
-    x_r = np.linspace(-4, 4, 300)
-    if "Z" in dist:
-        y_c = stats.norm.pdf(x_r)
-    else:
-        y_c = stats.t.pdf(x_r, df)
-    fig = go.Figure()
-    fig.add_trace(go.Scatter(x=x_r, y=y_c, mode='lines',
-                              line=dict(color='#1a1a2e', width=2), name='Distribution'))
-    # Shade
-    if "Right" in tail:
-        xs = x_r[x_r >= stat]
-        ys = stats.norm.pdf(xs) if "Z" in dist else stats.t.pdf(xs, df)
-        fig.add_trace(go.Scatter(x=xs, y=ys, fill='tozeroy',
-                                  fillcolor='rgba(220,38,38,0.3)', line=dict(width=0), name=f'p={pv:.4f}'))
-    elif "Left" in tail:
-        xs = x_r[x_r <= stat]
-        ys = stats.norm.pdf(xs) if "Z" in dist else stats.t.pdf(xs, df)
-        fig.add_trace(go.Scatter(x=xs, y=ys, fill='tozeroy',
-                                  fillcolor='rgba(220,38,38,0.3)', line=dict(width=0), name=f'p={pv:.4f}'))
-    else:
-        for sv in [abs(stat), -abs(stat)]:
-            xs = x_r[x_r >= abs(stat)] if sv > 0 else x_r[x_r <= -abs(stat)]
-            ys = stats.norm.pdf(xs) if "Z" in dist else stats.t.pdf(xs, df)
-            fig.add_trace(go.Scatter(x=xs, y=ys, fill='tozeroy',
-                                      fillcolor='rgba(220,38,38,0.3)', line=dict(width=0), showlegend=False))
-    fig.add_vline(x=stat, line_dash="dash", line_color="#dc2626", annotation_text=f"stat={stat:.2f}")
-    fig.update_layout(title=f"P-value = {pv:.6f} (red shaded area)",
-                      paper_bgcolor='#ffffff', plot_bgcolor='#f8fafc',
-                      font_color='#111111', height=300,
-                      xaxis=dict(gridcolor='#e2e8f0'), yaxis=dict(gridcolor='#e2e8f0'))
-    st.plotly_chart(fig, use_container_width=True)
+    _pvalue.plotly_chart("p_values", family, dof, tail_key, stat, line_color='#1a1a2e', title_label="stat")
     st.markdown("</div>", unsafe_allow_html=True)
 
     # ── SOLVED PROBLEMS ──
@@ -181,8 +138,8 @@ The **p-value** is one of the most used — and most misunderstood — concepts
     st.markdown("""
 **Q:** t = −1.75, df = 24 in a two-tailed test. Find the p-value and decide at α = 0.05.
     """)
-    pv2 = 2 * stats.t.cdf(-1.75, 24)
-    st.latex(rf"p = 2 \times P(t_{{24}} \leq -1.75) = 2 \times {stats.t.cdf(-1.75,24):.4f} = \mathbf{{{pv2:.4f}}}")
+    pv2 = 2 * _engine.cdf("t", -1.75, 24)
+    st.latex(rf"p = 2 \times P(t_{{24}} \leq -1.75) = 2 \times {_engine.cdf('t', -1.75,24):.4f} = \mathbf{{{pv2:.4f}}}")
     st.markdown(f"Since {pv2:.4f} > 0.05 → **Fail to reject H₀**.")
     st.divider()
 
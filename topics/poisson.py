@@ -1,7 +1,7 @@
 import streamlit as st
 import numpy as np
 import plotly.graph_objects as go
-from scipy import stats
+from topics import _engine
 
 def render():
     st.markdown("""
@@ -68,9 +68,9 @@ The **Poisson distribution** models the number of events occurring in a fixed in
         st.metric("SD = √λ", f"{lam**0.5:.4f}")
     with col2:
         max_k = max(20, int(lam*3))
-        x_p = list(range(max_k+1))
-        pmf_p = [stats.poisson.pmf(k, lam) for k in x_p]
-        cdf_p = [stats.poisson.cdf(k, lam) for k in x_p]
+        x_p = np.arange(max_k+1)
+        pmf_p = _engine.pmf("poisson", x_p, lam)
+        cdf_p = _engine.cdf("poisson", x_p, lam)
         fig = go.Figure()
         fig.add_trace(go.Bar(x=x_p, y=pmf_p, name='PMF', marker_color='#4f46e5', opacity=0.8))
         fig.add_trace(go.Scatter(x=x_p, y=cdf_p, name='CDF', mode='lines+markers',
@@ -114,14 +114,14 @@ In 2 days, λ₂ = 3 × 2 = **6 errors per 2 days** (by additive property for Po
     st.markdown("""
 **Q:** A hospital emergency ward admits on average 10 patients per night. They have 15 beds. What is the probability they can accommodate all patients (P(X ≤ 15))?
     """)
-    prob = stats.poisson.cdf(15, 10)
+    prob = _engine.cdf("poisson", 15, 10)
     st.latex(rf"P(X\leq15) = \sum_{{k=0}}^{{15}}\frac{{e^{{-10}}\cdot10^k}}{{k!}} \approx \mathbf{{{prob:.4f}}}")
     st.markdown(f"""
 There is a **{prob*100:.1f}%** chance all patients can be accommodated.
 
 That means **{(1-prob)*100:.1f}% chance of overflow** — needing to divert patients. Management might add 2–3 extra beds to bring overflow risk below 1%.
 
-P(X ≤ 17) = {stats.poisson.cdf(17, 10):.4f} → Only {(1-stats.poisson.cdf(17,10))*100:.2f}% overflow risk with 18 beds.
+P(X ≤ 17) = {_engine.cdf("poisson", 17, 10):.4f} → Only {(1-_engine.cdf("poisson", 17,10))*100:.2f}% overflow risk with 18 beds.
     """)
     st.markdown("</div>", unsafe_allow_html=True)
 
@@ -0,0 +1,206 @@
+import streamlit as st
+import numpy as np
+import plotly.graph_objects as go
+from topics import _engine, _figures, _power
+
+
+def build_surface(design, alpha, two_sided, k):
+    grid = _power.surface(design, alpha, two_sided, k)
+    label = _power.EFFECT_LABEL[design]
+    fig = go.Figure()
+    fig.add_trace(go.Contour(
+        x=_power.N_GRID, y=_power.EFFECT_GRID, z=grid, colorscale='Viridis', zmin=0, zmax=1,
+        contours=dict(start=0.1, end=0.9, size=0.1, showlabels=True),
+        colorbar=dict(title='Power'), hovertemplate=f'n = %{{x:.0f}}<br>{label} = %{{y:.2f}}<br>power = %{{z:.3f}}<extra></extra>',
+    ))
+    fig.add_trace(go.Contour(
+        x=_power.N_GRID, y=_power.EFFECT_GRID, z=grid, showscale=False,
+        contours=dict(start=0.8, end=0.8, coloring='none', showlabels=True),
+        line=dict(color='#dc2626', width=3), name='power = 0.80', hoverinfo='skip',
+    ))
+    fig.update_layout(
+        title=f"Power surface — {_power.DESIGNS[design]}, α = {alpha}",
+        xaxis=dict(title='n per group', type='log'), yaxis_title=f'Effect size {label}',
+        paper_bgcolor='#ffffff', plot_bgcolor='#f8fafc', font_color='#111111', height=460,
+    )
+    return fig
+
+
+def render():
+    st.markdown("""
+    <div class='topic-header'>
+        <h1>⚡ Power Analysis & Sample Size</h1>
+        <p>How likely is a test to detect a real effect — and how much data does it need?</p>
+    </div>
+    """, unsafe_allow_html=True)
+
+    st.markdown("<div class='section-card'><div class='section-label label-intro'>📖 Introduction</div>", unsafe_allow_html=True)
+    st.markdown("""
+The **power** of a test is the probability that it rejects H₀ when a specified alternative is true. It is the complement of the Type II error rate β.
+
+Power is the question to ask **before** collecting data: *"If the effect is as large as I think, will my experiment find it?"* Four quantities are linked — fix any three and the fourth is determined:
+
+- **α** — significance level (Type I error rate)
+- **Effect size** — how far the truth is from H₀, in standardized units
+- **n** — sample size (per group)
+- **Power** = 1 − β — conventionally targeted at 0.80 or 0.90
+    """)
+    st.markdown("</div>", unsafe_allow_html=True)
+
+    tab1, tab2, tab3 = st.tabs(["💡 Concepts", "🧮 Power Calculator", "🗺️ Power Surface"])
+
+    with tab1:
+        st.markdown("<div class='section-card'><div class='section-label label-concept'>💡 Effect Sizes & Noncentral Distributions</div>", unsafe_allow_html=True)
+        col1, col2 = st.columns(2)
+        with col1:
+            st.markdown("#### Standardized Effect Sizes")
+            st.latex(r"d = \frac{\mu_1 - \mu_0}{\sigma} \qquad h = 2\arcsin\sqrt{p_1} - 2\arcsin\sqrt{p_0}")
+            st.latex(r"f = \frac{\sigma_{\text{means}}}{\sigma} = \sqrt{\frac{\sum_i (\mu_i - \bar\mu)^2 / k}{\sigma^2}}")
+            st.markdown("""
+| Size | Cohen's d | Cohen's h | Cohen's f |
+|------|-----------|-----------|-----------|
+| Small | 0.2 | 0.2 | 0.10 |
+| Medium | 0.5 | 0.5 | 0.25 |
+| Large | 0.8 | 0.8 | 0.40 |
+            """)
+        with col2:
+            st.markdown("#### Under Hₐ the statistic is *noncentral*")
+            st.latex(r"t = \frac{\bar x - \mu_0}{s/\sqrt n} \sim t_{n-1}(\delta),\quad \delta = d\sqrt{n}")
+            st.latex(r"F \sim F_{k-1,\;k(n-1)}(\lambda),\quad \lambda = f^2\,k\,n")
+            st.latex(r"\text{Power} = P\left(|T| > t_{\alpha/2,\,n-1} \mid \delta\right)")
+            st.caption("For two independent groups of n each: df = 2n − 2 and δ = d·√(n/2).")
+        st.markdown("</div>", unsafe_allow_html=True)
+
+    with tab2:
+        st.markdown("<div class='section-card'><div class='section-label label-solved'>🧮 Interactive Power Calculator</div>", unsafe_allow_html=True)
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            design = st.selectbox("Design:", list(_power.DESIGNS), format_func=_power.DESIGNS.get, key="pw_design")
+            alpha = st.selectbox("α:", [0.01, 0.05, 0.10], index=1, key="pw_alpha")
+            if design == "anova":
+                two_sided = True
+                k = st.number_input("k (groups):", value=3, min_value=2, max_value=20, key="pw_k")
+            else:
+                two_sided = st.radio("Hₐ:", ["Two-sided", "One-sided"], horizontal=True, key="pw_tails") == "Two-sided"
+                k = 3
+        with col2:
+            if design in ("z", "t1"):
+                mu0 = st.number_input("μ₀:", value=100.0, step=1.0, key="pw_mu0")
+                mu1 = st.number_input("μ₁ (true mean):", value=105.0, step=1.0, key="pw_mu1")
+                sd = st.number_input("σ:", value=10.0, min_value=0.01, step=0.5, key="pw_sd")
+                effect = (mu1 - mu0) / sd
+            elif design == "t2":
+                mu1 = st.number_input("μ₁ (group 1):", value=50.0, step=1.0, key="pw_m1")
+                mu2 = st.number_input("μ₂ (group 2):", value=55.0, step=1.0, key="pw_m2")
+                sd = st.number_input("Common σ:", value=10.0, min_value=0.01, step=0.5, key="pw_sd2")
+                effect = (mu2 - mu1) / sd
+            elif design == "prop":
+                p0 = st.number_input("p₀:", value=0.50, min_value=0.001, max_value=0.999, step=0.01, key="pw_p0")
+                p1 = st.number_input("p₁ (true proportion):", value=0.60, min_value=0.001, max_value=0.999, step=0.01, key="pw_p1")
+                effect = float(_power.cohens_h(p0, p1))
+            else:
+                effect = st.number_input("Cohen's f:", value=0.25, min_value=0.01, max_value=2.0, step=0.01, key="pw_f")
+        with col3:
+            target = st.slider("Target power:", 0.50, 0.99, 0.80, 0.01, key="pw_target")
+            n_given = st.number_input("Power at n per group:", value=30, min_value=_power.n_min(design), key="pw_n")
+
+        label = _power.EFFECT_LABEL[design]
+        n_req = _power.required_n(design, effect, target, alpha, two_sided, k)
+        pw_given = float(_power.power(design, effect, n_given, alpha, two_sided, k))
+        groups = {"t2": 2, "anova": k}.get(design, 1)
+
+        c1, c2, c3, c4 = st.columns(4)
+        c1.metric(f"Effect size {label}", f"{effect:.3f}")
+        c2.metric(f"Required n (power ≥ {target:.2f})", "—" if np.isinf(n_req) else f"{n_req:,}" + (" per group" if groups > 1 else ""))
+        c3.metric("Total N", "—" if np.isinf(n_req) else f"{n_req * groups:,}")
+        c4.metric(f"Power at n = {n_given}", f"{pw_given:.3f}")
+        if effect == 0:
+            st.warning("With zero effect, power equals α at every n — there is nothing to detect.")
+
+        col1, col2 = st.columns(2)
+        with col1:
+            curve = _power.power_curve(design, effect, alpha, two_sided, k)
+            fig = go.Figure()
+            fig.add_trace(go.Scatter(x=_power.N_GRID, y=curve, mode='lines',
+                                     line=dict(color='#4f46e5', width=3), name='Power'))
+            fig.add_hline(y=target, line_dash="dash", line_color="#dc2626", annotation_text=f"target {target:.2f}")
+            if not np.isinf(n_req):
+                fig.add_vline(x=n_req, line_dash="dot", line_color="#16a34a", annotation_text=f"n = {n_req:,}")
+            fig.update_layout(title=f"Power vs n ({label} = {effect:.3f})",
+                              xaxis=dict(title='n per group', type='log', gridcolor='#e2e8f0'),
+                              yaxis=dict(title='Power', range=[0, 1.02], gridcolor='#e2e8f0'),
+                              paper_bgcolor='#ffffff', plot_bgcolor='#f8fafc', font_color='#111111', height=360)
+            st.plotly_chart(fig, use_container_width=True)
+        with col2:
+            by_effect = np.asarray(_power.power(design, _power.EFFECT_GRID, n_given, alpha, two_sided, k))
+            fig2 = go.Figure()
+            fig2.add_trace(go.Scatter(x=_power.EFFECT_GRID, y=by_effect, mode='lines',
+                                      line=dict(color='#0891b2', width=3), name='Power'))
+            fig2.add_trace(go.Scatter(x=[abs(effect)], y=[pw_given], mode='markers',
+                                      marker=dict(color='#dc2626', size=12), name='Your design'))
+            fig2.add_hline(y=target, line_dash="dash", line_color="#dc2626")
+            fig2.update_layout(title=f"Power vs effect size (n = {n_given} per group)",
+                               xaxis=dict(title=f'Effect size {label}', gridcolor='#e2e8f0'),
+                               yaxis=dict(title='Power', range=[0, 1.02], gridcolor='#e2e8f0'),
+                               paper_bgcolor='#ffffff', plot_bgcolor='#f8fafc', font_color='#111111', height=360)
+            st.plotly_chart(fig2, use_container_width=True)
+        st.markdown("</div>", unsafe_allow_html=True)
+
+    with tab3:
+        st.markdown("<div class='section-card'><div class='section-label label-concept'>🗺️ Power over Effect Size × Sample Size</div>", unsafe_allow_html=True)
+        st.markdown("Each contour is a power level; the red line is power = 0.80. Designs below-left of it are **underpowered**. Settings follow the calculator tab.")
+        fig3 = _figures.get_figure("power_analysis", "surface",
+                                   {"design": design, "alpha": alpha, "two_sided": two_sided, "k": k},
+                                   lambda: build_surface(design, alpha, two_sided, k))
+        if not np.isinf(n_req) and abs(effect) <= _power.EFFECT_GRID[-1]:
+            fig3.add_trace(go.Scatter(x=[n_req], y=[abs(effect)], mode='markers',
+                                      marker=dict(color='#ffffff', size=12, line=dict(color='#111111', width=2)),
+                                      name=f'required n for {label} = {abs(effect):.2f}'))
+        st.plotly_chart(fig3, use_container_width=True)
+        st.markdown("</div>", unsafe_allow_html=True)
+
+    st.markdown("<div class='section-card'><div class='section-label label-solved'>✅ Solved Problems</div>", unsafe_allow_html=True)
+    st.markdown("<span class='prob-badge'>Problem 1 — Sample Size for a z-Test</span>", unsafe_allow_html=True)
+    st.markdown("""
+**Q:** σ = 15. How many observations are needed to detect a shift of 5 units with a two-sided test at α = 0.05 and power 0.80?
+    """)
+    st.latex(r"n = \left(\frac{(z_{\alpha/2} + z_{\beta})\,\sigma}{\mu_1 - \mu_0}\right)^2 = \left(\frac{(1.960 + 0.842)\times 15}{5}\right)^2 = 70.6 \implies \mathbf{71}")
+    st.caption(f"Exact solver (both tails counted): n = {_power.required_n('z', 5 / 15):,}")
+    st.divider()
+
+    st.markdown("<span class='prob-badge'>Problem 2 — Two-Sample t-Test</span>", unsafe_allow_html=True)
+    st.markdown("""
+**Q:** A medium effect (d = 0.5) between two groups, two-sided α = 0.05. How many per group for 80% power?
+    """)
+    n_t2 = _power.required_n("t2", 0.5)
+    st.latex(rf"\text{{Noncentral }} t_{{2n-2}}(0.5\sqrt{{n/2}}) \implies n = \mathbf{{{n_t2}}}\text{{ per group}}")
+    st.markdown(f"The normal approximation gives 63; the noncentral t adds one because s also has to be estimated. Total N = {2 * n_t2}.")
+    st.divider()
+
+    st.markdown("<span class='prob-badge'>Problem 3 — ANOVA</span>", unsafe_allow_html=True)
+    st.markdown("""
+**Q:** Four groups, expected Cohen's f = 0.25, α = 0.05. Power with 30 per group?
+    """)
+    pw_a = float(_power.power("anova", 0.25, 30, 0.05, True, 4))
+    f_crit = _engine.isf("f", 0.05, 3, 116)
+    st.latex(rf"F_{{0.05;\,3,116}} = {f_crit:.3f},\quad \lambda = 0.25^2\times4\times30 = 7.5")
+    st.latex(rf"\text{{Power}} = P(F'_{{3,116}}(7.5) > {f_crit:.3f}) = \mathbf{{{pw_a:.3f}}}")
+    st.markdown(f"Underpowered — {_power.required_n('anova', 0.25, k=4)} per group are needed for 0.80.")
+    st.markdown("</div>", unsafe_allow_html=True)
+
+    st.markdown("<div class='section-card'><div class='section-label label-tricky'>🧠 Tricky Questions</div>", unsafe_allow_html=True)
+    st.markdown("<span class='tricky-badge'>Tricky Q1</span>", unsafe_allow_html=True)
+    st.markdown("**Q:** A study found p = 0.30. Can we compute its \"observed power\" to decide if the null result is convincing?")
+    with st.expander("🔍 Reveal Solution"):
+        st.markdown("""
+**No.** "Observed" (post-hoc) power computed from the observed effect is a one-to-one function of the p-value — a non-significant p always gives low observed power, so it adds no information.
+
+Power is a **design** quantity: compute it before the study from the smallest effect that would matter. To interpret a null result, look at the **confidence interval** — it shows which effects the data rule out.
+        """)
+    st.markdown("<span class='tricky-badge'>Tricky Q2</span>", unsafe_allow_html=True)
+    st.markdown("**Q:** Halving the detectable effect size — how much more data do you need?")
+    with st.expander("🔍 Reveal Solution"):
+        st.markdown("""
+**About four times as much.** n scales with 1/d², because the noncentrality is d√n. Detecting d = 0.25 instead of 0.5 at the same α and power takes ≈ 4× the sample.
+        """)
+    st.markdown("</div>", unsafe_allow_html=True)
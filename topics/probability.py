@@ -2,6 +2,8 @@ import streamlit as st
 import numpy as np
 import plotly.graph_objects as go
 
+from topics import _montecarlo
+
 def render():
     st.markdown("""
     <div class='topic-header'>
@@ -177,4 +179,24 @@ P(car at Door 2 | Door 3 opened) = 2/3
 
 This is a famous application of **conditional probability and Bayes' theorem** that confounds even professional mathematicians.
         """)
+
+    st.markdown("**Don't trust the argument? Simulate it.**")
+    c1, c2, c3 = st.columns(3)
+    sim_exp = c1.radio("Experiment:", ["monty", "birthday"], format_func=lambda k: _montecarlo.EXPERIMENTS[k].label,
+                       horizontal=True, key="prob_sim_exp")
+    spec = _montecarlo.EXPERIMENTS[sim_exp]
+    sim_param = c2.slider(f"{spec.param}:", spec.lower, min(spec.upper, 60), spec.default, key=f"prob_sim_param_{sim_exp}")
+    sim_trials = c3.select_slider("Trials:", [1_000, 10_000, 100_000, 1_000_000], value=100_000,
+                                  format_func=lambda v: f"{v:,}", key="prob_sim_trials")
+    res = _montecarlo.cached(sim_exp, sim_param, sim_trials)
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(x=np.r_[res.curve_x, res.curve_x[::-1]], y=np.r_[res.high, res.low[::-1]], fill='toself',
+                             fillcolor='rgba(102,126,234,0.25)', line=dict(width=0), name='95% band'))
+    fig.add_trace(go.Scatter(x=res.curve_x, y=res.curve, mode='lines', line=dict(color='#4f46e5', width=2),
+                             name='Relative frequency'))
+    fig.add_hline(y=res.exact, line_dash="dash", line_color="#dc2626", annotation_text=f"exact {res.exact:.4f}")
+    fig.update_layout(title=f"P({spec.event.format(p=sim_param)}): {res.estimate:.4f} from {sim_trials:,} trials",
+                      xaxis=dict(title="Trials", type="log"), yaxis=dict(title="Relative frequency", range=[0, 1]),
+                      paper_bgcolor='#ffffff', plot_bgcolor='#f8fafc', font_color='#111111', height=320)
+    st.plotly_chart(fig, use_container_width=True)
     st.markdown("</div>", unsafe_allow_html=True)
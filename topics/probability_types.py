@@ -1,5 +1,8 @@
 import streamlit as st
 import numpy as np
+import plotly.graph_objects as go
+
+from topics import _montecarlo
 
 def render():
     st.markdown("""
@@ -79,6 +82,60 @@ Understanding these distinctions is the foundation for all statistical inference
 
     st.markdown("</div>", unsafe_allow_html=True)
 
+    # ── MONTE CARLO SIMULATOR ────────────────────────────────────────────────
+    st.markdown("<div class='section-card'><div class='section-label label-concept'>🎰 Watch Empirical Probability Converge</div>", unsafe_allow_html=True)
+    st.markdown("""
+Run the same experiment many times and track the **relative frequency** f_A / n. The Law of Large Numbers says it settles on the classical probability, and the 95% band (Wilson interval) shows how fast: its width shrinks like 1/√n, so each extra decimal place of accuracy costs **100×** more trials.
+    """)
+    c1, c2, c3 = st.columns(3)
+    mc_exp = c1.selectbox("Experiment:", list(_montecarlo.EXPERIMENTS),
+                          format_func=lambda k: _montecarlo.EXPERIMENTS[k].label, key="mc_exp")
+    spec = _montecarlo.EXPERIMENTS[mc_exp]
+    mc_param = c2.slider(f"{spec.param}:", spec.lower, spec.upper, spec.default, key=f"mc_param_{mc_exp}")
+    mc_trials = c3.select_slider("Trials:", [10**k for k in range(3, 9)], value=10**6,
+                                 format_func=lambda v: f"{v:,}", key="mc_trials")
+    st.caption(f"Event: {spec.event.format(p=mc_param)} · exact probability "
+               f"{spec.exact(mc_param):.6f}")
+
+    def build_convergence(x, est, low, high, exact, title):
+        fig = go.Figure()
+        fig.add_trace(go.Scatter(x=np.r_[x, x[::-1]], y=np.r_[high, low[::-1]], fill='toself',
+                                 fillcolor='rgba(102,126,234,0.25)', line=dict(width=0), name='95% band'))
+        fig.add_trace(go.Scatter(x=x, y=est, mode='lines', line=dict(color='#4f46e5', width=2), name='Relative frequency'))
+        fig.add_hline(y=exact, line_dash="dash", line_color="#dc2626", annotation_text=f"exact {exact:.4f}")
+        fig.update_layout(title=title, xaxis=dict(title="Trials n", type="log", range=[0, np.log10(mc_trials)]),
+                          yaxis=dict(title="P̂(event)", range=[max(0, exact - 0.5), min(1, exact + 0.5)]),
+                          paper_bgcolor='#ffffff', plot_bgcolor='#f8fafc', font_color='#111111', height=380)
+        return fig
+
+    run_key = (mc_exp, mc_param, mc_trials)
+    chart_slot = st.empty()
+    if st.button("▶️ Run simulation", key="mc_run"):
+        bar = st.progress(0.0, text="Simulating…")
+        live = []
+
+        def on_update(x, est, low, high):
+            live.append((x, est, low, high))
+            chart_slot.plotly_chart(build_convergence(*(np.concatenate(v) for v in zip(*live)), spec.exact(mc_param),
+                                                      f"Running… {x[-1]:,} trials"), use_container_width=True)
+
+        st.session_state.mc_result = (run_key, _montecarlo.simulate(
+            mc_exp, mc_param, mc_trials, on_update=on_update,
+            progress=lambda f, msg: bar.progress(min(f, 1.0), text=msg)))
+        bar.empty()
+    saved = st.session_state.get("mc_result")
+    if saved and saved[0] == run_key:
+        res = saved[1]
+        chart_slot.plotly_chart(build_convergence(res.curve_x, res.curve, res.low, res.high, res.exact,
+                                                  f"{spec.label}: {spec.event.format(p=mc_param)}"),
+                                use_container_width=True)
+        m1, m2, m3, m4 = st.columns(4)
+        m1.metric("Empirical P̂", f"{res.estimate:.6f}")
+        m2.metric("Exact P", f"{res.exact:.6f}")
+        m3.metric("95% band", f"[{res.low[-1]:.5f}, {res.high[-1]:.5f}]")
+        m4.metric("Error", f"{res.estimate - res.exact:+.2e}")
+    st.markdown("</div>", unsafe_allow_html=True)
+
     # ── TYPES OF EVENTS ──────────────────────────────────────────────────────
     st.markdown("<div class='section-card'><div class='section-label label-concept'>💡 Types of Events</div>", unsafe_allow_html=True)
 
@@ -3,6 +3,7 @@ import numpy as np
 import pandas as pd
 import plotly.graph_objects as go
 from scipy import stats
+from topics import _engine, _linreg, _uploads
 
 def render():
     st.markdown("""
@@ -20,7 +21,8 @@ def render():
     """)
     st.markdown("</div>", unsafe_allow_html=True)
 
-    tab1, tab2, tab3 = st.tabs(["📐 Simple Linear Regression", "📊 F-Test & Significance", "🧮 Interactive Calculator"])
+    tab1, tab2, tab3, tab4 = st.tabs(["📐 Simple Linear Regression", "📊 F-Test & Significance",
+                                      "🧮 Interactive Calculator", "🧩 Multiple Regression"])
 
     with tab1:
         st.markdown("<div class='section-card'><div class='section-label label-concept'>💡 Simple Linear Regression</div>", unsafe_allow_html=True)
@@ -85,66 +87,167 @@ Check via: **residual plots**, **Q-Q plot**, **Durbin-Watson test**
 
     with tab3:
         st.markdown("<div class='section-card'><div class='section-label label-solved'>🧮 Interactive Simple Regression</div>", unsafe_allow_html=True)
-        st.markdown("Enter X and Y values (comma-separated):")
+        input_mode = st.radio("Data source:", ["✍️ Type values", "📂 Upload CSV / Parquet"],
+                              horizontal=True, key="reg_mode")
+        x = y = None
+        moments = None
         col1, col2 = st.columns(2)
-        with col1:
-            x_str = st.text_input("X values:", "1, 2, 3, 4, 5, 6, 7, 8, 9, 10")
-            y_str = st.text_input("Y values:", "2.5, 5.1, 7.2, 8.8, 11.5, 13.2, 15.8, 17.9, 20.1, 22.3")
-
-        try:
-            x = np.array([float(v.strip()) for v in x_str.split(',')])
-            y = np.array([float(v.strip()) for v in y_str.split(',')])
-            if len(x) == len(y) and len(x) >= 3:
-                n = len(x)
-                slope, intercept, r_val, p_val, se_slope = stats.linregress(x, y)
-                y_hat = intercept + slope * x
-                sst = np.sum((y - y.mean())**2)
-                ssr = np.sum((y_hat - y.mean())**2)
-                sse = np.sum((y - y_hat)**2)
-                r_sq = ssr / sst
-                msr = ssr / 1
-                mse = sse / (n - 2)
-                f_stat = msr / mse
-                p_f = 1 - stats.f.cdf(f_stat, 1, n-2)
-
-                with col2:
-                    st.metric("b₁ (slope)", f"{slope:.4f}")
-                    st.metric("b₀ (intercept)", f"{intercept:.4f}")
-                    st.metric("R²", f"{r_sq:.4f}")
-                    st.metric("F-statistic", f"{f_stat:.4f}")
-                    st.metric("p-value (F-test)", f"{p_f:.6f}")
-
-                reg_table = pd.DataFrame({
-                    'Source': ['Regression', 'Error', 'Total'],
-                    'SS': [f"{ssr:.4f}", f"{sse:.4f}", f"{sst:.4f}"],
-                    'df': [1, n-2, n-1],
-                    'MS': [f"{msr:.4f}", f"{mse:.4f}", "—"],
-                    'F': [f"{f_stat:.4f}", "—", "—"],
-                    'p-value': [f"{p_f:.6f}", "—", "—"]
-                })
-                st.table(reg_table)
-
-                fig = go.Figure()
+        if input_mode == "✍️ Type values":
+            with col1:
+                st.markdown("Enter X and Y values (comma-separated):")
+                x_str = st.text_input("X values:", "1, 2, 3, 4, 5, 6, 7, 8, 9, 10")
+                y_str = st.text_input("Y values:", "2.5, 5.1, 7.2, 8.8, 11.5, 13.2, 15.8, 17.9, 20.1, 22.3")
+            try:
+                x = np.array([float(v.strip()) for v in x_str.split(',')])
+                y = np.array([float(v.strip()) for v in y_str.split(',')])
+                if len(x) == len(y) and len(x) >= 3:
+                    moments = _linreg.Moments().update(x, y)
+            except:
+                st.warning("Check inputs — equal number of comma-separated X and Y values.")
+        else:
+            with col1:
+                uploaded = st.file_uploader("Data file:", type=_uploads.FILE_TYPES, key="reg_file")
+                if uploaded is not None:
+                    num_cols = _uploads.column_names(uploaded, numeric=True)
+                    x_col = st.selectbox("X column:", num_cols, key="reg_x_col")
+                    y_col = st.selectbox("Y column:", [c for c in num_cols if c != x_col], key="reg_y_col")
+                    if x_col and y_col:
+                        moments = _linreg.upload_moments(uploaded.file_id, uploaded.name, x_col, y_col, uploaded)
+                        st.caption(f"Fitted on {moments.n:,} rows in a single streaming pass.")
+
+        if moments is not None and moments.n >= 3 and moments.sxx > 0:
+            fit = _linreg.fit(moments)
+            n = fit.n
+            slope, intercept, r_sq = fit.b1, fit.b0, fit.r_sq
+            f_stat, p_f = fit.f, fit.p_f
+
+            with col2:
+                st.metric("b₁ (slope)", f"{slope:.4f}")
+                st.metric("b₀ (intercept)", f"{intercept:.4f}")
+                st.metric("R²", f"{r_sq:.4f}")
+                st.metric("F-statistic", f"{f_stat:.4f}")
+                st.metric("p-value (F-test)", f"{p_f:.6f}")
+
+            reg_table = pd.DataFrame({
+                'Source': ['Regression', 'Error', 'Total'],
+                'SS': [f"{fit.ssr:.4f}", f"{fit.sse:.4f}", f"{fit.sst:.4f}"],
+                'df': [1, n-2, n-1],
+                'MS': [f"{fit.msr:.4f}", f"{fit.mse:.4f}", "—"],
+                'F': [f"{f_stat:.4f}", "—", "—"],
+                'p-value': [f"{p_f:.6f}", "—", "—"]
+            })
+            st.table(reg_table)
+            st.markdown(f"**t-test for b₁:** s_b₁ = {fit.se_b1:.4f}, t = {fit.t_b1:.4f}, "
+                        f"p = {fit.p_t:.6f} (df = {n-2:,}; t² = {fit.t_b1**2:.4f} = F)")
+
+            fig = go.Figure()
+            if x is not None:
                 fig.add_trace(go.Scatter(x=x, y=y, mode='markers', name='Data',
                                           marker=dict(color='#4f46e5', size=10)))
-                x_line = np.linspace(x.min(), x.max(), 100)
-                fig.add_trace(go.Scatter(x=x_line, y=intercept + slope*x_line, mode='lines',
-                                          name=f'ŷ = {intercept:.2f} + {slope:.2f}x',
-                                          line=dict(color='#dc2626', width=3)))
-                fig.update_layout(title=f"Regression: R² = {r_sq:.4f}, p = {p_f:.6f}",
-                                  paper_bgcolor='#ffffff', plot_bgcolor='#f8fafc',
-                                  font_color='#111111', height=350,
-                                  xaxis=dict(gridcolor='#e2e8f0', title='X'),
-                                  yaxis=dict(gridcolor='#e2e8f0', title='Y'))
-                st.plotly_chart(fig, use_container_width=True)
-
-                alpha_r = 0.05
-                if p_f < alpha_r:
-                    st.success(f"**F-test: Reject H₀ at α=0.05.** The linear relationship is statistically significant (R²={r_sq:.3f}).")
+            x_line = np.linspace(fit.x_min, fit.x_max, 100)
+            fig.add_trace(go.Scatter(x=x_line, y=intercept + slope*x_line, mode='lines',
+                                      name=f'ŷ = {intercept:.2f} + {slope:.2f}x',
+                                      line=dict(color='#dc2626', width=3)))
+            fig.update_layout(title=f"Regression: R² = {r_sq:.4f}, p = {p_f:.6f}",
+                              paper_bgcolor='#ffffff', plot_bgcolor='#f8fafc',
+                              font_color='#111111', height=350,
+                              xaxis=dict(gridcolor='#e2e8f0', title='X'),
+                              yaxis=dict(gridcolor='#e2e8f0', title='Y'))
+            st.plotly_chart(fig, use_container_width=True)
+
+            alpha_r = 0.05
+            if p_f < alpha_r:
+                st.success(f"**F-test: Reject H₀ at α=0.05.** The linear relationship is statistically significant (R²={r_sq:.3f}).")
+            else:
+                st.warning(f"**F-test: Fail to reject H₀.** No significant linear relationship (R²={r_sq:.3f}).")
+        st.markdown("</div>", unsafe_allow_html=True)
+
+    with tab4:
+        st.markdown("<div class='section-card'><div class='section-label label-concept'>💡 Multiple Regression</div>", unsafe_allow_html=True)
+        st.latex(r"\hat{y} = b_0 + b_1 x_1 + b_2 x_2 + \cdots + b_k x_k")
+        st.latex(r"F = \frac{\text{SSR}/k}{\text{SSE}/(n-k-1)} \sim F_{k,\,n-k-1} \qquad R^2_{adj} = 1 - (1-R^2)\frac{n-1}{n-k-1}")
+        st.caption("Adjusted R² penalises extra predictors, so it can fall when a useless variable is added.")
+        st.markdown("</div>", unsafe_allow_html=True)
+
+        st.markdown("<div class='section-card'><div class='section-label label-solved'>🧮 Fit a Multiple Regression</div>", unsafe_allow_html=True)
+        mr_source = st.radio("Data source:", ["📘 Example: weekly sales", "📂 Upload CSV / Parquet"],
+                             horizontal=True, key="mreg_mode")
+        cp = None
+        if mr_source == "📘 Example: weekly sales":
+            rng = np.random.default_rng(7)
+            n_ex = 200
+            ex = pd.DataFrame({
+                'ad_spend': rng.uniform(10, 60, n_ex),
+                'price': rng.normal(25, 3, n_ex),
+                'promo_days': rng.integers(0, 8, n_ex).astype(float),
+                'competitors': rng.integers(1, 6, n_ex).astype(float),
+                'temperature': rng.normal(24, 5, n_ex),
+            })
+            ex['sales'] = (120 + 2.1*ex['ad_spend'] - 3.5*ex['price'] + 4.0*ex['promo_days']
+                           - 1.5*ex['competitors'] + rng.normal(0, 12, n_ex))
+            num_cols = list(ex.columns)
+        else:
+            mr_file = st.file_uploader("Data file:", type=_uploads.FILE_TYPES, key="mreg_file")
+            num_cols = _uploads.column_names(mr_file, numeric=True) if mr_file is not None else []
+
+        if len(num_cols) >= 2:
+            col1, col2 = st.columns([1, 2])
+            y_mr = col1.selectbox("Response (Y):", num_cols, index=len(num_cols) - 1, key="mreg_y")
+            x_opts = [c for c in num_cols if c != y_mr]
+            x_mr = col2.multiselect("Predictors (X):", x_opts, default=x_opts[:min(len(x_opts), 5)], key="mreg_x")
+            if x_mr:
+                if mr_source == "📘 Example: weekly sales":
+                    cp = _linreg.CrossProducts(len(x_mr) + 1).update(ex[x_mr + [y_mr]].to_numpy())
                 else:
-                    st.warning(f"**F-test: Fail to reject H₀.** No significant linear relationship (R²={r_sq:.3f}).")
-        except:
-            st.warning("Check inputs — equal number of comma-separated X and Y values.")
+                    cp = _linreg.upload_cross_products(mr_file.file_id, mr_file.name, tuple(x_mr), y_mr, mr_file)
+
+        mr = None
+        if cp is not None and cp.n > len(x_mr) + 1:
+            # cross[-1, -1] is the total sum of squares of y
+            if cp.cross[-1, -1] <= 0:
+                st.error(f"{y_mr} is constant — there is no variation for the predictors to explain.")
+            else:
+                try:
+                    mr = _linreg.fit_multiple(cp, x_mr)
+                except np.linalg.LinAlgError:
+                    st.error("The predictors are perfectly collinear — drop one of them and try again.")
+
+        if mr is not None:
+            c1, c2, c3, c4 = st.columns(4)
+            c1.metric("R²", f"{mr.r_sq:.4f}")
+            c2.metric("Adjusted R²", f"{mr.adj_r_sq:.4f}")
+            c3.metric(f"F({mr.df_model}, {mr.df_error:,})", f"{mr.f:.3f}")
+            c4.metric("p-value (F-test)", f"{mr.p_f:.6f}")
+
+            st.markdown("##### Coefficients (t-tests, H₀: βⱼ = 0)")
+            st.dataframe(pd.DataFrame({
+                'Term': ['Intercept'] + mr.predictors,
+                'Estimate': np.append(mr.intercept, mr.coef),
+                'Std. Error': np.append(mr.se_intercept, mr.se),
+                't': mr.t,
+                'p-value': mr.p,
+            }).round(6), use_container_width=True, hide_index=True)
+
+            st.markdown("##### Regression ANOVA")
+            st.table(pd.DataFrame({
+                'Source': ['Regression', 'Error', 'Total'],
+                'SS': [f"{mr.ssr:.4f}", f"{mr.sse:.4f}", f"{mr.sst:.4f}"],
+                'df': [mr.df_model, mr.df_error, mr.n - 1],
+                'MS': [f"{mr.ssr/mr.df_model:.4f}", f"{mr.mse:.4f}", "—"],
+                'F': [f"{mr.f:.4f}", "—", "—"],
+            }))
+
+            st.markdown("##### 🔎 Model Search")
+            search_opts = ["Forward selection"] + (["All subsets"] if len(x_mr) <= 15 else [])
+            search = st.radio("Candidate models:", search_opts, horizontal=True, key="mreg_search")
+            if search == "All subsets":
+                models = _linreg.all_subsets(cp, x_mr).sort_values("adj. R²", ascending=False)
+                st.caption(f"{len(models):,} models fitted from one cross-product matrix, one batched solve per model size.")
+                st.dataframe(models.head(25).round(6), use_container_width=True, hide_index=True)
+            else:
+                steps = _linreg.forward_selection(cp, x_mr)
+                st.caption("Each step adds the predictor that raises adjusted R² the most; it stops when nothing helps.")
+                st.dataframe(steps.round(6), use_container_width=True, hide_index=True)
         st.markdown("</div>", unsafe_allow_html=True)
 
     st.markdown("<div class='section-card'><div class='section-label label-solved'>✅ Solved Problems</div>", unsafe_allow_html=True)
@@ -162,7 +265,7 @@ Find regression line, R², and test significance at α = 0.05.
     sl, ic, rv, pv, seslope = stats.linregress(xp, yp)
     yh = ic + sl*xp; sstp = np.sum((yp-yp.mean())**2); ssrp = np.sum((yh-yp.mean())**2)
     ssep = np.sum((yp-yh)**2); r2p = ssrp/sstp; fp = (ssrp/1)/(ssep/3)
-    pfp = 1-stats.f.cdf(fp, 1, 3)
+    pfp = 1-_engine.cdf("f", fp, 1, 3)
     st.latex(rf"b_1 = {sl:.2f},\quad b_0 = {ic:.2f}")
     st.latex(rf"\hat{{y}} = {ic:.2f} + {sl:.2f}x")
     st.latex(rf"R^2 = {r2p:.4f},\quad F = {fp:.4f},\quad p = {pfp:.6f}")
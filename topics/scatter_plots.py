@@ -2,6 +2,7 @@ import streamlit as st
 import numpy as np
 import plotly.graph_objects as go
 from scipy import stats
+from topics import _render, _uploads
 
 def render():
     st.markdown("""
@@ -57,31 +58,61 @@ A **scatter plot** displays pairs of observations (x, y) on a 2D plane, revealin
 
     st.markdown("---")
     st.markdown("#### 🎛️ Interactive Scatter Plot")
-    pattern = st.selectbox("Choose relationship pattern:", ["Strong Positive", "Weak Positive", "No Correlation", "Strong Negative"])
-    np.random.seed(42)
-    n = 60
-    x = np.random.uniform(10, 100, n)
-    noise_scale = {'Strong Positive': 5, 'Weak Positive': 25, 'No Correlation': 50, 'Strong Negative': 5}[pattern]
-    slope = {'Strong Positive': 0.8, 'Weak Positive': 0.5, 'No Correlation': 0, 'Strong Negative': -0.8}[pattern]
-    y = 20 + slope * x + np.random.normal(0, noise_scale, n)
-    r, p = stats.pearsonr(x, y)
-    m, b, *_ = stats.linregress(x, y)
-    x_line = np.array([x.min(), x.max()])
-    y_line = m * x_line + b
-    fig = go.Figure()
-    fig.add_trace(go.Scatter(x=x, y=y, mode='markers',
-        marker=dict(color='#667eea', size=8, opacity=0.7, line=dict(color='#a78bfa', width=1)),
-        name='Data'))
-    fig.add_trace(go.Scatter(x=x_line, y=y_line, mode='lines',
-        line=dict(color='#fbbf24', width=2, dash='dash'), name=f'Trend line (r={r:.3f})'))
-    fig.update_layout(
-        title=f"{pattern} Correlation | r = {r:.3f} | r² = {r**2:.3f}",
-        paper_bgcolor='#ffffff', plot_bgcolor='#f8fafc',
-        font_color='#111111', height=350,
-        xaxis=dict(title='X', gridcolor='#e2e8f0'),
-        yaxis=dict(title='Y', gridcolor='#e2e8f0'),
-    )
-    st.plotly_chart(fig, use_container_width=True)
+    source = st.radio("Data:", ["Simulated", "Upload file (CSV / Parquet)"], horizontal=True, key="scatter_source")
+    x = y = None
+    if source == "Simulated":
+        c1, c2 = st.columns(2)
+        pattern = c1.selectbox("Choose relationship pattern:", ["Strong Positive", "Weak Positive", "No Correlation", "Strong Negative"])
+        n = c2.select_slider("Number of points:", [60, 1_000, 100_000, 1_000_000], value=60, key="scatter_n")
+        np.random.seed(42)
+        x = np.random.uniform(10, 100, n)
+        noise_scale = {'Strong Positive': 5, 'Weak Positive': 25, 'No Correlation': 50, 'Strong Negative': 5}[pattern]
+        slope = {'Strong Positive': 0.8, 'Weak Positive': 0.5, 'No Correlation': 0, 'Strong Negative': -0.8}[pattern]
+        y = 20 + slope * x + np.random.normal(0, noise_scale, n)
+        x_title, y_title = 'X', 'Y'
+    else:
+        uploaded = st.file_uploader("Data file:", type=_uploads.FILE_TYPES, key="scatter_file")
+        if uploaded is not None:
+            num_cols = _uploads.column_names(uploaded, numeric=True)
+            c1, c2 = st.columns(2)
+            x_title = c1.selectbox("X column:", num_cols, key="scatter_x")
+            y_title = c2.selectbox("Y column:", num_cols, index=min(1, len(num_cols) - 1), key="scatter_y")
+            if x_title and y_title:
+                table = _uploads.read_table(uploaded, columns=list(dict.fromkeys([x_title, y_title]))).dropna()
+                x, y = table[x_title].to_numpy(dtype=float), table[y_title].to_numpy(dtype=float)
+                pattern = "Uploaded"
+    if x is not None and x.size >= 3:
+        r, p = stats.pearsonr(x, y)
+        m, b, *_ = stats.linregress(x, y)
+        x_line = np.array([x.min(), x.max()])
+        y_line = m * x_line + b
+        as_density = False
+        if x.size > _render.MAX_POINTS:
+            as_density = st.radio(
+                f"{x.size:,} points is too many to draw one by one — show:",
+                ["Random sample of points", "Density grid"], horizontal=True, key="scatter_dense",
+            ) == "Density grid"
+        points, drawn = _render.scatter(
+            x, y, density=as_density, name='Data',
+            marker=dict(color='#667eea', size=8 if x.size <= _render.GL_MIN_POINTS else 4, opacity=0.7,
+                        line=dict(color='#a78bfa', width=1 if x.size <= _render.GL_MIN_POINTS else 0)),
+        )
+        fig = go.Figure()
+        fig.add_trace(points)
+        fig.add_trace(go.Scatter(x=x_line, y=y_line, mode='lines',
+            line=dict(color='#fbbf24', width=2, dash='dash'), name=f'Trend line (r={r:.3f})'))
+        fig.update_layout(
+            title=f"{pattern} Correlation | r = {r:.3f} | r² = {r**2:.3f}",
+            paper_bgcolor='#ffffff', plot_bgcolor='#f8fafc',
+            font_color='#111111', height=350,
+            xaxis=dict(title=x_title, gridcolor='#e2e8f0'),
+            yaxis=dict(title=y_title, gridcolor='#e2e8f0'),
+        )
+        st.plotly_chart(fig, use_container_width=True)
+        if drawn < x.size and not as_density:
+            st.caption(f"Showing a random {drawn:,} of {x.size:,} points; r and the trend line use all of them.")
+    elif x is not None:
+        st.warning("Need at least 3 complete (x, y) rows.")
     st.markdown("</div>", unsafe_allow_html=True)
 
     # ── SOLVED PROBLEMS ───────────────────────────────────────────────────────
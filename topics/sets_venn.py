@@ -1,6 +1,9 @@
 import streamlit as st
 import numpy as np
 import plotly.graph_objects as go
+from plotly.subplots import make_subplots
+
+from topics import _figures, _uploads, _venn
 
 def render():
     st.markdown("""
@@ -81,6 +84,110 @@ A **Venn diagram** is a visual tool for representing relationships between sets/
 
     st.markdown("</div>", unsafe_allow_html=True)
 
+    # ── REGION COUNTER ───────────────────────────────────────────────────────
+    st.markdown("<div class='section-card'><div class='section-label label-concept'>🧮 Count Every Region of Real Data</div>", unsafe_allow_html=True)
+    st.markdown("""
+With k sets there are **2ᵏ regions** (including "in none of them"), and inclusion–exclusion for the union has **2ᵏ − 1 terms**:
+    """)
+    st.latex(r"\Big|\bigcup_{j=1}^{k} A_j\Big| = \sum_{\emptyset \neq S \subseteq \{1..k\}} (-1)^{|S|+1} \Big|\bigcap_{j \in S} A_j\Big|")
+    st.markdown("""
+Each element is encoded as a k-bit mask (bit j = "belongs to A_j"), so counting all regions is a single tally of masks, and all intersection sizes follow from those counts. The formula is then checked against the directly counted union.
+    """)
+    source = st.radio("Data:", ["Simulated", "Upload file (CSV / Parquet)"], horizontal=True, key="venn_source")
+    result, run_key = None, None
+    if source == "Simulated":
+        c1, c2 = st.columns(2)
+        v_n = c1.select_slider("Elements:", [1_000, 100_000, 1_000_000, 5_000_000], value=100_000,
+                               format_func=lambda v: f"{v:,}", key="venn_n")
+        v_k = c2.slider("Number of sets k:", 1, _venn.K_MAX, 3, key="venn_k")
+        result, run_key = _venn.simulated_summary(v_n, v_k), ["sim", v_n, v_k]
+    else:
+        uploaded = st.file_uploader("Data file:", type=_uploads.FILE_TYPES, key="venn_file")
+        if uploaded is not None:
+            layout = st.radio("Layout:", ["membership", "ids"], horizontal=True, key="venn_layout",
+                              format_func={"membership": "One 0/1 column per set",
+                                           "ids": "One column of IDs per set"}.get)
+            cols = st.multiselect(f"Sets (1–{_venn.K_MAX} columns):",
+                                  _uploads.column_names(uploaded, numeric=layout == "membership"),
+                                  max_selections=_venn.K_MAX, key="venn_cols")
+            if cols:
+                result = _venn.upload_summary(uploaded.file_id, uploaded.name, tuple(cols), layout, uploaded)
+                run_key = [uploaded.file_id, cols, layout]
+
+    if result is not None:
+        reg, check = result.regions, result.check
+        k = len(reg.names)
+        m1, m2, m3, m4 = st.columns(4)
+        m1.metric("Elements", f"{reg.n:,}")
+        m2.metric("|Union|", f"{check.union_direct:,}")
+        m3.metric("In no set", f"{int(reg.counts[0]):,}")
+        m4.metric("Non-empty regions", f"{int((reg.counts[1:] > 0).sum()):,} / {(1 << k) - 1:,}")
+        if check.ok:
+            st.success(f"Inclusion–exclusion over {check.terms:,} terms gives |∪| = {check.union_ie:,}, "
+                       "matching the direct count.")
+        else:
+            st.error(f"Inclusion–exclusion gives {check.union_ie:,} but the direct count is {check.union_direct:,}.")
+
+        def build_chart():
+            if k <= 3:
+                centres = {1: [(0, 0)], 2: [(-0.5, 0), (0.5, 0)], 3: [(-0.55, 0.35), (0.55, 0.35), (0, -0.55)]}[k]
+                spots = {1: {1: (0, 0)},
+                         2: {1: (-0.9, 0), 2: (0.9, 0), 3: (0, 0)},
+                         3: {1: (-0.95, 0.6), 2: (0.95, 0.6), 4: (0, -1.0), 3: (0, 0.7),
+                             5: (-0.6, -0.3), 6: (0.6, -0.3), 7: (0, 0.05)}}[k]
+                colors = ['rgba(102,126,234,0.3)', 'rgba(236,72,153,0.3)', 'rgba(16,185,129,0.3)']
+                fig = go.Figure()
+                for (cx, cy), color, set_name in zip(centres, colors, reg.names):
+                    fig.add_shape(type="circle", x0=cx - 1, y0=cy - 1, x1=cx + 1, y1=cy + 1,
+                                  fillcolor=color, line=dict(color=color.replace('0.3', '1')))
+                    fig.add_annotation(x=cx * 1.9, y=cy * 1.9 + (1.15 if cy >= 0 else -0.6), text=f"<b>{set_name}</b>",
+                                       showarrow=False, font=dict(size=14))
+                for mask, (x, y) in spots.items():
+                    fig.add_annotation(x=x, y=y, text=f"{int(reg.counts[mask]):,}", showarrow=False, font=dict(size=13))
+                fig.add_annotation(x=1.9, y=-1.7, text=f"none: {int(reg.counts[0]):,}", showarrow=False)
+                fig.update_layout(title="Venn diagram (exclusive region counts)", height=440, showlegend=False,
+                                  xaxis=dict(visible=False, range=[-2.2, 2.2]),
+                                  yaxis=dict(visible=False, range=[-1.9, 2.0], scaleanchor="x"),
+                                  paper_bgcolor='#ffffff', plot_bgcolor='#ffffff', font_color='#111111')
+            else:
+                top = result.table.head(_venn.UPSET_MAX)
+                xs = np.arange(len(top))
+                member = ((top["mask"].to_numpy()[:, None] >> np.arange(k)) & 1).astype(bool)
+                fig = make_subplots(rows=2, cols=2, shared_xaxes="columns", shared_yaxes="rows",
+                                    column_widths=[0.18, 0.82], row_heights=[0.6, 0.4],
+                                    horizontal_spacing=0.01, vertical_spacing=0.02)
+                fig.add_trace(go.Bar(x=xs, y=top["Exclusive count"], marker_color='#4f46e5',
+                                     hovertext=top["Region"], name="Region"), row=1, col=2)
+                gx, gy = np.meshgrid(xs, np.arange(k))
+                fig.add_trace(go.Scatter(x=gx.ravel(), y=gy.ravel(), mode='markers',
+                                         marker=dict(color='#e2e8f0', size=9), hoverinfo='skip'), row=2, col=2)
+                seg_x, seg_y = [], []
+                for i, row in enumerate(member):
+                    js = np.flatnonzero(row)
+                    seg_x += [i, i, None]
+                    seg_y += [js.min(), js.max(), None]
+                fig.add_trace(go.Scatter(x=seg_x, y=seg_y, mode='lines', line=dict(color='#111111', width=2),
+                                         hoverinfo='skip'), row=2, col=2)
+                hit_i, hit_j = np.nonzero(member)
+                fig.add_trace(go.Scatter(x=hit_i, y=hit_j, mode='markers', marker=dict(color='#111111', size=9),
+                                         hoverinfo='skip'), row=2, col=2)
+                fig.add_trace(go.Bar(x=reg.sizes, y=np.arange(k), orientation='h', marker_color='#94a3b8',
+                                     hovertext=list(reg.names), name="Set size"), row=2, col=1)
+                fig.update_xaxes(autorange="reversed", title_text="Set size", row=2, col=1)
+                fig.update_xaxes(visible=False, row=1, col=2)
+                fig.update_xaxes(visible=False, row=2, col=2)
+                fig.update_yaxes(tickvals=np.arange(k), ticktext=list(reg.names), row=2, col=1)
+                fig.update_yaxes(title_text="Exclusive count", row=1, col=2)
+                fig.update_layout(title=f"UpSet chart: the {len(top)} largest of {int((reg.counts[1:] > 0).sum()):,} non-empty regions",
+                                  showlegend=False, height=520, bargap=0.2,
+                                  paper_bgcolor='#ffffff', plot_bgcolor='#f8fafc', font_color='#111111')
+            return fig
+
+        _figures.plotly_chart("sets_venn", "regions", run_key, build_chart, use_container_width=True)
+        with st.expander("📋 Region table"):
+            st.dataframe(result.table.drop(columns="mask"), use_container_width=True, hide_index=True)
+    st.markdown("</div>", unsafe_allow_html=True)
+
     # ── SOLVED PROBLEMS ───────────────────────────────────────────────────────
     st.markdown("<div class='section-card'><div class='section-label label-solved'>✅ Solved Problems</div>", unsafe_allow_html=True)
 
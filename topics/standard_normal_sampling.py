@@ -1,7 +1,7 @@
 import streamlit as st
 import numpy as np
 import plotly.graph_objects as go
-from scipy import stats
+from topics import _engine, _figures
 
 def render():
     st.markdown("""
@@ -38,7 +38,7 @@ def render():
             """)
             st.markdown("#### Z-table lookup")
             z_in = st.number_input("Enter z:", value=1.96, step=0.01, key="z_lookup")
-            p_left = stats.norm.cdf(z_in)
+            p_left = _engine.cdf("norm", z_in)
             st.metric(f"Φ({z_in}) = P(Z ≤ {z_in})", f"{p_left:.6f}")
             st.metric(f"P(Z > {z_in})", f"{1-p_left:.6f}")
         st.markdown("</div>", unsafe_allow_html=True)
@@ -77,16 +77,21 @@ The **sampling distribution** describes how a sample statistic varies from sampl
         st.markdown("---")
         st.markdown("#### 🎛️ Standard Error Visual")
         sigma_pop = st.number_input("Population σ:", value=10.0, min_value=0.1, step=1.0)
-        n_vals = [5, 10, 25, 50, 100, 500]
-        se_vals = [sigma_pop / np.sqrt(n) for n in n_vals]
-        fig = go.Figure(go.Bar(x=[str(n) for n in n_vals], y=se_vals,
-                               marker_color='#4f46e5', text=[f"{s:.3f}" for s in se_vals], textposition='outside'))
-        fig.update_layout(title=f"Standard Error (σ={sigma_pop}) as sample size grows",
-                          xaxis_title="Sample size n", yaxis_title="Standard Error σ/√n",
-                          paper_bgcolor='#ffffff', plot_bgcolor='#f8fafc',
-                          font_color='#111111', height=300,
-                          xaxis=dict(gridcolor='#e2e8f0'), yaxis=dict(gridcolor='#e2e8f0'))
-        st.plotly_chart(fig, use_container_width=True)
+
+        def build_se_bars():
+            n_vals = [5, 10, 25, 50, 100, 500]
+            se_vals = [sigma_pop / np.sqrt(n) for n in n_vals]
+            fig = go.Figure(go.Bar(x=[str(n) for n in n_vals], y=se_vals,
+                                   marker_color='#4f46e5', text=[f"{s:.3f}" for s in se_vals], textposition='outside'))
+            fig.update_layout(title=f"Standard Error (σ={sigma_pop}) as sample size grows",
+                              xaxis_title="Sample size n", yaxis_title="Standard Error σ/√n",
+                              paper_bgcolor='#ffffff', plot_bgcolor='#f8fafc',
+                              font_color='#111111', height=300,
+                              xaxis=dict(gridcolor='#e2e8f0'), yaxis=dict(gridcolor='#e2e8f0'))
+            return fig
+
+        _figures.plotly_chart("standard_normal_sampling", "se_bars", {"sigma": sigma_pop},
+                              build_se_bars, use_container_width=True)
         st.markdown("</div>", unsafe_allow_html=True)
 
     st.markdown("<div class='section-card'><div class='section-label label-solved'>✅ Solved Problems</div>", unsafe_allow_html=True)
@@ -1,7 +1,7 @@
 import streamlit as st
 import numpy as np
 import plotly.graph_objects as go
-from scipy import stats
+from topics import _engine
 
 def render():
     st.markdown("""
@@ -55,9 +55,9 @@ When the population standard deviation σ is **unknown** (which is almost always
     df_val = st.slider("Degrees of freedom (df):", 1, 50, 5)
     x_range = np.linspace(-4, 4, 300)
     fig = go.Figure()
-    fig.add_trace(go.Scatter(x=x_range, y=stats.norm.pdf(x_range), mode='lines',
+    fig.add_trace(go.Scatter(x=x_range, y=_engine.pdf("norm", x_range), mode='lines',
                               line=dict(color='#059669', width=2, dash='dash'), name='Z ~ N(0,1)'))
-    fig.add_trace(go.Scatter(x=x_range, y=stats.t.pdf(x_range, df_val), mode='lines',
+    fig.add_trace(go.Scatter(x=x_range, y=_engine.pdf("t", x_range, df_val), mode='lines',
                               line=dict(color='#4f46e5', width=3), name=f't(df={df_val})'))
     fig.update_layout(title=f"t(df={df_val}) vs Standard Normal",
                       paper_bgcolor='#ffffff', plot_bgcolor='#f8fafc', font_color='#111111', height=300,
@@ -77,8 +77,8 @@ When the population standard deviation σ is **unknown** (which is almost always
 **Solution:** H₀: μ = 75, Hₐ: μ ≠ 75 (two-tailed), df = 15
     """)
     t_stat = (72 - 75) / (8 / np.sqrt(16))
-    p_v = 2 * stats.t.sf(abs(t_stat), 15)
-    t_crit = stats.t.ppf(0.975, 15)
+    p_v = 2 * _engine.sf("t", abs(t_stat), 15)
+    t_crit = _engine.ppf("t", 0.975, 15)
     st.latex(rf"t = \frac{{72-75}}{{8/\sqrt{{16}}}} = \frac{{-3}}{{2}} = {t_stat:.3f}")
     st.latex(rf"t_{{0.025,15}} = \pm{t_crit:.3f},\quad p\text{{-value}} = {p_v:.4f}")
     st.markdown(f"Since |t| = 1.5 < {t_crit:.3f} (and p = {p_v:.4f} > 0.05): **Fail to reject H₀.** No significant difference from 75.")
@@ -88,7 +88,7 @@ When the population standard deviation σ is **unknown** (which is almost always
     st.markdown("""
 **Q:** A sample of 25 bags has x̄ = 49.8 kg, s = 1.5 kg. Build a 95% CI for the true mean weight.
     """)
-    t_star = stats.t.ppf(0.975, 24)
+    t_star = _engine.ppf("t", 0.975, 24)
     se_v = 1.5 / np.sqrt(25)
     moe = t_star * se_v
     st.latex(rf"t_{{0.025,24}} = {t_star:.3f},\quad SE = {se_v:.3f},\quad MOE = {moe:.4f}")
@@ -1,7 +1,7 @@
 import streamlit as st
 import numpy as np
 import pandas as pd
-from scipy import stats
+from topics import _tables
 
 def render():
     st.markdown("""
@@ -34,15 +34,11 @@ The Z-table gives **Φ(z) = P(Z ≤ z)** — the area to the **left** of z under
 
         st.markdown("<div class='section-card'><div class='section-label label-concept'>📊 Standard Normal (Z) Table — Φ(z) = P(Z ≤ z)</div>", unsafe_allow_html=True)
 
-        # Generate Z-table
+        # Z-table read from the precomputed Φ(z) grid
         z_rows = np.arange(0.0, 3.5, 0.1)
-        z_cols = np.arange(0.00, 0.10, 0.01)
-        z_data = {}
-        for c in z_cols:
-            z_data[f".0{int(c*100)}" if c < 0.1 else f".{int(c*100)}"] = [
-                f"{stats.norm.cdf(r + c):.4f}" for r in z_rows
-            ]
-        z_df = pd.DataFrame(z_data, index=[f"{r:.1f}" for r in z_rows])
+        z_df = pd.DataFrame(np.char.mod("%.4f", _tables.z_table(max_row=3.4)),
+                            columns=[f".0{c}" for c in range(10)],
+                            index=[f"{r:.1f}" for r in z_rows])
         z_df.index.name = "z"
         st.dataframe(z_df, use_container_width=True, height=500)
 
@@ -86,12 +82,9 @@ The t-table gives **critical values** for the Student's t-distribution.
         alphas_one = [0.10, 0.05, 0.025, 0.01, 0.005, 0.001]
         dfs = list(range(1, 31)) + [35, 40, 50, 60, 80, 100, 200, 500]
 
-        t_data = {}
-        for a in alphas_one:
-            col_label = f"α={a}"
-            t_data[col_label] = [f"{stats.t.ppf(1-a, d):.3f}" for d in dfs]
-
-        t_df = pd.DataFrame(t_data, index=[str(d) for d in dfs])
+        t_df = pd.DataFrame(np.char.mod("%.3f", _tables.t_table(dfs, alphas_one)),
+                            columns=[f"α={a}" for a in alphas_one],
+                            index=[str(d) for d in dfs])
         t_df.index.name = "df"
 
         st.markdown("**Upper-tail critical values: t_{α, df}** (one-tailed α shown)")
@@ -100,47 +93,23 @@ The t-table gives **critical values** for the Student's t-distribution.
 
         st.markdown("---")
         st.markdown("##### Corresponding Z-values (df = ∞)")
-        z_row = {f"α={a}": f"{stats.norm.ppf(1-a):.3f}" for a in alphas_one}
+        z_row = {f"α={a}": f"{_tables.t_crit(a):.3f}" for a in alphas_one}
         st.table(pd.DataFrame(z_row, index=["z (df=∞)"]))
         st.caption("Notice how t-values decrease toward these z-values as df increases.")
         st.markdown("</div>", unsafe_allow_html=True)
 
         st.markdown("<div class='section-card'><div class='section-label label-concept'>⭐ Most-Used t Critical Values</div>", unsafe_allow_html=True)
+        key_scenarios = [  # (confidence, n, z*)
+            ('95%', 10, 1.960), ('95%', 15, 1.960), ('95%', 20, 1.960), ('95%', 25, 1.960),
+            ('95%', 30, 1.960), ('99%', 10, 2.576), ('99%', 25, 2.576), ('99%', 30, 2.576),
+        ]
+        key_tstar = [_tables.t_crit(0.025 if conf == '95%' else 0.005, n - 1)
+                     for conf, n, _ in key_scenarios]
         key_t = pd.DataFrame({
-            'Scenario': [
-                '95% CI, n=10 (df=9)',
-                '95% CI, n=15 (df=14)',
-                '95% CI, n=20 (df=19)',
-                '95% CI, n=25 (df=24)',
-                '95% CI, n=30 (df=29)',
-                '99% CI, n=10 (df=9)',
-                '99% CI, n=25 (df=24)',
-                '99% CI, n=30 (df=29)',
-            ],
-            't* (two-tailed)': [
-                f"{stats.t.ppf(0.975, 9):.3f}",
-                f"{stats.t.ppf(0.975, 14):.3f}",
-                f"{stats.t.ppf(0.975, 19):.3f}",
-                f"{stats.t.ppf(0.975, 24):.3f}",
-                f"{stats.t.ppf(0.975, 29):.3f}",
-                f"{stats.t.ppf(0.995, 9):.3f}",
-                f"{stats.t.ppf(0.995, 24):.3f}",
-                f"{stats.t.ppf(0.995, 29):.3f}",
-            ],
-            'Corresponding z*': [
-                '1.960', '1.960', '1.960', '1.960', '1.960',
-                '2.576', '2.576', '2.576',
-            ],
-            'How much wider?': [
-                f"{(stats.t.ppf(0.975, 9)/1.960 - 1)*100:.1f}%",
-                f"{(stats.t.ppf(0.975, 14)/1.960 - 1)*100:.1f}%",
-                f"{(stats.t.ppf(0.975, 19)/1.960 - 1)*100:.1f}%",
-                f"{(stats.t.ppf(0.975, 24)/1.960 - 1)*100:.1f}%",
-                f"{(stats.t.ppf(0.975, 29)/1.960 - 1)*100:.1f}%",
-                f"{(stats.t.ppf(0.995, 9)/2.576 - 1)*100:.1f}%",
-                f"{(stats.t.ppf(0.995, 24)/2.576 - 1)*100:.1f}%",
-                f"{(stats.t.ppf(0.995, 29)/2.576 - 1)*100:.1f}%",
-            ]
+            'Scenario': [f"{conf} CI, n={n} (df={n-1})" for conf, n, _ in key_scenarios],
+            't* (two-tailed)': [f"{t:.3f}" for t in key_tstar],
+            'Corresponding z*': [f"{z:.3f}" for _, _, z in key_scenarios],
+            'How much wider?': [f"{(t/z - 1)*100:.1f}%" for t, (_, _, z) in zip(key_tstar, key_scenarios)],
         })
         st.table(key_t)
         st.caption("The 'How much wider?' column shows how much larger the t* is compared to z* — this is the penalty for estimating σ.")
@@ -161,15 +130,15 @@ The t-table gives **critical values** for the Student's t-distribution.
 
         if "Φ(z)" in look_type:
             z_in = st.number_input("Enter z-score:", value=1.96, step=0.01, key="lk_z")
-            phi = stats.norm.cdf(z_in)
+            phi = _tables.z_cdf(z_in)
             col1, col2, col3 = st.columns(3)
             col1.metric(f"Φ({z_in}) = P(Z ≤ {z_in})", f"{phi:.6f}")
             col2.metric(f"P(Z > {z_in})", f"{1-phi:.6f}")
-            col3.metric(f"P(-{abs(z_in)} < Z < {abs(z_in)})", f"{2*stats.norm.cdf(abs(z_in))-1:.6f}")
+            col3.metric(f"P(-{abs(z_in)} < Z < {abs(z_in)})", f"{2*_tables.z_cdf(abs(z_in))-1:.6f}")
 
         elif "score given area" in look_type:
             area = st.number_input("Enter cumulative probability P(Z ≤ z):", value=0.975, min_value=0.0001, max_value=0.9999, step=0.001, key="lk_area")
-            z_out = stats.norm.ppf(area)
+            z_out = _tables.z_ppf(area)
             st.metric(f"z-score for P(Z ≤ z) = {area}", f"{z_out:.4f}")
             st.caption(f"This means {area*100:.2f}% of the standard normal distribution falls below z = {z_out:.4f}")
 
@@ -181,12 +150,12 @@ The t-table gives **critical values** for the Student's t-distribution.
                 tail_lk = st.radio("Test type:", ["One-tailed", "Two-tailed"], key="lk_tail")
             with col2:
                 if tail_lk == "One-tailed":
-                    tc = stats.t.ppf(1 - alpha_lk, df_lk)
+                    tc = _tables.t_crit(alpha_lk, df_lk)
                     st.metric(f"t*({alpha_lk}, df={df_lk})", f"{tc:.4f}")
                 else:
-                    tc = stats.t.ppf(1 - alpha_lk/2, df_lk)
+                    tc = _tables.t_crit(alpha_lk/2, df_lk)
                     st.metric(f"t*({alpha_lk}/2, df={df_lk})", f"±{tc:.4f}")
-                z_equiv = stats.norm.ppf(1 - alpha_lk/2) if tail_lk == "Two-tailed" else stats.norm.ppf(1-alpha_lk)
+                z_equiv = _tables.t_crit(alpha_lk/2) if tail_lk == "Two-tailed" else _tables.t_crit(alpha_lk)
                 st.metric("Corresponding z*", f"{z_equiv:.4f}")
 
         elif "P-value given t" in look_type:
@@ -197,11 +166,11 @@ The t-table gives **critical values** for the Student's t-distribution.
                 tail_in = st.radio("Tail:", ["Right (>)", "Left (<)", "Two-tailed (≠)"], key="lk_ttail")
             with col2:
                 if "Right" in tail_in:
-                    pv = 1 - stats.t.cdf(t_in, df_in)
+                    pv = 1 - _tables.t_cdf(t_in, df_in)
                 elif "Left" in tail_in:
-                    pv = stats.t.cdf(t_in, df_in)
+                    pv = _tables.t_cdf(t_in, df_in)
                 else:
-                    pv = 2 * (1 - stats.t.cdf(abs(t_in), df_in))
+                    pv = 2 * (1 - _tables.t_cdf(abs(t_in), df_in))
                 st.metric("P-value", f"{pv:.6f}")
                 for a in [0.01, 0.05, 0.10]:
                     if pv < a:
@@ -228,7 +197,7 @@ The t-table gives **critical values** for the Student's t-distribution.
     st.markdown("""
 **Q:** For a 95% CI with n=12 (df=11), find the t critical value. How much larger is it than z*?
     """)
-    t_ans = stats.t.ppf(0.975, 11)
+    t_ans = _tables.t_crit(0.025, 11)
     pct = (t_ans/1.960 - 1)*100
     st.latex(rf"t_{{0.025, 11}} = {t_ans:.3f} \quad \text{{vs}} \quad z_{{0.025}} = 1.960")
     st.markdown(f"The t* is **{pct:.1f}% larger** than z*, making the CI wider to account for uncertainty in estimating σ.")
@@ -238,6 +207,6 @@ The t-table gives **critical values** for the Student's t-distribution.
     st.markdown("""
 **Q:** What z-score has 90% of the distribution below it?
     """)
-    st.latex(rf"z = \Phi^{{-1}}(0.90) = {stats.norm.ppf(0.90):.4f}")
+    st.latex(rf"z = \Phi^{{-1}}(0.90) = {_tables.z_ppf(0.90):.4f}")
     st.markdown("This is the z-value used as the critical value for a one-tailed test at α=0.10.")
     st.markdown("</div>", unsafe_allow_html=True)
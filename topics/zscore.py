@@ -1,7 +1,7 @@
 import streamlit as st
 import numpy as np
 import plotly.graph_objects as go
-from scipy import stats
+from topics import _engine
 
 def render():
     st.markdown("""
@@ -85,7 +85,7 @@ Z-scores allow **standardized comparisons**, **outlier detection**, and transfor
             st.success(f"📊 English performance is **relatively better** (z={z_eng:.2f} > z={z_math:.2f})")
         else:
             st.info("Both performances are equally good relative to their classes.")
-        st.info(f"Percentile (approx): Math ≈ {stats.norm.cdf(z_math)*100:.1f}th, English ≈ {stats.norm.cdf(z_eng)*100:.1f}th")
+        st.info(f"Percentile (approx): Math ≈ {_engine.cdf('norm', z_math)*100:.1f}th, English ≈ {_engine.cdf('norm', z_eng)*100:.1f}th")
 
     st.markdown("</div>", unsafe_allow_html=True)
 